@@ -1,15 +1,28 @@
+import os
 from typing import Tuple
 
 import dash
 import dash_bootstrap_components as dbc
 from flask import Flask
 from app_layout import create_app_layout
+from catalog import load_catalog
+from layout_cache import install_layout_cache
+from metrics import install_metrics
+from profiling import install_profiler
+from series import install_series_endpoint
+from tracing import install_tracing
+from warmup import install_health_checks, warm_llm_connection, warm_up
 
 
-def create_app() -> Tuple[Flask, dash.Dash]:
+def create_app(debug: bool = False) -> Tuple[Flask, dash.Dash]:
     """
     Create and configure the Flask and Dash application instances.
 
+    Args:
+        debug (bool): Whether the app will run with Dash's debug tooling. The
+            tooling registers Flask hooks when the server starts, so the
+            warm-up must not send requests through the app beforehand.
+
     Returns:
         Tuple[Flask, dash.Dash]: 
             - Flask server instance for WSGI hosting.
@@ -36,15 +49,42 @@ def create_app() -> Tuple[Flask, dash.Dash]:
         suppress_callback_exceptions=True,  # Avoid callback errors before elements exist
     )
 
+    # Set the app layout
+    dash_app.layout = create_app_layout()
+
+    # Publish the exercise catalog as shared read-only arrays (data/catalog)
+    load_catalog()
+
+    # Per-callback latency/payload metrics on /metrics (registered before the
+    # layout cache, so that its hooks also see cached responses)
+    metrics = install_metrics(dash_app)
+
+    # Opt-in cProfile/sampling/tracemalloc hooks (BAYHEALTH_PROFILING=1)
+    install_profiler(dash_app)
+
+    # Spans for callbacks, session store, load model, LLM and SVG render (/_traces)
+    install_tracing(dash_app)
+
+    # Serve the static app shell and page layouts from pre-serialized JSON
+    # (cached navigations are recorded as executions of the routing callback)
+    install_layout_cache(dash_app, metrics)
+
+    # Downsampled progress series for charts (/_series/<exercise_id>)
+    install_series_endpoint(dash_app)
+
+    # Liveness/readiness endpoints, then pre-touch catalog, score engine, SVG and layouts
+    install_health_checks(dash_app)
+    warm_up(dash_app, serve_requests=not debug)
+
     return flask_server, dash_app
 
 
-# Create the app instances
-server, app = create_app()
+# Debug tooling only for the development server; set BAYHEALTH_DEBUG=0 to disable it
+DEBUG = __name__ == "__main__" and os.environ.get("BAYHEALTH_DEBUG", "1") == "1"
 
-# Set the app layout
-app.layout = create_app_layout()
+# Create the app instances (``server`` is the WSGI entry point, see wsgi.py)
+server, app = create_app(debug=DEBUG)
 
 if __name__ == "__main__":
-    app.run(debug=True)
-    server = app.server
+    warm_llm_connection()
+    app.run(debug=DEBUG)
@@ -1,6 +1,11 @@
+from typing import Any, Dict, Optional
+
 import dash_bootstrap_components as dbc
 import dash
-from dash import dcc, html, page_container
+from dash import dcc, html, page_container, Input, Output, State
+
+from session_store import session_store
+from store_codec import encode_exercises, encode_ratings
 
 # Navigation structure: mapping between page identifiers and their metadata
 nav_info = {
@@ -91,10 +96,12 @@ def create_app_layout() -> html.Div:
             dcc.Location(id="current-url", refresh="callback-nav"),
 
             # Persistent storage components for cross-page data sharing
-            dcc.Store(id="added-exercises", data=[]),
-            dcc.Store(id="health_state", data=[]),
-            dcc.Store(id="health-form-store"),
-            dcc.Store(id="star-results", data={}),
+            # (compact, schema-versioned encoding, see store_codec.py)
+            dcc.Store(id="added-exercises", data=encode_exercises([])),
+            dcc.Store(id="star-results", data=encode_ratings({})),
+            # Reference to the server-side session state (health state, readiness,
+            # training log), kept across browser sessions: {"sid": ..., "version": ...}
+            dcc.Store(id="session", storage_type="local"),
 
             # Sidebar container
             dbc.Container(
@@ -118,3 +125,24 @@ def create_app_layout() -> html.Div:
         ],
     )
     return app_layout
+
+
+@dash.callback(
+    Output("session", "data"),
+    Input("current-url", "pathname"),
+    State("session", "data"),
+)
+def ensure_session(pathname: str, session: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Create a server-side session if the client does not reference a known one.
+
+    Args:
+        pathname (str): Current URL path (triggers the check on page load).
+        session (Optional[dict]): Session reference stored in the browser.
+
+    Returns:
+        dict: New session reference (no update if the current one is valid).
+    """
+    if session_store.exists(session):
+        raise dash.exceptions.PreventUpdate
+    return session_store.create()
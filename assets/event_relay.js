@@ -0,0 +1,31 @@
+/*
+ * Clientside event relay for pattern-matching buttons.
+ *
+ * Callbacks with ALL-pattern inputs receive the state of every matching
+ * component. Running them in the browser and forwarding only the id of the
+ * clicked component to an event store keeps the server request down to a
+ * single id, independent of the number of buttons on the page.
+ */
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    events: {
+        relay: function () {
+            const ctx = window.dash_clientside.callback_context;
+            if (!ctx.triggered.length || !ctx.triggered[0].value || !ctx.triggered_id) {
+                return window.dash_clientside.no_update;
+            }
+            // Timestamp makes repeated clicks on the same component distinct events
+            return {id: ctx.triggered_id, ts: Date.now()};
+        },
+        // Like relay, but also forwards one property of the component with
+        // the clicked component's index (e.g. the rows of its input grid):
+        // arguments are the clicks, the property values and the ids (ALL)
+        relayState: function (clicks, values, ids) {
+            const ctx = window.dash_clientside.callback_context;
+            if (!ctx.triggered.length || !ctx.triggered[0].value || !ctx.triggered_id) {
+                return window.dash_clientside.no_update;
+            }
+            const i = ids.findIndex((id) => id.index === ctx.triggered_id.index);
+            return {id: ctx.triggered_id, value: i < 0 ? null : values[i], ts: Date.now()};
+        },
+    },
+});
@@ -0,0 +1,57 @@
+/*
+ * Muscle map timeline on the progress page.
+ *
+ * The server ships the color classes of every day once (see
+ * timeline.heatmap_frames); moving the slider only recolors the paths of
+ * the embedded SVG document. Class 0 restores the template's fill.
+ */
+(function () {
+    function paint(object, frames, day) {
+        const doc = object.contentDocument;
+        const firstPath = frames.paths.length ? frames.paths[0][0] : null;
+        if (!doc || (firstPath && !doc.getElementById(firstPath))) {
+            // The SVG document is not loaded yet: paint the latest frame once it is
+            object._timelinePending = [frames, day];
+            if (!object._timelineListening) {
+                object._timelineListening = true;
+                object.addEventListener("load", function () {
+                    object._timelineListening = false;
+                    paint(object, ...object._timelinePending);
+                }, {once: true});
+            }
+            return;
+        }
+        const row = day * frames.paths.length;
+        frames.paths.forEach(function (pathIds, m) {
+            const cls = frames.classes.charCodeAt(row + m) - 48;
+            pathIds.forEach(function (pathId) {
+                const path = doc.getElementById(pathId);
+                if (!path) {
+                    return;
+                }
+                if (path.dataset.baseFill === undefined) {
+                    path.dataset.baseFill = path.style.fill;
+                }
+                path.style.fill = cls > 0 ? frames.colors[cls - 1] : path.dataset.baseFill;
+            });
+        });
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        timeline: {
+            scrub: function (day, frames) {
+                if (!frames || day === null || day === undefined) {
+                    return "";
+                }
+                day = Math.min(Math.max(day, 0), frames.days - 1);
+                const object = document.getElementById("timeline-svg");
+                if (object) {
+                    paint(object, frames, day);
+                }
+                const shown = new Date(frames.start + "T00:00:00");
+                shown.setDate(shown.getDate() + day);
+                return shown.toLocaleDateString("de-DE", {weekday: "short", day: "2-digit", month: "2-digit", year: "numeric"});
+            },
+        },
+    });
+})();
@@ -0,0 +1,16 @@
+/*
+ * Chart width measurement for the progress charts.
+ *
+ * The server downsamples each series to one point per pixel, so it needs
+ * the rendered width of the chart. Dash renders pattern-matching ids as
+ * JSON with sorted keys, which is used to find the chart element.
+ */
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    charts: {
+        width: function (metricId) {
+            const chartId = JSON.stringify({index: metricId.index, type: "progress-chart"});
+            const element = document.getElementById(chartId);
+            return element && element.clientWidth ? Math.round(element.clientWidth) : null;
+        },
+    },
+});
@@ -0,0 +1,63 @@
+/*
+ * Clientside star rating widget (see utils.create_star_rating).
+ *
+ * The fill state of the stars is rendered in the browser, and the ratings
+ * of all questions are written to the "star-results" store in one debounced
+ * update, using the compact encoding of store_codec.py: {v: 1, r: [...]}
+ * in question order (0 = not rated).
+ */
+const STAR_RESULTS_SCHEMA_VERSION = 1;
+const STAR_RESULTS_DEBOUNCE_MS = 250;
+
+let pendingRatings = {};
+let pendingTimer = null;
+let resolvePending = null;
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    stars: {
+        // Fill the stars of one question up to the clicked (or stored) rating
+        fill: function (nClicks, ids, starResults, questions) {
+            const ctx = window.dash_clientside.callback_context;
+            let rating = 0;
+            if (ctx.triggered_id && ctx.triggered.length && ctx.triggered[0].value) {
+                rating = ctx.triggered_id.index;
+            } else if (starResults && starResults.r && ids.length) {
+                rating = starResults.r[questions.indexOf(ids[0].question)] || 0;
+            }
+            return ids.map((id) => (id.index <= rating ? "bi bi-star-fill" : "bi bi-star"));
+        },
+
+        // Collect clicks and write all ratings at once after a short pause
+        collect: function (nClicks, starResults, questions) {
+            const ctx = window.dash_clientside.callback_context;
+            const clicked = ctx.triggered_id;
+            if (!clicked || !ctx.triggered.length || !ctx.triggered[0].value) {
+                return window.dash_clientside.no_update;
+            }
+            pendingRatings[clicked.question] = clicked.index;
+
+            // Superseded calls resolve without an update
+            clearTimeout(pendingTimer);
+            if (resolvePending) {
+                resolvePending(window.dash_clientside.no_update);
+            }
+
+            return new Promise((resolve) => {
+                resolvePending = resolve;
+                pendingTimer = setTimeout(() => {
+                    const ratings = starResults && starResults.r
+                        ? starResults.r.slice()
+                        : questions.map(() => 0);
+                    questions.forEach((question, i) => {
+                        if (question in pendingRatings) {
+                            ratings[i] = pendingRatings[question];
+                        }
+                    });
+                    pendingRatings = {};
+                    resolvePending = null;
+                    resolve({v: STAR_RESULTS_SCHEMA_VERSION, r: ratings});
+                }, STAR_RESULTS_DEBOUNCE_MS);
+            });
+        },
+    },
+});
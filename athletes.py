@@ -0,0 +1,158 @@
+import logging
+import os
+import threading
+import time
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, Optional
+
+import pandas as pd
+
+from batch_report import read_sessions, user_report
+from catalog import current_catalog
+from readiness import readiness_factor
+from session_store import SESSION_DB_PATH
+
+logger = logging.getLogger(__name__)
+
+# The coach dashboard shows every athlete of the session database, so it is opt-in
+COACH_DASHBOARD_ENABLED = os.environ.get("BAYHEALTH_COACH_DASHBOARD", "0") == "1"
+# Seconds after which the aggregates are recomputed in the background (0 = on every access)
+ATHLETE_REFRESH_INTERVAL = float(os.environ.get("BAYHEALTH_ATHLETE_REFRESH_INTERVAL", "300"))
+TOP_MUSCLES = 3
+# Maximum length of the athlete ID athletes enter on the health state page
+ATHLETE_ID_MAX_LENGTH = 64
+
+ATHLETE_COLUMNS = [
+    "athlete", "status", "overloaded", "max_load", "top_muscles", "readiness", "last_training", "sessions_7d",
+]
+
+
+def normalize_athlete_id(value: Optional[str]) -> Optional[str]:
+    """
+    Clean an athlete ID entered by the user.
+
+    Args:
+        value (Optional[str]): Raw input.
+
+    Returns:
+        Optional[str]: Stripped ID (at most ATHLETE_ID_MAX_LENGTH characters); None if empty.
+    """
+    value = " ".join((value or "").split())[:ATHLETE_ID_MAX_LENGTH]
+    return value or None
+
+
+def athlete_summary(record: Dict[str, Any], day: date) -> Dict[str, Any]:
+    """
+    Aggregate the load report of one athlete into a single coach table row.
+
+    Args:
+        record (Dict[str, Any]): User record (see ``batch_report.read_export``).
+        day (date): Reference day.
+
+    Returns:
+        Dict[str, Any]: Row with the columns of ATHLETE_COLUMNS except ``athlete``.
+    """
+    report = user_report(record, day, current_catalog())
+    top = report.nlargest(TOP_MUSCLES, "load")
+    training_days = sorted(d for d, entries in (record.get("training_log") or {}).items() if entries and d <= day.isoformat())
+    week_start = (day - timedelta(days=6)).isoformat()
+    overloaded = int(report["overloaded"].sum())
+    return {
+        "status": "Überlastet" if overloaded else "OK",
+        "overloaded": overloaded,
+        "max_load": round(float(report["load"].max()), 1),
+        "top_muscles": ", ".join(f"{row.muscle} ({row.load:.0f} %)" for row in top.itertuples() if row.load > 0),
+        "readiness": round(readiness_factor(record.get("readiness")), 2),
+        "last_training": training_days[-1] if training_days else None,
+        "sessions_7d": sum(d >= week_start for d in training_days),
+    }
+
+
+def build_athlete_table(records: Iterable[Dict[str, Any]], day: Optional[date] = None) -> pd.DataFrame:
+    """
+    Compute the coach table for a stream of user records.
+
+    Only sessions with an athlete ID (entered by the athlete on the health
+    state page, session field ``athlete``) are listed, under that ID and
+    sorted by it; the session ID is the bearer credential of the session and
+    never shown. Invalid records are logged and skipped.
+
+    Args:
+        records (Iterable[Dict[str, Any]]): User records.
+        day (Optional[date]): Reference day (defaults to today).
+
+    Returns:
+        pd.DataFrame: One row per athlete.
+    """
+    day = day or date.today()
+    rows = []
+    for record in records:
+        athlete = normalize_athlete_id(record.get("athlete"))
+        if athlete is None:
+            continue
+        try:
+            rows.append({"athlete": athlete, **athlete_summary(record, day)})
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            logger.warning("Skipping athlete %r: %s: %s", athlete, type(e).__name__, e)
+    return pd.DataFrame(rows, columns=ATHLETE_COLUMNS).sort_values("athlete", kind="stable", ignore_index=True)
+
+
+class AthleteTable:
+    """
+    Precomputed per-athlete aggregates of all sessions, refreshed in the background.
+
+    Nothing is computed before the coach dashboard is used: the first
+    access computes the table; afterwards a stale table is
+    returned immediately while a background thread recomputes it, so grid
+    requests only ever sort, filter and slice the precomputed frame.
+
+    Attributes:
+        path (str): Session database.
+        interval (float): Refresh interval in seconds.
+    """
+
+    def __init__(self, path: str = SESSION_DB_PATH, interval: float = ATHLETE_REFRESH_INTERVAL):
+        self.path = path
+        self.interval = interval
+        self._frame: Optional[pd.DataFrame] = None
+        self._updated = 0.0
+        self._refreshing = False
+        self._lock = threading.Lock()
+
+    def refresh(self) -> pd.DataFrame:
+        """Recompute the table from the session database."""
+        start = time.perf_counter()
+        frame = build_athlete_table(read_sessions(self.path)) if os.path.exists(self.path) else build_athlete_table([])
+        self._frame, self._updated = frame, time.monotonic()
+        logger.info("Athlete table refreshed: %d athletes in %.0f ms", len(frame), (time.perf_counter() - start) * 1000)
+        return frame
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self.refresh()
+        except Exception:
+            logger.exception("Athlete table refresh failed")
+        finally:
+            self._refreshing = False
+
+    def frame(self) -> pd.DataFrame:
+        """
+        Return the current table (computing it on first use).
+
+        Returns:
+            pd.DataFrame: One row per athlete.
+        """
+        if self._frame is None:
+            with self._lock:
+                if self._frame is None:
+                    return self.refresh()
+        if time.monotonic() - self._updated > self.interval:
+            with self._lock:
+                start = not self._refreshing
+                self._refreshing = True
+            if start:
+                threading.Thread(target=self._refresh_in_background, name="athlete-refresh", daemon=True).start()
+        return self._frame
+
+
+athlete_table = AthleteTable()
@@ -0,0 +1,284 @@
+import argparse
+import gzip
+import io
+import json
+import logging
+import multiprocessing
+import os
+import sqlite3
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import date
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from catalog import Catalog, load_catalog
+from load_model import compute_muscle_loads, overload_flags
+from readiness import readiness_factor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 500
+REPORT_COLUMNS = ["user", "date", "muscle", "load", "acute", "chronic", "acwr", "overloaded"]
+# Key of the placeholder record that ``read_export`` yields for a line that is not valid JSON
+INVALID_LINE = "_invalid_line"
+
+# Catalog of the running job; set before the worker processes are forked, so
+# every worker uses the same (shared, memory-mapped) version
+_job_catalog: Optional[Catalog] = None
+
+
+def read_export(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the user records of a bulk export (JSON Lines, optionally gzip-compressed).
+
+    Each line holds one user: ``{"user": <id>, "training_log": {...},
+    "readiness": {...}, "exercises": [...], "ratings": {...}}``; everything
+    but ``user`` is optional. ``-`` reads from stdin.
+
+    A line that is not valid JSON is logged with its line number and yields
+    a placeholder ``{INVALID_LINE: <line number>}``, which ``process_chunk``
+    counts as skipped.
+
+    Args:
+        path (str): Path of the export.
+
+    Yields:
+        Dict[str, Any]: One record per non-empty line.
+    """
+    if path == "-":
+        stream = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8")
+    elif path.endswith(".gz"):
+        stream = gzip.open(path, "rt", encoding="utf-8")
+    else:
+        stream = open(path, encoding="utf-8")
+    with stream:
+        for number, line in enumerate(stream, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                logger.warning("Skipping line %d of %s: invalid JSON: %s", number, path, e)
+                yield {INVALID_LINE: number}
+
+
+def read_sessions(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the user records of the server-side session database.
+
+    Sessions are read in order of their ID, one cursor row at a time, and
+    grouped into records with the session ID as ``user``.
+
+    Args:
+        path (str): Path of the SQLite file (``BAYHEALTH_SESSION_DB``).
+
+    Yields:
+        Dict[str, Any]: One record per session with a training log, readiness state or athlete ID.
+    """
+    connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        rows = connection.execute(
+            "SELECT sid, name, value FROM fields WHERE name IN ('training_log', 'readiness', 'athlete') ORDER BY sid"
+        )
+        record: Dict[str, Any] = {}
+        for sid, name, value in rows:
+            if record and record["user"] != sid:
+                yield record
+                record = {}
+            record.setdefault("user", sid)
+            record[name] = json.loads(value)
+        if record:
+            yield record
+    finally:
+        connection.close()
+
+
+def chunked(records: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Group a record stream into lists of at most ``size`` records."""
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def user_report(record: Dict[str, Any], day: date, catalog: Optional[Catalog] = None) -> pd.DataFrame:
+    """
+    Compute the muscle load report of one user, exactly as the progress page does.
+
+    Args:
+        record (Dict[str, Any]): User record (see ``read_export``).
+        day (date): Reference day of the report.
+        catalog (Optional[Catalog]): Exercise catalog (defaults to the current one).
+
+    Returns:
+        pd.DataFrame: One row per muscle with the columns of REPORT_COLUMNS.
+    """
+    factor = readiness_factor(record.get("readiness"), record.get("ratings") or {})
+    loads = compute_muscle_loads(
+        record.get("training_log"), record.get("exercises"), factor=factor, today=day, catalog=catalog
+    )
+    return pd.DataFrame({
+        "user": str(record["user"]),
+        "date": day.isoformat(),
+        "muscle": loads.index,
+        "load": loads["load"].to_numpy(),
+        "acute": loads["acute"].to_numpy(),
+        "chronic": loads["chronic"].to_numpy(),
+        "acwr": loads["acwr"].to_numpy(),
+        "overloaded": overload_flags(loads),
+    })
+
+
+def process_chunk(records: List[Dict[str, Any]], day: date) -> Tuple[pd.DataFrame, int]:
+    """
+    Compute the reports of one chunk of users (runs in a worker process).
+
+    Invalid records are logged and skipped.
+
+    Args:
+        records (List[Dict[str, Any]]): User records.
+        day (date): Reference day.
+
+    Returns:
+        Tuple[pd.DataFrame, int]: Reports of all valid records and the number of skipped records.
+    """
+    reports, errors = [], 0
+    for record in records:
+        if INVALID_LINE in record:
+            errors += 1
+            continue
+        try:
+            reports.append(user_report(record, day, _job_catalog))
+        except (KeyError, TypeError, ValueError, AttributeError) as e:
+            errors += 1
+            logger.warning("Skipping user %r: %s: %s", record.get("user"), type(e).__name__, e)
+    if not reports:
+        return pd.DataFrame(columns=REPORT_COLUMNS), errors
+    return pd.concat(reports, ignore_index=True), errors
+
+
+class ReportWriter:
+    """
+    Append report chunks to a CSV (optionally ``.csv.gz``) or Parquet file.
+
+    Parquet output requires ``pyarrow``; every chunk becomes one row group.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.rows = 0
+        self._parquet = None
+        if path.endswith(".parquet"):
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError as e:
+                raise ImportError("Parquet output requires pyarrow (install the 'parquet' extra)") from e
+        elif os.path.exists(path):
+            os.remove(path)
+
+    def write(self, frame: pd.DataFrame) -> None:
+        if frame.empty:
+            return
+        if self.path.endswith(".parquet"):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self._parquet is None:
+                self._parquet = pq.ParquetWriter(self.path, table.schema)
+            self._parquet.write_table(table)
+        else:
+            frame.to_csv(self.path, mode="a", header=self.rows == 0, index=False)
+        self.rows += len(frame)
+
+    def close(self) -> None:
+        if self._parquet is not None:
+            self._parquet.close()
+
+
+def run(
+    records: Iterable[Dict[str, Any]],
+    writer: ReportWriter,
+    day: date,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict[str, Any]:
+    """
+    Compute the reports of a record stream and write them in input order.
+
+    Chunks are processed by a pool of forked worker processes that share
+    the memory-mapped catalog. At most two chunks per worker are in flight,
+    so the memory stays flat no matter how large the export is.
+
+    Args:
+        records (Iterable[Dict[str, Any]]): User records (e.g. from ``read_export``).
+        writer (ReportWriter): Output.
+        day (date): Reference day of the reports.
+        workers (int): Number of worker processes (1 = in this process).
+        chunk_size (int): Users per chunk.
+
+    Returns:
+        Dict[str, Any]: Job statistics (users, skipped, rows, seconds).
+    """
+    global _job_catalog
+    _job_catalog = load_catalog()
+    start = time.perf_counter()
+    stats = {"users": 0, "skipped": 0, "rows": 0, "catalog_version": _job_catalog.version}
+
+    def collect(frame: pd.DataFrame, errors: int, n_records: int) -> None:
+        writer.write(frame)
+        stats["users"] += n_records - errors
+        stats["skipped"] += errors
+
+    if workers <= 1:
+        for chunk in chunked(records, chunk_size):
+            collect(*process_chunk(chunk, day), len(chunk))
+    else:
+        in_flight: Deque[Tuple[Future, int]] = deque()
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("fork")) as pool:
+            for chunk in chunked(records, chunk_size):
+                if len(in_flight) >= 2 * workers:
+                    future, n_records = in_flight.popleft()
+                    collect(*future.result(), n_records)
+                in_flight.append((pool.submit(process_chunk, chunk, day), len(chunk)))
+            while in_flight:
+                future, n_records = in_flight.popleft()
+                collect(*future.result(), n_records)
+
+    writer.close()
+    stats["rows"] = writer.rows
+    stats["seconds"] = round(time.perf_counter() - start, 2)
+    return stats
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Compute per-muscle load reports (scores and overload flags) for many users offline."
+    )
+    parser.add_argument("source", help="JSON Lines export (.jsonl/.jsonl.gz, '-' for stdin) or session database with --sessions")
+    parser.add_argument("output", help="Report file (.csv, .csv.gz or .parquet)")
+    parser.add_argument("--sessions", action="store_true", help="Read the users from a session SQLite database")
+    parser.add_argument("--date", type=date.fromisoformat, default=date.today(), help="Reference day (default: today)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    records = read_sessions(args.source) if args.sessions else read_export(args.source)
+    stats = run(records, ReportWriter(args.output), args.date, args.workers, args.chunk_size)
+    logger.info(
+        "Wrote %d rows for %d users (%d skipped) in %.1f s, catalog %s",
+        stats["rows"], stats["users"], stats["skipped"], stats["seconds"], stats["catalog_version"],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark the offline report job (``batch_report.py``): throughput and peak
+memory for growing synthetic exports.
+
+Every user has 12 logged sessions of 3 exercises within 60 days and two
+selected exercises. The job runs in a fresh process per measurement; the
+peak RSS is the maximum over the job and its worker processes. With
+streaming input, chunked processing and bounded in-flight chunks it should
+not grow with the number of users.
+
+Usage:
+    python benchmarks/batch_reports.py [--users 2000 10000] [--workers 1 2]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from datetime import date, timedelta
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from constants import EXERCISES  # noqa: E402
+
+DAY = date(2026, 1, 5)
+RUN = """
+import resource, subprocess, sys, time
+start = time.perf_counter()
+subprocess.run([sys.executable, "batch_report.py", *sys.argv[1:]], check=True, capture_output=True)
+elapsed = time.perf_counter() - start
+print(elapsed, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+"""
+
+
+def write_export(path: str, n_users: int) -> None:
+    rng = np.random.default_rng(0)
+    ids = [ex["id"] for ex in EXERCISES]
+    with open(path, "w") as f:
+        for user in range(n_users):
+            training_log = {
+                (DAY - timedelta(days=int(offset))).isoformat(): [
+                    {"exercise": str(ex_id), "sets": [{"Satz": 1, "Wdh": 10, "Gewicht": 40}]}
+                    for ex_id in rng.choice(ids, 3, replace=False)
+                ]
+                for offset in rng.choice(np.arange(1, 61), 12, replace=False)
+            }
+            record = {"user": f"u{user}", "training_log": training_log, "exercises": list(map(str, rng.choice(ids, 2, replace=False)))}
+            f.write(json.dumps(record) + "\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, nargs="+", default=[2000, 10000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2])
+    args = parser.parse_args()
+
+    print(f"{'users':>6} | {'workers':>7} | {'time (s)':>8} | {'users/s':>7} | {'peak RSS (MB)':>13}")
+    with tempfile.TemporaryDirectory() as directory:
+        for n_users in args.users:
+            export = os.path.join(directory, f"export_{n_users}.jsonl")
+            write_export(export, n_users)
+            for workers in args.workers:
+                result = subprocess.run(
+                    [sys.executable, "-c", RUN, export, os.path.join(directory, "report.csv"),
+                     "--workers", str(workers), "--date", DAY.isoformat()],
+                    check=True, capture_output=True, text=True,
+                )
+                elapsed, max_rss_kb = result.stdout.split()
+                elapsed = float(elapsed)
+                print(f"{n_users:>6} | {workers:>7} | {elapsed:>8.1f} | {n_users / elapsed:>7.0f} | {int(max_rss_kb) / 1024:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
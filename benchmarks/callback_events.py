@@ -0,0 +1,119 @@
+"""
+Benchmark ALL-pattern click callbacks against the clientside event relay.
+
+For growing catalog sizes (add-exercise buttons) and question counts
+(5 stars each), a throwaway Dash app registers both variants:
+
+- ALL: the click callback takes every button's ``n_clicks`` and ``id``,
+  as ``store_added_exercise``/``update_star_results`` did before.
+- Event: the browser relays only the clicked id into an event store
+  and the server callback takes that event.
+
+Reported are the request body size and the median server time of a
+``/_dash-update-component`` round trip through the Flask test client.
+
+Usage:
+    python benchmarks/callback_events.py
+"""
+import json
+import statistics
+import time
+from typing import Any, Dict, List, Tuple
+
+import dash
+from dash import ALL, Input, Output, State, ctx, dcc, html
+
+REPEATS = 50
+
+
+def create_benchmark_app() -> dash.Dash:
+    """Create a Dash app with both callback variants."""
+    app = dash.Dash(__name__)
+    app.layout = html.Div([dcc.Store(id="selection"), dcc.Store(id="event")])
+
+    @app.callback(
+        Output("selection", "data", allow_duplicate=True),
+        Input({"type": "btn", "index": ALL}, "n_clicks"),
+        State({"type": "btn", "index": ALL}, "id"),
+        State("selection", "data"),
+        prevent_initial_call=True,
+    )
+    def all_pattern(n_clicks_list: List[int], ids: List[Dict[str, Any]], current: List[str]) -> List[str]:
+        if not any(n_clicks_list):
+            raise dash.exceptions.PreventUpdate
+        return (current or []) + [ctx.triggered_id["index"]]
+
+    @app.callback(
+        Output("selection", "data"),
+        Input("event", "data"),
+        State("selection", "data"),
+        prevent_initial_call=True,
+    )
+    def event_scoped(event: Dict[str, Any], current: List[str]) -> List[str]:
+        return (current or []) + [event["id"]["index"]]
+
+    return app
+
+
+def callback_key(app: dash.Dash, input_id: str) -> str:
+    """Find the callback_map key of the callback whose input ID contains ``input_id``."""
+    return next(
+        key for key, callback in app.callback_map.items()
+        if input_id in callback["inputs"][0]["id"]
+    )
+
+
+def build_bodies(app: dash.Dash, n_components: int) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Build the request bodies of both variants for a click on the last component."""
+    ids = [{"type": "btn", "index": f"component_{i}"} for i in range(n_components)]
+    clicked = ids[-1]
+    output = {"id": "selection", "property": "data"}
+    selection = {"id": "selection", "property": "data", "value": [0, 1, 2]}
+
+    all_body = {
+        "output": callback_key(app, '"btn"'),
+        "outputs": output,
+        "inputs": [[
+            {"id": i, "property": "n_clicks", "value": 1 if i == clicked else 0} for i in ids
+        ]],
+        "state": [[{"id": i, "property": "id", "value": i} for i in ids], selection],
+        "changedPropIds": [json.dumps(clicked, separators=(",", ":"), sort_keys=True) + ".n_clicks"],
+    }
+    event_body = {
+        "output": callback_key(app, "event"),
+        "outputs": output,
+        "inputs": [{"id": "event", "property": "data", "value": {"id": clicked, "ts": 0}}],
+        "state": [selection],
+        "changedPropIds": ["event.data"],
+    }
+    return all_body, event_body
+
+
+def measure(client: Any, body: Dict[str, Any]) -> Tuple[int, float]:
+    """Return the body size in bytes and the median round-trip time in ms."""
+    payload = json.dumps(body).encode()
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        response = client.post("/_dash-update-component", data=payload, content_type="application/json")
+        timings.append((time.perf_counter() - start) * 1000)
+        assert response.status_code == 200, response.data
+    return len(payload), statistics.median(timings)
+
+
+def main() -> None:
+    app = create_benchmark_app()
+    client = app.server.test_client()
+    client.get("/")
+
+    print(f"{'components':>10} | {'ALL (B)':>9} | {'event (B)':>9} | {'ALL (ms)':>8} | {'event (ms)':>10}")
+    # 21 exercises (current catalog), larger catalogs; 30/300 = 6/60 questions × 5 stars
+    for n_components in (21, 30, 300, 1000, 10000):
+        all_body, event_body = build_bodies(app, n_components)
+        all_bytes, all_ms = measure(client, all_body)
+        event_bytes, event_ms = measure(client, event_body)
+        print(f"{n_components:>10} | {all_bytes:>9} | {event_bytes:>9} | {all_ms:>8.2f} | {event_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Measure per-worker memory of the exercise catalog: private per-process
+arrays vs. the shared read-only memory-mapped catalog (``catalog.py``).
+
+A synthetic catalog (default 4,000 exercises × 40 muscles plus a derived
+exercises × exercises similarity matrix) is used, because the real one is
+still tiny. Several worker processes are forked that either build their
+own arrays (as every worker did with ``constants.py``) or attach the
+published catalog and touch all pages. Reported are the RSS and the PSS
+(proportional set size, shared pages split between processes) of the
+workers, from ``/proc/<pid>/smaps_rollup`` (Linux only).
+
+Usage:
+    python benchmarks/catalog_memory.py [--exercises 4000] [--workers 4]
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+from typing import Dict, List
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from catalog import attach_catalog, publish_catalog  # noqa: E402
+
+N_MUSCLES = 40
+
+
+def build_arrays(n_exercises: int) -> Dict[str, np.ndarray]:
+    """Synthetic catalog arrays (seeded, identical in every process)."""
+    rng = np.random.default_rng(0)
+    matrix = rng.random((n_exercises, N_MUSCLES)) * (rng.random((n_exercises, N_MUSCLES)) < 0.2) * 100
+    normalized = (matrix / np.maximum(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12)).astype(np.float32)
+    return {"muscle_matrix": matrix, "similarity": normalized @ normalized.T}
+
+
+def memory_kb(pid: int) -> Dict[str, int]:
+    """RSS and PSS of a process in kB."""
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            key, _, rest = line.partition(":")
+            if key in ("Rss", "Pss"):
+                values[key.lower()] = int(rest.split()[0])
+    return values
+
+
+def worker(mode: str, n_exercises: int, directory: str, ready, done) -> None:
+    if mode == "private":
+        arrays = build_arrays(n_exercises)
+    else:
+        arrays = attach_catalog(directory).arrays
+    checksum = sum(float(np.sum(array)) for array in arrays.values())  # touch every page
+    ready.put((os.getpid(), checksum))
+    done.wait()
+
+
+def run(mode: str, n_exercises: int, n_workers: int, directory: str) -> List[Dict[str, int]]:
+    """Start the workers, measure them once all have loaded the catalog."""
+    context = multiprocessing.get_context("fork")
+    ready, done = context.Queue(), context.Event()
+    processes = [
+        context.Process(target=worker, args=(mode, n_exercises, directory, ready, done))
+        for _ in range(n_workers)
+    ]
+    for process in processes:
+        process.start()
+    pids = [ready.get()[0] for _ in processes]
+    measurements = [memory_kb(pid) for pid in pids]
+    done.set()
+    for process in processes:
+        process.join()
+    return measurements
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--exercises", type=int, default=4000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        arrays = build_arrays(args.exercises)
+        size_mb = sum(array.nbytes for array in arrays.values()) / 2**20
+        publish_catalog([f"ex{i}" for i in range(args.exercises)], [f"m{i}" for i in range(N_MUSCLES)], arrays, directory)
+        del arrays
+
+        print(f"Catalog arrays: {size_mb:.1f} MB, {args.workers} workers")
+        print(f"{'mode':<10} | {'RSS/worker (MB)':>15} | {'PSS/worker (MB)':>15} | {'PSS total (MB)':>14}")
+        for mode in ("private", "shared"):
+            measurements = run(mode, args.exercises, args.workers, directory)
+            rss = sum(m["rss"] for m in measurements) / len(measurements) / 1024
+            pss = sum(m["pss"] for m in measurements) / 1024
+            print(f"{mode:<10} | {rss:>15.1f} | {pss / len(measurements):>15.1f} | {pss:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
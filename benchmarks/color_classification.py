@@ -0,0 +1,62 @@
+"""
+Benchmark the load-to-color classification (``classification.py``): the former
+scalar if-chain per muscle vs. one ``np.digitize`` pass, uncached and cached,
+for today's score vector and for days × muscles histories.
+
+Usage:
+    python benchmarks/color_classification.py
+"""
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from classification import _classify, color_scale  # noqa: E402
+
+REPEATS = 20
+
+
+def classify_scalar(scores: np.ndarray) -> list:
+    """Reference: the former ``classify_score`` if-chain, applied per score."""
+    scale = color_scale()
+    result = []
+    for score in scores.ravel():
+        if score < scale.min_score:
+            result.append(None)
+            continue
+        result.append(next((c for bound, c in zip(scale.bounds, scale.colors) if score <= bound), scale.colors[-1]))
+    return result
+
+
+def timed(func, *args, clear: bool = False) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        if clear:
+            _classify.cache_clear()
+        start = time.perf_counter()
+        func(*args)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    scale = color_scale()
+    rng = np.random.default_rng(0)
+    print(f"{'shape':>11} | {'scalar (ms)':>11} | {'digitize (ms)':>13} | {'cached (ms)':>11}")
+    for shape in ((20,), (90, 20), (365, 20), (3650, 20)):
+        scores = rng.uniform(0, 160, shape)
+        assert classify_scalar(scores) == scale.color_of(scores)
+        scalar = timed(classify_scalar, scores)
+        vectorized = timed(scale.classify, scores, clear=True)
+        cached = timed(scale.classify, scores)
+        print(f"{str(shape):>11} | {scalar:>11.3f} | {vectorized:>13.3f} | {cached:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark the load forecast (``forecast.py``): vectorized simulation of all
+candidate plans vs. evaluating every plan and day with ``compute_muscle_loads``.
+
+Uses 90 days of synthetic history and plans repeating the current selection
+on different weekday patterns over 14 days.
+
+Usage:
+    python benchmarks/forecast_simulation.py
+"""
+import os
+import statistics
+import sys
+import time
+from datetime import date, timedelta
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from catalog import load_catalog  # noqa: E402
+from constants import EXERCISES  # noqa: E402
+from forecast import FORECAST_DAYS, _merge, simulate_plans, weekly_calendar  # noqa: E402
+from load_model import compute_muscle_loads  # noqa: E402
+
+TODAY = date(2026, 1, 5)
+PATTERNS = [[0, 2, 4], [0, 1, 3, 4], [1, 3, 5], [0, 3], [0, 1, 2, 3, 4, 5], [2, 6], [0, 2, 4, 6], [1, 4]]
+REPEATS = 5
+
+
+def synthetic_log(days: int = 90):
+    rng = np.random.default_rng(0)
+    ids = [ex["id"] for ex in EXERCISES]
+    return {
+        (TODAY - timedelta(days=offset)).isoformat(): [
+            {"exercise": ex_id, "sets": [{"Satz": s, "Wdh": 10, "Gewicht": 50} for s in range(1, 4)]}
+            for ex_id in rng.choice(ids, 4, replace=False)
+        ]
+        for offset in range(1, days + 1) if offset % 2
+    }
+
+
+def per_day(training_log, calendars):
+    """Reference: one ``compute_muscle_loads`` call per plan and day."""
+    for plan in calendars.values():
+        for offset in range(FORECAST_DAYS):
+            day = TODAY + timedelta(days=offset)
+            before = {d: entries for d, entries in plan.items() if d < day.isoformat()}
+            compute_muscle_loads(_merge(training_log, before), plan.get(day.isoformat(), []), today=day)
+
+
+def timed(func, *args) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(*args)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    load_catalog()
+    training_log = synthetic_log()
+    selection = [ex["id"] for ex in EXERCISES[:5]]
+    print(f"{'plans':>5} | {'per day (ms)':>12} | {'vectorized (ms)':>15}")
+    for n_plans in (1, 4, 8):
+        calendars = {f"p{i}": weekly_calendar(selection, PATTERNS[i], TODAY) for i in range(n_plans)}
+        reference = timed(per_day, training_log, calendars)
+        vectorized = timed(lambda: simulate_plans(training_log, calendars, start=TODAY))
+        print(f"{n_plans:>5} | {reference:>12.1f} | {vectorized:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
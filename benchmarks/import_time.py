@@ -0,0 +1,96 @@
+"""
+Report the import time of the app per module and check it against a budget.
+
+Runs ``python -X importtime -c "import app"`` in a fresh process (which also
+imports all pages via Dash's pages discovery), parses the timings and
+prints the packages with the largest share of the startup time. Exits with
+status 1 if the total import time exceeds the budget, so it can guard
+cold-start regressions in CI or before rolling out new workers.
+
+Usage:
+    python benchmarks/import_time.py [--budget-ms 1000] [--top 15] [--repeats 3]
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_BUDGET_MS = float(os.environ.get("BAYHEALTH_IMPORT_BUDGET_MS", "1000"))
+LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)")
+
+# Modules of this project (everything else is grouped by top-level package)
+PROJECT_MODULES = {
+    os.path.splitext(name)[0] for name in os.listdir(ROOT) if name.endswith(".py")
+} | {"pages"}
+
+
+def measure() -> List[Tuple[str, int, int, int]]:
+    """
+    Import the app in a fresh interpreter with ``-X importtime``.
+
+    Returns:
+        List[Tuple[str, int, int, int]]: (module, self µs, cumulative µs, nesting level) per import.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app"],
+        cwd=ROOT, capture_output=True, text=True,
+        env={**os.environ, "BAYHEALTH_WARMUP": "0"},
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr[-2000:])
+    rows = []
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return rows
+
+
+def group_of(module: str) -> str:
+    """Top-level package of a module; project modules are reported individually."""
+    top = module.split(".")[0]
+    return module if top in PROJECT_MODULES else top
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    runs = [measure() for _ in range(args.repeats)]
+
+    # Median self time per package over all runs
+    per_run: List[Dict[str, int]] = []
+    totals = []
+    for rows in runs:
+        grouped: Dict[str, int] = defaultdict(int)
+        for module, self_us, _, _ in rows:
+            grouped[group_of(module)] += self_us
+        per_run.append(grouped)
+        totals.append(next(cumulative for module, _, cumulative, _ in rows if module == "app"))
+
+    groups = {name for grouped in per_run for name in grouped}
+    medians = {name: statistics.median(grouped.get(name, 0) for grouped in per_run) for name in groups}
+    total_ms = statistics.median(totals) / 1000
+
+    print(f"{'module / package':<40} | {'self (ms)':>9} | {'share':>6}")
+    for name, self_us in sorted(medians.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"{name:<40} | {self_us / 1000:>9.1f} | {self_us / 1000 / total_ms:>6.1%}")
+    print(f"{'total (import app)':<40} | {total_ms:>9.1f} |")
+
+    if total_ms > args.budget_ms:
+        print(f"Import time {total_ms:.0f} ms exceeds the budget of {args.budget_ms:.0f} ms")
+        sys.exit(1)
+    print(f"Within the budget of {args.budget_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark page-load server time and response bytes per route,
+with and without the static layout cache (``layout_cache.py``).
+
+A page load consists of the app shell (``GET /_dash-layout``) and the page
+routing callback that returns the page layout. Both are measured through
+the Flask test client with ``Accept-Encoding: gzip``. Each variant runs in
+its own process because the cache is installed in ``create_app``.
+
+Usage:
+    python benchmarks/page_load.py
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ROUTES = ["/", "/health_state/health_state", "/exercises/exercises", "/progress/progress"]
+REPEATS = 200
+
+
+def measure(client: Any, method: str, url: str, **kwargs: Any) -> Dict[str, float]:
+    """Median server time (ms) and response size (bytes) of a request."""
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        response = getattr(client, method)(url, headers={"Accept-Encoding": "gzip"}, **kwargs)
+        timings.append((time.perf_counter() - start) * 1000)
+    return {"ms": statistics.median(timings), "bytes": len(response.data)}
+
+
+def run_variant() -> None:
+    """Measure all routes in this process and print the results as JSON."""
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    from app import app  # noqa: E402
+
+    client = app.server.test_client()
+    client.get("/")
+    router = next(key for key in app.callback_map if "_pages_content" in key)
+
+    results = {"/_dash-layout": measure(client, "get", "/_dash-layout")}
+    for route in ROUTES:
+        body = {
+            "output": router,
+            "outputs": [
+                {"id": "_pages_content", "property": "children"},
+                {"id": "_pages_store", "property": "data"},
+            ],
+            "inputs": [
+                {"id": "_pages_location", "property": "pathname", "value": route},
+                {"id": "_pages_location", "property": "search", "value": ""},
+            ],
+            "state": [],
+            "changedPropIds": ["_pages_location.pathname"],
+        }
+        results[route] = measure(client, "post", "/_dash-update-component", json=body)
+    print(json.dumps(results))
+
+
+def main() -> None:
+    variants = {}
+    for name, flag in (("uncached", "0"), ("cached", "1")):
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--variant"],
+            env={**os.environ, "BAYHEALTH_LAYOUT_CACHE": flag},
+            capture_output=True, text=True, check=True,
+        ).stdout
+        variants[name] = json.loads(output.strip().splitlines()[-1])
+
+    print(f"{'route':<28} | {'uncached (ms)':>13} | {'cached (ms)':>11} | {'uncached (B)':>12} | {'cached (B)':>10}")
+    for route in variants["uncached"]:
+        before, after = variants["uncached"][route], variants["cached"][route]
+        print(
+            f"{route:<28} | {before['ms']:>13.2f} | {after['ms']:>11.2f} | "
+            f"{before['bytes']:>12} | {after['bytes']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    if "--variant" in sys.argv:
+        run_variant()
+    else:
+        main()
@@ -0,0 +1,110 @@
+"""
+Compare callback request payload sizes of the client-side stores with the
+server-side session store.
+
+Before: ``health_state``, ``readiness`` and ``training-log`` were shipped as
+``dcc.Store`` data with every callback naming them as Input/State.
+After: the client only sends the session reference ``{"sid", "version"}``.
+
+The second table compares the legacy encoding of ``added-exercises`` and
+``star-results`` (ID strings / question-name dict) with the compact
+schema-versioned encoding of ``store_codec``.
+
+Usage:
+    python benchmarks/payload_sizes.py
+"""
+import json
+import os
+import sys
+from datetime import date, timedelta
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from constants import EXERCISES, RECOVERY_QUESTIONS  # noqa: E402
+from readiness import submit  # noqa: E402
+from store_codec import encode_exercises, encode_ratings  # noqa: E402
+
+
+def build_state(days: int) -> Dict[str, Any]:
+    """Create a representative health state, readiness history and training log."""
+    health_state = {
+        "longterm_choice": "ja",
+        "longterm_text": "Chronische Schmerzen im unteren Rücken nach langem Sitzen. " * 4,
+        "shortterm_choice": "ja",
+        "shortterm_text": "Leichtes Ziehen in der rechten Schulter bei Überkopfbewegungen. " * 2,
+        "star_ratings": {question_id: 4 for question_id in RECOVERY_QUESTIONS},
+    }
+
+    readiness, readiness_history = None, None
+    training_log: Dict[str, List[Dict[str, Any]]] = {}
+    for day in range(days):
+        readiness, readiness_history = submit(readiness, readiness_history, {question_id: 3 + day % 3 for question_id in RECOVERY_QUESTIONS})
+        training_log[(date.today() - timedelta(days=day)).isoformat()] = [
+            {
+                "exercise": EXERCISES[(day + i) % len(EXERCISES)]["id"],
+                "sets": [{"Satz": s, "Wdh": 10, "Gewicht": 40 + 2.5 * s} for s in range(1, 4)],
+            }
+            for i in range(4)
+        ]
+    return {
+        "health_state": health_state,
+        "readiness": readiness,
+        "readiness_history": readiness_history,
+        "training_log": training_log,
+    }
+
+
+def request_body(inputs: Dict[str, Any], states: Dict[str, Any]) -> int:
+    """Size in bytes of a Dash callback request carrying the given store values."""
+    body = {
+        "output": "training-progress-container.children",
+        "inputs": [{"id": key, "property": "data", "value": value} for key, value in inputs.items()],
+        "state": [{"id": key, "property": "data", "value": value} for key, value in states.items()],
+        "changedPropIds": [],
+    }
+    return len(json.dumps(body).encode())
+
+
+def main() -> None:
+    legacy_selection = [ex["id"] for ex in EXERCISES[:5]]
+    legacy_stars = {question_id: 4 for question_id in RECOVERY_QUESTIONS}
+    selection, stars = encode_exercises(legacy_selection), encode_ratings(legacy_stars)
+    session = {"sid": "0" * 32, "version": 42}
+
+    print(f"{'days':>6} | {'callback':<26} | {'before (B)':>10} | {'after (B)':>9}")
+    for days in (7, 90, 365):
+        state = build_state(days)
+        rows = {
+            "render_training_progress": (
+                request_body(
+                    {"added-exercises": legacy_selection, "star-results": legacy_stars,
+                     "training-log": state["training_log"],
+                     "readiness": {**state["readiness"], "history": state["readiness_history"]}},
+                    {},
+                ),
+                request_body({"added-exercises": selection, "star-results": stars, "session": session}, {}),
+            ),
+            "analyze_exercise": (
+                request_body({}, {"health_state": state["health_state"]}),
+                request_body({}, {"session": session}),
+            ),
+        }
+        for name, (before, after) in rows.items():
+            print(f"{days:>6} | {name:<26} | {before:>10} | {after:>9}")
+
+    print()
+    print(f"{'store':<28} | {'legacy (B)':>10} | {'compact (B)':>11}")
+    ratings = {question_id: 4 for question_id in RECOVERY_QUESTIONS}
+    store_rows = {
+        "star-results": (ratings, encode_ratings(ratings)),
+    }
+    for size in (5, len(EXERCISES)):
+        exercise_ids = [ex["id"] for ex in EXERCISES[:size]]
+        store_rows[f"added-exercises ({size} ex.)"] = (exercise_ids, encode_exercises(exercise_ids))
+    for name, (legacy, compact) in store_rows.items():
+        print(f"{name:<28} | {len(json.dumps(legacy)):>10} | {len(json.dumps(compact)):>11}")
+
+
+if __name__ == "__main__":
+    main()
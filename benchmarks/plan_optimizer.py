@@ -0,0 +1,81 @@
+"""
+Benchmark the session plan optimizer (``planner.py``) on large synthetic catalogs.
+
+Builds catalogs of increasing size (sparse random muscle profiles, 40
+muscles) and runs ``optimize_plan`` for random target muscle sets, greedy
+(beam width 1) and with the default beam, once without a time limit and
+once with the default time budget. Reports the median search time and the
+mean target coverage. Before that, checks that a muscle the baseline
+already overloads does not block the plan (regression check).
+
+Usage:
+    python benchmarks/plan_optimizer.py
+"""
+import os
+import statistics
+import sys
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from catalog import Catalog, build_catalog_arrays, load_catalog  # noqa: E402
+from planner import BEAM_WIDTH, TIME_BUDGET_MS, optimize_plan  # noqa: E402
+from substitution import SubstitutionIndex  # noqa: E402
+
+SIZES = [1_000, 10_000, 50_000]
+N_MUSCLES = 40
+RUNS = 20
+
+
+def synthetic_index(n_exercises: int) -> SubstitutionIndex:
+    rng = np.random.default_rng(0)
+    usage = rng.random((n_exercises, N_MUSCLES)) * (rng.random((n_exercises, N_MUSCLES)) < 0.15) * 25
+    matrix = pd.DataFrame(
+        usage, index=[f"ex{i}" for i in range(n_exercises)], columns=[f"m{i}" for i in range(N_MUSCLES)]
+    )
+    catalog = Catalog(f"synthetic-{n_exercises}", list(matrix.index), list(matrix.columns), build_catalog_arrays(matrix))
+    index = SubstitutionIndex(catalog)
+    index.listed[:] = True  # synthetic exercises have no entry in constants.EXERCISES
+    return index
+
+
+def measure(index: SubstitutionIndex, beam_width: int, time_budget_ms: float):
+    rng = np.random.default_rng(1)
+    timings, coverage, timeouts = [], [], 0
+    for _ in range(RUNS):
+        targets = [f"m{i}" for i in rng.choice(N_MUSCLES, 3, replace=False)]
+        plan = optimize_plan(targets, beam_width=beam_width, time_budget_ms=time_budget_ms, index=index)
+        timings.append(plan.elapsed_ms)
+        coverage.append(plan.coverage)
+        timeouts += plan.timed_out
+    return statistics.median(timings), statistics.mean(coverage), timeouts
+
+
+def check_overloaded_baseline() -> None:
+    """A non-target muscle overloaded by the baseline must only exclude the exercises that load it."""
+    load_catalog()
+    overloaded = "adductor_magnus"
+    plan = optimize_plan(["pectoralis_major"], baseline=pd.Series({overloaded: 90.0}))
+    assert plan.exercise_ids and plan.coverage > 0, "pre-overloaded baseline muscle blocks every plan"
+    assert plan.loads[overloaded] == 90.0, "plan adds load to a muscle the baseline already overloads"
+    print(f"overloaded baseline: {plan.exercise_ids} (coverage {plan.coverage:.0%})")
+
+
+def main() -> None:
+    check_overloaded_baseline()
+    print(f"{'exercises':>9} | {'beam':>4} | {'budget (ms)':>11} | {'time (ms)':>9} | {'coverage':>8} | {'timeouts':>8}")
+    for n_exercises in SIZES:
+        index = synthetic_index(n_exercises)
+        for beam_width, budget in ((1, float("inf")), (BEAM_WIDTH, float("inf")), (BEAM_WIDTH, TIME_BUDGET_MS)):
+            elapsed, coverage, timeouts = measure(index, beam_width, budget)
+            print(
+                f"{n_exercises:>9} | {beam_width:>4} | {budget:>11} | {elapsed:>9.1f} | {coverage:>8.1%} | {timeouts:>5}/{RUNS}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark the progress chart series (``series.py``): points and JSON bytes
+sent to the browser with and without LTTB downsampling, and the server time
+for a cold series, a cached view and the incremental update after logging
+a set (session load excluded).
+
+Uses synthetic daily logs of one exercise over 1, 5 and 30 years (the
+latter stands in for very long per-set histories), a 400 px wide chart and
+a temporary session database.
+
+Usage:
+    python benchmarks/series_downsampling.py
+"""
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+os.environ["BAYHEALTH_SESSION_DB"] = os.path.join(tempfile.mkdtemp(), "sessions.sqlite3")
+
+from series import SeriesCache  # noqa: E402
+from session_store import session_store  # noqa: E402
+
+WIDTH = 400
+TODAY = date(2026, 1, 5)
+REPEATS = 5
+
+
+def synthetic_log(days: int):
+    rng = np.random.default_rng(0)
+    return {
+        (TODAY - timedelta(days=offset)).isoformat(): [{
+            "exercise": "barbell_squat",
+            "sets": [{"Satz": s, "Wdh": int(rng.integers(3, 12)), "Gewicht": 60 + offset % 365 * 0.1} for s in range(1, 4)],
+        }]
+        for offset in range(1, days + 1)
+    }
+
+
+def timed(func) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    print(f"{'years':>5} | {'points':>6} | {'raw (kB)':>8} | {'LTTB (kB)':>9} | {'cold (ms)':>9} | {'cached (ms)':>11} | {'after log (ms)':>14}")
+    for years in (1, 5, 30):
+        training_log = synthetic_log(365 * years)
+        session = session_store.update(session_store.create(), training_log=training_log)
+        full = SeriesCache().get(session, "barbell_squat", "tonnage", "all", 10**9, today=TODAY)
+        raw_kb = len(json.dumps(full)) / 1024
+
+        cold = timed(lambda: SeriesCache().get(session, "barbell_squat", "tonnage", "all", WIDTH, today=TODAY))
+        cache = SeriesCache()
+        view = cache.get(session, "barbell_squat", "tonnage", "all", WIDTH, today=TODAY)
+        cached = timed(lambda: cache.get(session, "barbell_squat", "tonnage", "all", WIDTH, today=TODAY))
+
+        timings = []
+        for _ in range(REPEATS):
+            training_log[TODAY.isoformat()] = [{"exercise": "barbell_squat", "sets": [{"Wdh": 5, "Gewicht": float(np.random.randint(80, 120))}]}]
+            session = session_store.update(session, training_log=training_log)
+            session_store.get(session, "training_log")  # load outside the measurement
+            start = time.perf_counter()
+            cache.get(session, "barbell_squat", "tonnage", "all", WIDTH, today=TODAY)
+            timings.append((time.perf_counter() - start) * 1000)
+        after_log = statistics.median(timings)
+        print(
+            f"{years:>5} | {full['points']:>6} | {raw_kb:>8.1f} | {len(json.dumps(view)) / 1024:>9.1f} | "
+            f"{cold:>9.1f} | {cached:>11.2f} | {after_log:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Benchmark request throughput and latency of the development server
+(``python app.py``, debug off) against the production setup
+(gunicorn with ``gunicorn.conf.py``).
+
+Each server is started as a subprocess on its own port. A pool of client
+threads with keep-alive connections then sends a mix of page loads
+(``GET /_dash-layout``, page routing callback) and a compute-bound
+callback (``render_progress_summary`` with a session holding 90 days of
+training history) for a fixed duration.
+
+Requires gunicorn (``pip install gunicorn``).
+
+Usage:
+    python benchmarks/serving_throughput.py [--duration 10] [--concurrency 16]
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from typing import Any, Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HOST = "127.0.0.1"
+
+# (name, command, port)
+SERVERS = [
+    ("dev server", [sys.executable, "app.py"], 8061),
+    ("gunicorn", [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "wsgi:server"], 8062),
+]
+
+
+def post_json(connection: http.client.HTTPConnection, path: str, body: Dict[str, Any]) -> bytes:
+    connection.request("POST", path, json.dumps(body), {"Content-Type": "application/json"})
+    response = connection.getresponse()
+    return response.read()
+
+
+def wait_until_up(port: int, timeout: float = 60) -> None:
+    """Poll the server until it answers."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            connection = http.client.HTTPConnection(HOST, port, timeout=2)
+            connection.request("GET", "/_dash-layout")
+            connection.getresponse().read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+def build_requests() -> List[Tuple[str, str, Dict[str, Any]]]:
+    """Create a session with training history and return the request mix."""
+    sys.path.insert(0, ROOT)
+    from store_codec import EXERCISE_IDS, encode_exercises  # noqa: E402
+    from session_store import SessionStore  # noqa: E402
+
+    store = SessionStore(os.environ["BAYHEALTH_SESSION_DB"])
+    session = store.create()
+    rng = random.Random(0)
+    today = date.today()
+    training_log = {
+        (today - timedelta(days=day)).isoformat(): [
+            {"exercise": ex_id, "sets": [{"Satz": 1, "Wdh": 10, "Gewicht": 40}]}
+            for ex_id in rng.sample(EXERCISE_IDS, 3)
+        ]
+        for day in range(1, 91, 2)
+    }
+    session = store.update(session, training_log=training_log)
+
+    router = {
+        "output": ".._pages_content.children..._pages_store.data..",
+        "outputs": [{"id": "_pages_content", "property": "children"}, {"id": "_pages_store", "property": "data"}],
+        "inputs": [
+            {"id": "_pages_location", "property": "pathname", "value": "/progress/progress"},
+            {"id": "_pages_location", "property": "search", "value": ""},
+        ],
+        "state": [],
+        "changedPropIds": ["_pages_location.pathname"],
+    }
+    summary = {
+        "output": "progress-summary.children",
+        "outputs": {"id": "progress-summary", "property": "children"},
+        "inputs": [
+            {"id": "added-exercises", "property": "data", "value": encode_exercises(EXERCISE_IDS[:4])},
+            {"id": "star-results", "property": "data", "value": None},
+            {"id": "session", "property": "data", "value": session},
+        ],
+        "state": [],
+        "changedPropIds": ["added-exercises.data"],
+    }
+    return [
+        ("GET", "/_dash-layout", {}),
+        ("POST", "/_dash-update-component", router),
+        ("POST", "/_dash-update-component", summary),
+    ]
+
+
+def load(port: int, requests: List[Tuple[str, str, Dict[str, Any]]], duration: float, concurrency: int) -> Dict[str, float]:
+    """Send the request mix from ``concurrency`` threads for ``duration`` seconds."""
+    latencies: List[float] = []
+    errors = [0]
+    lock = threading.Lock()
+    deadline = time.time() + duration
+
+    def worker(offset: int) -> None:
+        connection = http.client.HTTPConnection(HOST, port, timeout=30)
+        local, i = [], offset
+        while time.time() < deadline:
+            method, path, body = requests[i % len(requests)]
+            i += 1
+            start = time.perf_counter()
+            try:
+                if method == "GET":
+                    connection.request("GET", path)
+                    connection.getresponse().read()
+                else:
+                    post_json(connection, path, body)
+                local.append(time.perf_counter() - start)
+            except (OSError, http.client.HTTPException):
+                with lock:
+                    errors[0] += 1
+                connection = http.client.HTTPConnection(HOST, port, timeout=30)
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    latencies.sort()
+    return {
+        "rps": len(latencies) / duration,
+        "p50": statistics.median(latencies) * 1000,
+        "p95": latencies[int(len(latencies) * 0.95)] * 1000,
+        "errors": errors[0],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    session_db = os.path.join(tempfile.gettempdir(), "bayhealth_benchmark_sessions.sqlite3")
+    env = {
+        **os.environ,
+        "BAYHEALTH_DEBUG": "0",
+        "BAYHEALTH_SESSION_DB": session_db,
+        "BAYHEALTH_ACCESS_LOG": "/dev/null",
+    }
+    os.environ["BAYHEALTH_SESSION_DB"] = session_db
+
+    print(f"{os.cpu_count()} CPUs, {args.concurrency} client threads, {args.duration:.0f} s per server")
+    print(f"{'server':<12} | {'req/s':>8} | {'p50 (ms)':>8} | {'p95 (ms)':>8} | {'errors':>6}")
+    for name, command, port in SERVERS:
+        server_env = {**env, "BAYHEALTH_BIND": f"{HOST}:{port}"}
+        # The dev server listens on Dash's PORT
+        server_env["PORT"] = str(port)
+        process = subprocess.Popen(command, cwd=ROOT, env=server_env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            wait_until_up(port)
+            result = load(port, build_requests(), args.duration, args.concurrency)
+        finally:
+            process.terminate()
+            process.wait()
+        print(f"{name:<12} | {result['rps']:>8.1f} | {result['p50']:>8.2f} | {result['p95']:>8.2f} | {result['errors']:>6}")
+
+
+if __name__ == "__main__":
+    main()
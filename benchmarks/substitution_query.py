@@ -0,0 +1,82 @@
+"""
+Benchmark substitution queries (``substitution.py``) on large synthetic catalogs.
+
+Builds catalogs of increasing size (sparse random muscle profiles, 40
+muscles) and measures the latency of ``SubstitutionIndex.query`` without
+filters and with two contraindicated muscles. Before that, checks that the
+alternatives offered for a critically rated exercise spare its dominant
+muscles (regression check).
+
+Usage:
+    python benchmarks/substitution_query.py
+"""
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from catalog import Catalog, build_catalog_arrays, load_catalog  # noqa: E402
+from constants import EXERCISES  # noqa: E402
+from substitution import SubstitutionIndex, find_sparing_substitutes  # noqa: E402
+
+SIZES = [1_000, 10_000, 50_000]
+N_MUSCLES = 40
+QUERIES = 300
+
+
+def synthetic_catalog(n_exercises: int) -> Catalog:
+    rng = np.random.default_rng(0)
+    usage = rng.random((n_exercises, N_MUSCLES)) * (rng.random((n_exercises, N_MUSCLES)) < 0.2) * 100
+    matrix = pd.DataFrame(
+        usage, index=[f"ex{i}" for i in range(n_exercises)], columns=[f"m{i}" for i in range(N_MUSCLES)]
+    )
+    return Catalog(f"synthetic-{n_exercises}", list(matrix.index), list(matrix.columns), build_catalog_arrays(matrix))
+
+
+def measure(index: SubstitutionIndex, n_exercises: int, **filters) -> float:
+    """Median query latency in ms."""
+    rng = np.random.default_rng(1)
+    timings = []
+    for ex in rng.integers(0, n_exercises, QUERIES):
+        start = time.perf_counter()
+        index.query(f"ex{ex}", k=10, listed_only=False, **filters)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def check_sparing_substitutes() -> None:
+    """The alternatives of every listed exercise must not load its dominant muscles."""
+    catalog = load_catalog()
+    for exercise in EXERCISES:
+        spared, substitutes = find_sparing_substitutes(exercise["id"], k=3)
+        assert spared, f"no dominant muscles for {exercise['id']}"
+        columns = [catalog.muscles.index(muscle) for muscle in spared]
+        for sub in substitutes:
+            usage = catalog.matrix[catalog.row_index[sub["id"]], columns]
+            assert not usage.any(), f"{sub['id']} loads {spared} spared for {exercise['id']}"
+    spared, substitutes = find_sparing_substitutes("barbell_squat", k=3)
+    print(f"barbell_squat spares {spared}: {[sub['id'] for sub in substitutes]}")
+
+
+def main() -> None:
+    check_sparing_substitutes()
+    print(f"{'exercises':>9} | {'build (ms)':>10} | {'query (ms)':>10} | {'query + avoid (ms)':>18}")
+    for n_exercises in SIZES:
+        catalog = synthetic_catalog(n_exercises)
+        start = time.perf_counter()
+        index = SubstitutionIndex(catalog)
+        build_ms = (time.perf_counter() - start) * 1000
+        plain = measure(index, n_exercises)
+        avoid = measure(index, n_exercises, avoid_muscles=["m3", "m7"])
+        print(f"{n_exercises:>9} | {build_ms:>10.2f} | {plain:>10.3f} | {avoid:>18.3f}")
+
+
+if __name__ == "__main__":
+    main()
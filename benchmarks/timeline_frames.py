@@ -0,0 +1,96 @@
+"""
+Benchmark the muscle map timeline (``timeline.py``): precomputing the color
+classes of all days at once vs. rendering one SVG per day on the server, as
+``update_muscle_svg`` does for the current selection.
+
+Uses two years of synthetic history (a session every other day).
+
+Usage:
+    python benchmarks/timeline_frames.py
+"""
+import io
+import json
+import os
+import statistics
+import sys
+import time
+import xml.etree.ElementTree as ET
+from datetime import date, timedelta
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+
+from catalog import load_catalog  # noqa: E402
+from classification import color_scale  # noqa: E402
+from constants import EXERCISES, MUSCLE_SVG_MAPPING  # noqa: E402
+from load_model import compute_muscle_loads, history_model  # noqa: E402
+from timeline import heatmap_frames  # noqa: E402
+
+TODAY = date(2026, 1, 5)
+REPEATS = 5
+# Frames rendered per day by the reference (the per-frame cost is constant)
+SAMPLE_FRAMES = 20
+
+
+def synthetic_log(days: int = 730):
+    rng = np.random.default_rng(0)
+    ids = [ex["id"] for ex in EXERCISES]
+    return {
+        (TODAY - timedelta(days=offset)).isoformat(): [
+            {"exercise": ex_id, "sets": [{"Satz": s, "Wdh": 10, "Gewicht": 50} for s in range(1, 4)]}
+            for ex_id in rng.choice(ids, 4, replace=False)
+        ]
+        for offset in range(0, days) if offset % 2 == 0
+    }
+
+
+def render_frame(training_log, day: date) -> int:
+    """Reference: one server round trip per frame (loads of the day, colors, SVG file)."""
+    loads = compute_muscle_loads(training_log, [], today=day)["load"]
+    ns = {"svg": "http://www.w3.org/2000/svg"}
+    tree = ET.parse("assets/muscle_sections.svg")
+    for muscle, color in zip(loads.index, color_scale().color_of(loads.to_numpy())):
+        if color is None or muscle not in MUSCLE_SVG_MAPPING:
+            continue
+        for path in tree.getroot().findall(".//svg:path", ns):
+            if path.attrib.get("id") in MUSCLE_SVG_MAPPING[muscle]["paths"]:
+                path.attrib["style"] = f"fill:{color}"
+    output = io.BytesIO()
+    tree.write(output)
+    return len(output.getvalue())
+
+
+def timed(func, *args) -> float:
+    timings = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(*args)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    load_catalog()
+    training_log = synthetic_log()
+    history_model(training_log, TODAY + timedelta(days=1))  # cached like in the app
+
+    sample_days = [TODAY - timedelta(days=offset) for offset in range(SAMPLE_FRAMES)]
+    start = time.perf_counter()
+    svg_bytes = [render_frame(training_log, day) for day in sample_days]
+    per_frame_ms = (time.perf_counter() - start) * 1000 / SAMPLE_FRAMES
+
+    print(f"{'days':>4} | {'per-frame SVGs (ms)':>19} | {'SVG bytes':>9} | {'frames (ms)':>11} | {'frames bytes':>12}")
+    for days in (30, 90, 365):
+        frames_ms = timed(heatmap_frames, training_log, TODAY, days)
+        payload = len(json.dumps(heatmap_frames(training_log, TODAY, days)))
+        print(
+            f"{days:>4} | {per_frame_ms * days:>19.0f} | {statistics.mean(svg_bytes) * days:>9.0f} | "
+            f"{frames_ms:>11.2f} | {payload:>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
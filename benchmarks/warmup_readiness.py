@@ -0,0 +1,70 @@
+"""
+Benchmark the background warm-up under a preloading server: builds the app
+once (like gunicorn's ``preload_app``), forks worker processes, starts the
+per-worker warm-up as ``post_fork`` does and measures how long each worker
+answers ``/readyz`` with 503 before it reports ready.
+
+Exit code 1 if a worker does not become ready within the timeout (the
+warm-up thread of the master does not exist in forked workers).
+
+Usage:
+    python benchmarks/warmup_readiness.py [--workers 4] [--timeout 30]
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
+os.environ["BAYHEALTH_WARMUP"] = "background"
+os.environ["BAYHEALTH_WARMUP_PER_WORKER"] = "1"  # as set by gunicorn.conf.py
+
+from wsgi import server  # noqa: E402
+from warmup import start_worker_warm_up  # noqa: E402
+
+
+def time_to_ready(timeout: float) -> float:
+    """Poll /readyz of this process; return the ms until it answers 200 (inf on timeout)."""
+    client = server.test_client()
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout:
+        if client.get("/readyz").status_code == 200:
+            return (time.perf_counter() - start) * 1000
+        time.sleep(0.005)
+    return float("inf")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--timeout", type=float, default=30)
+    args = parser.parse_args()
+
+    pipes = []
+    for _ in range(args.workers):
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            start_worker_warm_up()
+            os.write(write_fd, repr(time_to_ready(args.timeout)).encode())
+            os._exit(0)
+        os.close(write_fd)
+        pipes.append((pid, read_fd))
+
+    failed = 0
+    print(f"{'worker':>6} | {'ready after (ms)':>16}")
+    for pid, read_fd in pipes:
+        os.waitpid(pid, 0)
+        elapsed = float(os.read(read_fd, 64).decode() or "inf")
+        failed += elapsed == float("inf")
+        print(f"{pid:>6} | {elapsed:>16.1f}")
+    if failed:
+        print(f"{failed} of {args.workers} workers never became ready")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,366 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from constants import EXERCISES, MUSCLE_SVG_MAPPING, MUSCLE_USE_CSV, load_muscle_matrix
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process publish lock
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Directory of the published catalog arrays (shared by all worker processes)
+CATALOG_DIR = os.environ.get("BAYHEALTH_CATALOG_DIR", "data/catalog")
+MANIFEST_NAME = "manifest.json"
+# Bump when build_catalog_arrays changes, so existing catalogs are rebuilt
+CATALOG_FORMAT = 2
+# Seconds between checks for a changed muscle_use.csv or a newly published catalog (0 disables)
+CATALOG_WATCH_INTERVAL = float(os.environ.get("BAYHEALTH_CATALOG_WATCH_INTERVAL", "2"))
+
+
+class Catalog:
+    """
+    Read-only exercise catalog attached from published ``.npy`` files.
+
+    The arrays are memory-mapped read-only, so all worker processes on a
+    host share the same physical pages instead of holding their own copies.
+    A catalog object never changes; a new catalog version is published to
+    new files and swapped in as a whole.
+
+    Attributes:
+        version (str): Content hash of the catalog.
+        exercise_ids (List[str]): Row order of the arrays.
+        muscles (List[str]): Column order of the muscle arrays.
+        arrays (Dict[str, np.ndarray]): Read-only array views by name.
+        row_index (Dict[str, int]): Row of each exercise ID.
+    """
+
+    def __init__(self, version: str, exercise_ids: List[str], muscles: List[str], arrays: Dict[str, np.ndarray]):
+        self.version = version
+        self.exercise_ids = exercise_ids
+        self.muscles = muscles
+        self.arrays = arrays
+        self.row_index = {ex_id: i for i, ex_id in enumerate(exercise_ids)}
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """Muscle usage in % (exercises × muscles)."""
+        return self.arrays["muscle_matrix"]
+
+    @property
+    def profiles(self) -> np.ndarray:
+        """L2-normalized muscle profiles (exercises × muscles, float32)."""
+        return self.arrays["profiles"]
+
+
+def build_catalog_arrays(muscle_matrix: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    Compute the catalog arrays from the muscle usage table.
+
+    Args:
+        muscle_matrix (pd.DataFrame): Usage in % (exercises × muscles).
+
+    Returns:
+        Dict[str, np.ndarray]: Arrays by name (rows in ``muscle_matrix.index`` order).
+    """
+    matrix = muscle_matrix.to_numpy(dtype=float)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return {
+        "muscle_matrix": matrix,
+        # L2-normalized muscle profiles: cosine similarities are dot products
+        "profiles": np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0).astype(np.float32),
+    }
+
+
+def validate_muscle_matrix(muscle_matrix: pd.DataFrame) -> List[str]:
+    """
+    Check a muscle usage table before it is published.
+
+    Args:
+        muscle_matrix (pd.DataFrame): Usage in % (exercises × muscles).
+
+    Returns:
+        List[str]: Warnings (e.g. muscles that cannot be drawn in the SVG).
+
+    Raises:
+        ValueError: If the table cannot be used (duplicate exercises, non-numeric or negative values).
+    """
+    if muscle_matrix.index.has_duplicates:
+        raise ValueError(f"duplicate exercises: {sorted(muscle_matrix.index[muscle_matrix.index.duplicated()])}")
+    values = muscle_matrix.to_numpy()
+    if not np.issubdtype(values.dtype, np.number) or (values < 0).any():
+        raise ValueError("muscle usage values must be non-negative numbers")
+
+    warnings = []
+    unmapped = [muscle for muscle in muscle_matrix.columns if muscle not in MUSCLE_SVG_MAPPING]
+    if unmapped:
+        warnings.append(f"muscles without SVG mapping (not drawn): {unmapped}")
+    missing = [ex["id"] for ex in EXERCISES if ex["id"] not in muscle_matrix.index]
+    if missing:
+        warnings.append(f"exercises without muscle usage (no load): {missing}")
+    return warnings
+
+
+def source_signature(path: str = MUSCLE_USE_CSV) -> List[int]:
+    """Modification time and size of the catalog source file."""
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _content_hash(exercise_ids: List[str], muscles: List[str], arrays: Dict[str, np.ndarray]) -> str:
+    digest = hashlib.sha256(json.dumps([exercise_ids, muscles]).encode("utf-8"))
+    for name in sorted(arrays):
+        digest.update(name.encode("utf-8"))
+        digest.update(str(arrays[name].dtype).encode("utf-8"))
+        digest.update(np.ascontiguousarray(arrays[name]).tobytes())
+    return digest.hexdigest()[:16]
+
+
+def publish_catalog(
+    exercise_ids: List[str],
+    muscles: List[str],
+    arrays: Dict[str, np.ndarray],
+    directory: str = CATALOG_DIR,
+    source: Optional[List[int]] = None,
+) -> str:
+    """
+    Write catalog arrays to versioned ``.npy`` files and switch the manifest to them.
+
+    Files are named by content hash, so publishing the same catalog from
+    several processes is idempotent. The manifest is replaced atomically;
+    files of older versions are removed afterwards (processes that still
+    have them mapped keep their view until they attach the new version).
+
+    Args:
+        exercise_ids (List[str]): Row order of the arrays.
+        muscles (List[str]): Column order of the muscle arrays.
+        arrays (Dict[str, np.ndarray]): Arrays by name.
+        directory (str): Target directory.
+        source (Optional[List[int]]): Signature of the source file the arrays were built from.
+
+    Returns:
+        str: Version of the published catalog.
+    """
+    os.makedirs(directory, exist_ok=True)
+    version = _content_hash(exercise_ids, muscles, arrays)
+
+    files = {}
+    for name, array in arrays.items():
+        filename = f"{name}-{version}.npy"
+        path = os.path.join(directory, filename)
+        if not os.path.exists(path):
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, np.ascontiguousarray(array))
+            os.replace(tmp_path, path)
+        files[name] = filename
+
+    manifest = {
+        "version": version, "format": CATALOG_FORMAT, "exercise_ids": exercise_ids, "muscles": muscles,
+        "files": files, "source": source,
+    }
+    tmp_manifest = os.path.join(directory, f"{MANIFEST_NAME}.{os.getpid()}.tmp")
+    with open(tmp_manifest, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_manifest, os.path.join(directory, MANIFEST_NAME))
+
+    for filename in os.listdir(directory):
+        if filename.endswith(".npy") and filename not in files.values():
+            try:
+                os.remove(os.path.join(directory, filename))
+            except OSError:
+                pass  # still in use (e.g. on Windows); removed on a later publish
+    return version
+
+
+def read_manifest(directory: str = CATALOG_DIR) -> Dict[str, Any]:
+    """Read the manifest of the currently published catalog."""
+    with open(os.path.join(directory, MANIFEST_NAME), encoding="utf-8") as f:
+        return json.load(f)
+
+
+@contextmanager
+def _publish_lock(directory: str) -> Iterator[None]:
+    """Serialize rebuilds of the catalog across worker processes."""
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, ".lock"), "w") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        yield
+
+
+def rebuild_catalog(directory: str = CATALOG_DIR, source_path: str = MUSCLE_USE_CSV) -> str:
+    """
+    Rebuild the catalog from the source CSV and publish it.
+
+    Only one process rebuilds at a time; a process that waited for the lock
+    skips the rebuild if the published catalog is already up to date.
+
+    Args:
+        directory (str): Catalog directory.
+        source_path (str): Path of ``muscle_use.csv``.
+
+    Returns:
+        str: Version of the published catalog.
+
+    Raises:
+        ValueError: If the new table is invalid (the previous version stays published).
+    """
+    with _publish_lock(directory):
+        source = source_signature(source_path)
+        try:
+            manifest = read_manifest(directory)
+            if manifest.get("source") == source and manifest.get("format") == CATALOG_FORMAT:
+                return manifest["version"]
+        except (OSError, ValueError):
+            pass
+
+        muscle_matrix = load_muscle_matrix(source_path)
+        for warning in validate_muscle_matrix(muscle_matrix):
+            logger.info("Catalog: %s", warning)
+        return publish_catalog(
+            list(muscle_matrix.index), list(muscle_matrix.columns),
+            build_catalog_arrays(muscle_matrix), directory, source,
+        )
+
+
+def attach_catalog(directory: str = CATALOG_DIR) -> Catalog:
+    """
+    Attach the currently published catalog as read-only memory maps.
+
+    Args:
+        directory (str): Catalog directory.
+
+    Returns:
+        Catalog: The attached catalog.
+    """
+    manifest = read_manifest(directory)
+    arrays = {
+        name: np.load(os.path.join(directory, filename), mmap_mode="r")
+        for name, filename in manifest["files"].items()
+    }
+    return Catalog(manifest["version"], manifest["exercise_ids"], manifest["muscles"], arrays)
+
+
+_current: Optional[Catalog] = None
+_directory = CATALOG_DIR
+_lock = threading.Lock()
+_watch_lock = threading.Lock()
+_listeners: List[Callable[[Catalog], None]] = []
+_watch: Dict[str, Any] = {"last_check": 0.0, "checking": False, "failed_source": None}
+
+
+def on_catalog_change(listener: Callable[[Catalog], None]) -> None:
+    """
+    Register a function that is called with the new catalog after each swap.
+
+    Used to rebuild derived indexes and to drop caches of the old version.
+
+    Args:
+        listener (Callable[[Catalog], None]): Change listener.
+    """
+    _listeners.append(listener)
+
+
+def _swap(catalog: Catalog) -> None:
+    """Make a catalog current and notify the listeners."""
+    global _current
+    _current = catalog
+    for listener in _listeners:
+        try:
+            listener(catalog)
+        except Exception:
+            logger.exception("Catalog change listener %r failed", listener)
+
+
+def load_catalog(directory: str = CATALOG_DIR) -> Catalog:
+    """
+    Publish the catalog built from ``data/muscle_use.csv`` and make it current.
+
+    Called once by ``create_app``; with gunicorn's ``preload_app`` the master
+    publishes and attaches, and the workers inherit the shared mapping.
+
+    Args:
+        directory (str): Catalog directory.
+
+    Returns:
+        Catalog: The current catalog.
+    """
+    global _directory
+    with _lock:
+        _directory = directory
+        rebuild_catalog(directory)
+        _swap(attach_catalog(directory))
+        _watch["last_check"] = time.monotonic()
+        return _current
+
+
+def check_for_changes() -> bool:
+    """
+    Pick up a changed source CSV or a catalog published by another process.
+
+    Rebuilds and publishes the catalog if ``muscle_use.csv`` changed, then
+    attaches the published version if it differs from the current one.
+    Invalid tables are logged and the current version is kept.
+
+    Returns:
+        bool: True if a new catalog was swapped in.
+    """
+    with _lock:
+        source = source_signature()
+        if source != _watch.get("failed_source"):
+            try:
+                rebuild_catalog(_directory)
+            except (OSError, ValueError, pd.errors.ParserError) as e:
+                # Not retried until the file changes again
+                _watch["failed_source"] = source
+                logger.error("Catalog reload failed, keeping version %s: %s", _current and _current.version, e)
+        manifest = read_manifest(_directory)
+        if _current is not None and manifest["version"] == _current.version:
+            return False
+        _swap(attach_catalog(_directory))
+        logger.info("Catalog version %s is now current", _current.version)
+        return True
+
+
+def _run_check() -> None:
+    try:
+        check_for_changes()
+    except Exception:
+        logger.exception("Catalog check failed")
+    finally:
+        _watch["checking"] = False
+
+
+def current_catalog() -> Catalog:
+    """
+    Return the current catalog (loading it on first use).
+
+    At most every ``CATALOG_WATCH_INTERVAL`` seconds, a background thread
+    checks for a changed source or a newly published version; the swap
+    never blocks the caller. Callers should fetch the catalog once per
+    operation and use that object throughout, so in-flight operations
+    finish on the version they started with.
+
+    Returns:
+        Catalog: The current catalog.
+    """
+    catalog = _current or load_catalog()
+    if CATALOG_WATCH_INTERVAL > 0 and time.monotonic() - _watch["last_check"] > CATALOG_WATCH_INTERVAL:
+        with _watch_lock:
+            start = not _watch["checking"]
+            _watch["checking"] = True
+            _watch["last_check"] = time.monotonic()
+        if start:
+            threading.Thread(target=_run_check, name="catalog-check", daemon=True).start()
+    return catalog
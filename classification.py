@@ -0,0 +1,159 @@
+import os
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from load_model import OVERLOAD_THRESHOLD
+
+# Number of classified score arrays kept per process
+CLASSIFICATION_CACHE_SIZE = 256
+
+# Muscles with a lower load (in %) are left uncolored
+MIN_COLORED_SCORE = 0.3
+
+# Upper bounds (inclusive) of the load classes (in %) and their labels; the orange
+# class starts above the overload threshold, so the map agrees with the overload
+# warnings (``load > OVERLOAD_THRESHOLD``)
+CLASS_BOUNDS = [10, 40, OVERLOAD_THRESHOLD, 100, 130]
+LEVEL_LABELS = ["sehr gering", "gering", "mittel", "hoch", "sehr hoch", "extrem"]
+
+# Scale used by all views (key of COLOR_SCALES)
+COLOR_SCALE = os.environ.get("BAYHEALTH_COLOR_SCALE", "ampel")
+
+
+class ColorScale:
+    """
+    Mapping of load scores (in %) to color classes.
+
+    Class 0 means "not colored" (below ``min_score``); class i (1-based)
+    covers the scores above ``bounds[i - 2]`` up to and including
+    ``bounds[i - 1]`` and is drawn with ``colors[i - 1]``. One bound must be
+    the overload threshold; like ``load_model.overload_flags``, only scores
+    above it count as overloaded, so every view marks the same muscles.
+
+    Attributes:
+        name (str): Key in COLOR_SCALES.
+        bounds (np.ndarray): Upper bounds of the classes (ascending).
+        colors (List[str]): One color per class (``len(bounds) + 1``).
+        labels (List[str]): One label per class.
+        min_score (float): Lowest colored score.
+        overload_class (int): First class counted as overloaded.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        bounds: Sequence[float],
+        colors: Sequence[str],
+        labels: Sequence[str],
+        min_score: float = MIN_COLORED_SCORE,
+        overload_threshold: float = OVERLOAD_THRESHOLD,
+    ):
+        if len(colors) != len(bounds) + 1 or len(labels) != len(colors):
+            raise ValueError(f"Color scale {name!r} needs one color and label per class ({len(bounds) + 1})")
+        if overload_threshold not in bounds:
+            raise ValueError(f"Color scale {name!r} must have a class bound at the overload threshold ({overload_threshold})")
+        self.name = name
+        self.bounds = np.asarray(bounds, dtype=float)
+        self.colors = list(colors)
+        self.labels = list(labels)
+        self.min_score = min_score
+        self.overload_class = int(np.digitize(overload_threshold, self.bounds, right=True)) + 2
+
+    def classify(self, scores: np.ndarray) -> np.ndarray:
+        """
+        Classify a score vector or matrix (e.g. days × muscles) in one ``np.digitize`` pass.
+
+        Results are cached per score array, so views showing the same loads
+        classify them only once. The returned array is shared and read-only.
+
+        Args:
+            scores (np.ndarray): Scores in % (any shape).
+
+        Returns:
+            np.ndarray: Classes (uint8) with the shape of ``scores``.
+        """
+        scores = np.ascontiguousarray(scores, dtype=float)
+        return _classify(self, scores.tobytes(), scores.shape)
+
+    def color_of(self, scores: np.ndarray) -> List[Optional[str]]:
+        """
+        Colors of a score vector.
+
+        Args:
+            scores (np.ndarray): Scores in %.
+
+        Returns:
+            List[Optional[str]]: Color per score; None if not colored.
+        """
+        palette = [None] + self.colors
+        return [palette[c] for c in self.classify(scores).ravel()]
+
+    def label_of(self, scores: np.ndarray) -> List[str]:
+        """
+        Labels of a score vector (uncolored scores get the label of the first class).
+
+        Args:
+            scores (np.ndarray): Scores in %.
+
+        Returns:
+            List[str]: Label per score.
+        """
+        return [self.labels[max(c, 1) - 1] for c in self.classify(scores).ravel()]
+
+    def overloaded(self, scores: np.ndarray) -> np.ndarray:
+        """
+        Flag scores in an overloaded class.
+
+        Args:
+            scores (np.ndarray): Scores in %.
+
+        Returns:
+            np.ndarray: Boolean flags with the shape of ``scores``.
+        """
+        return self.classify(scores) >= self.overload_class
+
+
+@lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+def _classify(scale: ColorScale, data: bytes, shape: Tuple[int, ...]) -> np.ndarray:
+    """Classify (and cache) a serialized score array."""
+    scores = np.frombuffer(data, dtype=float).reshape(shape)
+    classes = np.where(scores >= scale.min_score, np.digitize(scores, scale.bounds, right=True) + 1, 0).astype(np.uint8)
+    classes.setflags(write=False)
+    return classes
+
+
+COLOR_SCALES: Dict[str, ColorScale] = {
+    # Traffic light colors: light green, green, yellow, orange, red, dark red
+    "ampel": ColorScale(
+        "ampel", CLASS_BOUNDS, ["#5cf3aa", "#33b535ff", "#f1f826", "#dda304", "#f71c1c", "#7f0400"], LEVEL_LABELS
+    ),
+    # Color-blind safe (viridis, light to dark)
+    "kontrast": ColorScale(
+        "kontrast", CLASS_BOUNDS, ["#fde725", "#7ad151", "#22a884", "#2a788e", "#414487", "#440154"], LEVEL_LABELS
+    ),
+}
+
+
+def register_color_scale(scale: ColorScale) -> None:
+    """
+    Add or replace a color scale (select it with ``BAYHEALTH_COLOR_SCALE``).
+
+    Args:
+        scale (ColorScale): Scale to register under its name.
+    """
+    COLOR_SCALES[scale.name] = scale
+
+
+def color_scale(name: Optional[str] = None) -> ColorScale:
+    """
+    Return a color scale.
+
+    Args:
+        name (Optional[str]): Key in COLOR_SCALES (defaults to COLOR_SCALE).
+
+    Returns:
+        ColorScale: The scale.
+    """
+    return COLOR_SCALES[name or COLOR_SCALE]
@@ -1,15 +1,28 @@
 import pandas as pd
 from typing import Dict, List, Any
 
-# Load muscle usage matrix
-# The CSV contains the relative usage of muscles per exercise.
-# Values are normalized (divided by 4) and converted to percentages.
-MUSCLE_MATRIX: pd.DataFrame = (
-    pd.read_csv("data/muscle_use.csv", sep=";")
-    .set_index("exercise")
-    .fillna(0)
-)
-MUSCLE_MATRIX = MUSCLE_MATRIX / 4 * 100
+MUSCLE_USE_CSV = "data/muscle_use.csv"
+
+
+def load_muscle_matrix(path: str = MUSCLE_USE_CSV) -> pd.DataFrame:
+    """
+    Load the muscle usage matrix.
+
+    The CSV contains the relative usage of muscles per exercise.
+    Values are normalized (divided by 4) and converted to percentages.
+
+    Args:
+        path (str): Path of the semicolon-separated CSV file.
+
+    Returns:
+        pd.DataFrame: Usage in % (exercises × muscles).
+    """
+    matrix = pd.read_csv(path, sep=";").set_index("exercise").fillna(0)
+    return matrix / 4 * 100
+
+
+# Muscle usage matrix at startup (the catalog reloads it when the CSV changes, see catalog.py)
+MUSCLE_MATRIX: pd.DataFrame = load_muscle_matrix()
 
 # Mapping from muscle names (used in the code) to SVG group/path IDs
 # This is used for dynamically coloring the SVG muscle map based on exercise load.
@@ -96,6 +109,17 @@ MUSCLE_SVG_MAPPING: Dict[str, Dict[str, Any]] = {
     }
 }
 
+# Recovery questionnaire (Training Distress Scale) shown as star ratings
+# Maps question IDs to their text; the first line is the headline, the second the description.
+RECOVERY_QUESTIONS: Dict[str, str] = {
+    "q1": "1. Körperliches Wohlbefinden:\nFühlst du dich körperlich beschwerdefrei? 👉 1 = sehr starke Beschwerden / 5 = keine Beschwerden",
+    "q2": "2. Schlafqualität:\nWie gut schläfst du aktuell? 👉 1 = sehr schlechter Schlaf / 5 = sehr erholsamer Schlaf",
+    "q3": "3. Energie und Appetit:\nFühlst du dich energiegeladen? 👉 1 = energielos / 5 = voller Energie",
+    "q4": "4. Mentale Klarheit:\nWie klar fühlst du dich mental? 👉 1 = unklar / 5 = sehr klar",
+    "q5": "5. Emotionale Ausgeglichenheit:\nWie ausgeglichen bist du? 👉 1 = gereizt / 5 = ruhig",
+    "q6": "6. Motivation und Lebensfreude:\nWie motiviert bist du aktuell? 👉 1 = unmotiviert / 5 = motiviert",
+}
+
 # List of predefined exercises displayed in the app
 # Each entry contains:
 # - id: Internal identifier used in callbacks
@@ -0,0 +1,185 @@
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from catalog import Catalog, current_catalog
+from load_model import (
+    ACUTE_SPAN_DAYS,
+    ACWR_MIN_HISTORY_DAYS,
+    ACWR_THRESHOLD,
+    CHRONIC_SPAN_DAYS,
+    OVERLOAD_THRESHOLD,
+    VolumeWeighting,
+    acute_chronic_ratio,
+    daily_load_matrix,
+    ewma,
+    ewma_alpha,
+    history_model,
+    intensity_weighted_reps,
+)
+from tracing import traced
+
+# Number of days simulated by default (today included)
+FORECAST_DAYS = 14
+
+# Planned sessions per ISO date: exercise IDs or entries {"exercise": <id>, "volume": <factor>}
+PlanCalendar = Dict[str, List[Union[str, Dict[str, Any]]]]
+
+
+def weekly_calendar(exercise_ids: List[str], weekdays: Iterable[int], start: date, days: int = FORECAST_DAYS) -> PlanCalendar:
+    """
+    Repeat one session on fixed weekdays.
+
+    Args:
+        exercise_ids (List[str]): Exercises of the session.
+        weekdays (Iterable[int]): Training days (0 = Monday).
+        start (date): First day of the calendar.
+        days (int): Number of days.
+
+    Returns:
+        PlanCalendar: Calendar with the session on every matching day.
+    """
+    weekdays = set(weekdays)
+    calendar = {}
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        if day.weekday() in weekdays:
+            calendar[day.isoformat()] = list(exercise_ids)
+    return calendar
+
+
+def _merge(training_log: Dict[str, List[Dict[str, Any]]], plan: PlanCalendar) -> Dict[str, List[Dict[str, Any]]]:
+    """Add planned entries to the logged ones; exercises already logged on a day are not counted twice."""
+    merged = {day: list(entries) for day, entries in training_log.items()}
+    for day, planned in plan.items():
+        entries = merged.setdefault(day, [])
+        logged_ids = {entry["exercise"] for entry in entries}
+        for entry in planned:
+            entry = {"exercise": entry} if isinstance(entry, str) else entry
+            if entry["exercise"] not in logged_ids:
+                entries.append(entry)
+    return merged
+
+
+class Forecast:
+    """
+    Projected daily muscle load of several candidate plans.
+
+    All arrays have the shape scenarios × days × muscles.
+
+    Attributes:
+        start (date): First simulated day.
+        scenarios (List[str]): Plan names.
+        muscles (List[str]): Muscles (catalog order).
+        load (np.ndarray): Effective load in % (incl. readiness factor).
+        acwr (np.ndarray): Acute:chronic ratio (NaN without chronic load).
+        overloaded (np.ndarray): Flags as in ``load_model.overloaded_muscles``.
+    """
+
+    def __init__(self, start: date, scenarios: List[str], muscles: List[str], load: np.ndarray, acwr: np.ndarray, overloaded: np.ndarray):
+        self.start = start
+        self.scenarios = scenarios
+        self.muscles = muscles
+        self.load = load
+        self.acwr = acwr
+        self.overloaded = overloaded
+
+    @property
+    def dates(self) -> List[date]:
+        """Simulated days."""
+        return [self.start + timedelta(days=offset) for offset in range(self.load.shape[1])]
+
+    def to_frame(self, scenario: str) -> pd.DataFrame:
+        """
+        Effective load of one plan as a table.
+
+        Args:
+            scenario (str): Plan name.
+
+        Returns:
+            pd.DataFrame: Load in % (days × muscles).
+        """
+        return pd.DataFrame(self.load[self.scenarios.index(scenario)], index=self.dates, columns=self.muscles)
+
+    def overloaded_on(self, scenario: str, day: int) -> List[str]:
+        """
+        Muscles flagged on one day of a plan, highest load first.
+
+        Args:
+            scenario (str): Plan name.
+            day (int): Day offset from ``start``.
+
+        Returns:
+            List[str]: Flagged muscles.
+        """
+        s = self.scenarios.index(scenario)
+        flagged = np.flatnonzero(self.overloaded[s, day])
+        return [self.muscles[m] for m in flagged[np.argsort(-self.load[s, day, flagged], kind="stable")]]
+
+
+@traced("forecast.simulate_plans")
+def simulate_plans(
+    training_log: Optional[Dict[str, List[Dict[str, Any]]]],
+    plans: Dict[str, PlanCalendar],
+    start: Optional[date] = None,
+    days: int = FORECAST_DAYS,
+    factor: float = 1.0,
+    weighting: VolumeWeighting = intensity_weighted_reps,
+    catalog: Optional[Catalog] = None,
+) -> Forecast:
+    """
+    Project the muscle load of candidate plans day by day.
+
+    The logged history before ``start`` is taken from the cached history
+    model; from there both EWMAs are continued over the planned days for
+    all plans at once (one decay-weight product over days × plans ×
+    muscles). Days without a session only decay, so recovery is part of
+    the projection. Sessions logged on or after ``start`` count in every plan.
+    The readiness ``factor`` is kept constant over the forecast.
+
+    Args:
+        training_log (Optional[Dict[str, List[Dict[str, Any]]]]): Logged sessions per ISO date.
+        plans (Dict[str, PlanCalendar]): Candidate plans by name.
+        start (Optional[date]): First simulated day (defaults to today).
+        days (int): Number of simulated days.
+        factor (float): Readiness factor applied to the effective load.
+        weighting (VolumeWeighting): Volume weighting formula for logged sets.
+        catalog (Optional[Catalog]): Exercise catalog (defaults to the current one).
+
+    Returns:
+        Forecast: Projected loads of all plans.
+    """
+    start = start or date.today()
+    end = start + timedelta(days=days)
+    training_log = training_log or {}
+    catalog = catalog or current_catalog()
+
+    history = history_model(training_log, start, weighting, catalog)
+    logged = {day: entries for day, entries in training_log.items() if day >= start.isoformat()}
+    n_muscles = len(catalog.muscles)
+    planned = np.zeros((days, len(plans), n_muscles))
+    for s, plan in enumerate(plans.values()):
+        planned[:, s] = daily_load_matrix(_merge(logged, plan), start, end, weighting, catalog)
+
+    last_acute = history.acute[-1] if history.n_days else np.zeros(n_muscles)
+    last_chronic = history.chronic[-1] if history.n_days else np.zeros(n_muscles)
+    acute = ewma(planned, ACUTE_SPAN_DAYS, initial=last_acute)
+    chronic = ewma(planned, CHRONIC_SPAN_DAYS, initial=last_chronic)
+    acwr = acute_chronic_ratio(acute, chronic, history.n_days + np.arange(1, days + 1))
+    load = acute / ewma_alpha(ACUTE_SPAN_DAYS) * factor
+
+    overloaded = load > OVERLOAD_THRESHOLD
+    enough_history = (history.n_days + np.arange(days) >= ACWR_MIN_HISTORY_DAYS)[:, None, None]
+    with np.errstate(invalid="ignore"):
+        overloaded |= enough_history & (acwr > ACWR_THRESHOLD)
+
+    return Forecast(
+        start,
+        list(plans),
+        list(catalog.muscles),
+        load.transpose(1, 0, 2),
+        acwr.transpose(1, 0, 2),
+        overloaded.transpose(1, 0, 2),
+    )
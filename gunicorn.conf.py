@@ -0,0 +1,39 @@
+# Production server configuration (gunicorn -c gunicorn.conf.py wsgi:server).
+# All settings can be overridden via environment variables.
+import multiprocessing
+import os
+
+bind = os.environ.get("BAYHEALTH_BIND", "0.0.0.0:8050")
+
+# Processes for CPU-bound work (load model, SVG rendering) and threads for
+# callbacks that mostly wait on I/O (LLM calls, SQLite)
+workers = int(os.environ.get("BAYHEALTH_WORKERS", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "gthread"
+threads = int(os.environ.get("BAYHEALTH_THREADS", "4"))
+
+# Build the app once in the master; workers share it copy-on-write
+preload_app = True
+# A background warm-up (BAYHEALTH_WARMUP=background) must not run in the master:
+# its thread would not exist in the forked workers, whose /readyz would stay 503
+os.environ["BAYHEALTH_WARMUP_PER_WORKER"] = "1"
+
+# LLM calls can take a while; give in-flight requests time to finish on reload/shutdown
+timeout = int(os.environ.get("BAYHEALTH_TIMEOUT", "60"))
+graceful_timeout = int(os.environ.get("BAYHEALTH_GRACEFUL_TIMEOUT", "30"))
+keepalive = 5
+
+# Recycle workers periodically to bound memory growth
+max_requests = int(os.environ.get("BAYHEALTH_MAX_REQUESTS", "2000"))
+max_requests_jitter = max_requests // 10
+
+accesslog = os.environ.get("BAYHEALTH_ACCESS_LOG", "-")
+errorlog = "-"
+loglevel = os.environ.get("BAYHEALTH_LOG_LEVEL", "info")
+
+
+def post_fork(server, worker):
+    """Start the background warm-up and open the pooled LLM connection per worker."""
+    from warmup import start_worker_warm_up, warm_llm_connection
+
+    start_worker_warm_up()
+    warm_llm_connection()
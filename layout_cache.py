@@ -0,0 +1,207 @@
+import gzip
+import hashlib
+import logging
+import os
+from typing import Any, Callable, Dict, Optional
+
+import dash
+import flask
+from plotly.io.json import to_json_plotly
+
+from metrics import CallbackMetrics, callback_label
+from tracing import span
+
+logger = logging.getLogger(__name__)
+
+# Set BAYHEALTH_LAYOUT_CACHE=0 to serialize layouts on every request (e.g. for benchmarks)
+LAYOUT_CACHE_ENABLED = os.environ.get("BAYHEALTH_LAYOUT_CACHE", "1") != "0"
+
+# Component IDs of dash.page_container that the page routing callback reads and writes.
+# The routing callback's response format is not part of Dash's public API: page caching
+# is verified against the Dash versions below (see pyproject.toml) and checked on the
+# first request, otherwise it is disabled.
+PAGES_CONTENT_ID = "_pages_content"
+PAGES_LOCATION_ID = "_pages_location"
+PAGES_STORE_ID = "_pages_store"
+PAGES_ROUTER_OUTPUT = f"..{PAGES_CONTENT_ID}.children...{PAGES_STORE_ID}.data.."
+VERIFIED_DASH_VERSIONS = ((3, 1), (3, 4))
+
+
+class CachedResponse:
+    """
+    A JSON body serialized once, pre-compressed and identified by an ETag.
+
+    Attributes:
+        body (bytes): Uncompressed JSON.
+        gzipped (bytes): Gzip-compressed JSON.
+        etag (str): Strong ETag derived from the content hash.
+    """
+
+    def __init__(self, body: str):
+        self.body = body.encode("utf-8")
+        self.gzipped = gzip.compress(self.body, compresslevel=9)
+        self.etag = hashlib.sha256(self.body).hexdigest()[:32]
+
+    def to_response(self) -> flask.Response:
+        """
+        Build the Flask response for the current request.
+
+        Returns 304 if the client already holds this version, and the
+        pre-compressed body if the client accepts gzip.
+
+        Returns:
+            flask.Response: Response with ETag and caching headers.
+        """
+        if self.etag in flask.request.if_none_match:
+            response = flask.Response(status=304)
+        elif "gzip" in flask.request.accept_encodings:
+            response = flask.Response(self.gzipped, mimetype="application/json")
+            response.headers["Content-Encoding"] = "gzip"
+        else:
+            response = flask.Response(self.body, mimetype="application/json")
+
+        response.set_etag(self.etag)
+        response.headers["Cache-Control"] = "no-cache"  # always revalidate via ETag
+        response.vary.add("Accept-Encoding")
+        return response
+
+
+class StaticLayoutCache:
+    """
+    Serve static Dash layouts from pre-serialized, pre-compressed JSON.
+
+    Covers the app shell (``/_dash-layout``) and the page routing callback of
+    ``dash.page_container`` for every page whose layout is a component tree
+    rather than a function. Dynamic content such as the training progress
+    container or the exercise outputs stays callback-driven, because it is
+    filled by separate callbacks after the static layout has been rendered.
+    """
+
+    def __init__(self, app: dash.Dash, metrics: Optional[CallbackMetrics] = None):
+        self.app = app
+        self.metrics = metrics
+        self.shell: Optional[CachedResponse] = None
+        self.pages: Dict[str, CachedResponse] = {}
+        self._router_checked = False
+        self._serve: Optional[Callable[[CachedResponse], flask.Response]] = None
+        self._router_name = "update"
+
+    def build(self) -> None:
+        """Serialize and compress the app shell and all static page layouts."""
+        if not callable(self.app.layout):
+            self.shell = CachedResponse(to_json_plotly(self.app.layout))
+
+        self.pages = {}
+        for page in dash.page_registry.values():
+            layout, title = page.get("layout", ""), page.get("title")
+            if callable(layout) or callable(title) or page.get("path_template"):
+                continue
+            # Same response body as Dash's page routing callback
+            body = {
+                "multi": True,
+                "response": {
+                    PAGES_CONTENT_ID: {"children": layout},
+                    PAGES_STORE_ID: {"data": {"title": title}},
+                },
+            }
+            self.pages[page["path"].strip("/")] = CachedResponse(to_json_plotly(body))
+
+    def _check_router(self) -> None:
+        """
+        Check that Dash registered the page routing callback this cache answers for.
+
+        Dash registers it on the first request, so this runs in the first
+        ``serve_page`` call. Page caching is disabled if the output does not match.
+        """
+        self._router_checked = True
+        entry = self.app.callback_map.get(PAGES_ROUTER_OUTPUT)
+        if entry is None:
+            logger.error("Page routing callback %s not found, page layout cache disabled", PAGES_ROUTER_OUTPUT)
+            self.pages = {}
+            return
+        # Cached navigations count as executions of the routing callback in metrics and traces
+        self._router_name = callback_label(entry.get("callback"))
+        serve = CachedResponse.to_response
+        self._serve = self.metrics.instrument(serve, self._router_name) if self.metrics else serve
+
+    def serve_shell(self) -> flask.Response:
+        """View function replacing ``/_dash-layout``."""
+        return self.shell.to_response()
+
+    def serve_page(self) -> Optional[flask.Response]:
+        """
+        Answer the page routing callback from the cache (``before_request`` hook).
+
+        Returns:
+            Optional[flask.Response]: Cached response, or None to let Dash handle the request.
+        """
+        if flask.request.method != "POST" or not flask.request.path.endswith("_dash-update-component"):
+            return None
+        if not self._router_checked:
+            self._check_router()
+        if not self.pages:
+            return None
+
+        body: Dict[str, Any] = flask.request.get_json(silent=True) or {}
+        if not body.get("output", "").startswith(f"..{PAGES_CONTENT_ID}.children"):
+            return None
+
+        pathname = next(
+            (item.get("value") for item in body.get("inputs", [])
+             if isinstance(item, dict) and item.get("id") == PAGES_LOCATION_ID
+             and item.get("property") == "pathname"),
+            None,
+        )
+        if pathname is None:
+            return None
+
+        cached = self.pages.get(self.app.strip_relative_path(pathname) or "")
+        if cached is None:
+            return None
+        with span(f"callback.{self._router_name}", cached=True):
+            return self._serve(cached)
+
+
+def _dash_version_verified() -> bool:
+    """True if the installed Dash version is one the page routing format was verified against."""
+    version = tuple(int(part) for part in dash.__version__.split(".")[:2])
+    return VERIFIED_DASH_VERSIONS[0] <= version <= VERIFIED_DASH_VERSIONS[1]
+
+
+def install_layout_cache(app: dash.Dash, metrics: Optional[CallbackMetrics] = None) -> Optional[StaticLayoutCache]:
+    """
+    Serialize the static layouts once and serve them from the cache.
+
+    The app shell is always cached; page layouts only with a verified Dash
+    version (VERIFIED_DASH_VERSIONS) and ``dash.page_container`` in the layout.
+
+    Args:
+        app (dash.Dash): Dash app with its layout set and pages registered.
+        metrics (Optional[CallbackMetrics]): Callback metrics that cached page
+            navigations are recorded in.
+
+    Returns:
+        Optional[StaticLayoutCache]: The installed cache (None if disabled).
+    """
+    if not LAYOUT_CACHE_ENABLED:
+        return None
+
+    cache = StaticLayoutCache(app, metrics)
+    cache.build()
+    layout_json = cache.shell.body.decode("utf-8") if cache.shell else ""
+    if not _dash_version_verified():
+        logger.warning("Dash %s is not verified for the page layout cache, pages are not cached", dash.__version__)
+        cache.pages = {}
+    elif f'"{PAGES_CONTENT_ID}"' not in layout_json or f'"{PAGES_LOCATION_ID}"' not in layout_json:
+        logger.warning("dash.page_container not found in the app layout, pages are not cached")
+        cache.pages = {}
+
+    if cache.shell is not None:
+        endpoint = next(
+            rule.endpoint for rule in app.server.url_map.iter_rules()
+            if rule.rule.endswith("_dash-layout")
+        )
+        app.server.view_functions[endpoint] = cache.serve_shell
+    app.server.before_request(cache.serve_page)
+    return cache
+
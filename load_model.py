@@ -0,0 +1,517 @@
+from datetime import date, timedelta
+from functools import lru_cache
+import json
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from catalog import Catalog, current_catalog, on_catalog_change
+from tracing import traced
+
+# EWMA spans (in days) for the acute (fatigue) and chronic (fitness) load
+ACUTE_SPAN_DAYS = 7
+CHRONIC_SPAN_DAYS = 28
+
+# Effective load (in %) above which a muscle group counts as overloaded
+OVERLOAD_THRESHOLD = 75
+
+# Acute:chronic ratio above which the load increase is considered risky.
+# The ratio is only meaningful once enough history has been logged.
+ACWR_THRESHOLD = 1.5
+ACWR_MIN_HISTORY_DAYS = 7
+
+# Repetitions of a nominal session (3 × 10 work sets) that yields volume factor 1.0
+REFERENCE_REPS = 30
+
+# Days per decay-weight matrix of ``ewma`` (longer histories are split into blocks)
+EWMA_BLOCK_DAYS = 128
+
+# Signature of a volume weighting formula:
+# (entry index per set, reps per set, weight per set, number of entries) -> factor per entry
+VolumeWeighting = Callable[[np.ndarray, np.ndarray, np.ndarray, int], np.ndarray]
+
+
+def ewma_alpha(span: int) -> float:
+    """
+    Smoothing factor of an exponentially weighted moving average.
+
+    Args:
+        span (int): Span in days (alpha = 2 / (span + 1)).
+
+    Returns:
+        float: Smoothing factor alpha.
+    """
+    return 2 / (span + 1)
+
+
+def ewma(loads: np.ndarray, span: int, initial: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Compute the EWMA of a days × muscles load matrix in vectorized blocks.
+
+    Instead of iterating over the days, the recursion
+    ``s[t] = alpha * x[t] + (1 - alpha) * s[t - 1]`` (with ``s[-1] = initial``,
+    default 0) is expressed as a lower-triangular decay-weight matrix that is
+    multiplied with the load matrix, covering all muscles at once. Any
+    further axes (e.g. scenarios) are smoothed in the same product. Long
+    histories are processed in blocks of EWMA_BLOCK_DAYS, each starting from
+    the last state of the previous block, so time and memory grow linearly
+    with the number of days.
+
+    Args:
+        loads (np.ndarray): Daily loads with shape (days, ...), e.g. (days, muscles).
+        span (int): EWMA span in days.
+        initial (Optional[np.ndarray]): State before the first day (broadcast to ``loads.shape[1:]``).
+
+    Returns:
+        np.ndarray: Smoothed loads with the same shape as ``loads``.
+    """
+    alpha = ewma_alpha(span)
+    block_days = min(loads.shape[0], EWMA_BLOCK_DAYS)
+    lag = np.arange(block_days)[:, None] - np.arange(block_days)[None, :]
+    weights = np.where(lag >= 0, alpha * (1 - alpha) ** np.clip(lag, 0, None), 0.0)
+    decay = ((1 - alpha) ** np.arange(1, block_days + 1)).reshape((-1,) + (1,) * (loads.ndim - 1))
+
+    smoothed = np.empty(loads.shape, dtype=float)
+    for start in range(0, loads.shape[0], EWMA_BLOCK_DAYS):
+        block = loads[start:start + EWMA_BLOCK_DAYS]
+        n_days = block.shape[0]
+        smoothed[start:start + n_days] = np.tensordot(weights[:n_days, :n_days], block, axes=1)
+        if initial is not None:
+            smoothed[start:start + n_days] += decay[:n_days] * initial
+        initial = smoothed[start + n_days - 1]
+    return smoothed
+
+
+def _to_float(value: Any) -> float:
+    """Parse a grid cell (number, numeric string or empty) into a float (NaN if empty)."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def intensity_weighted_reps(
+    entry_idx: np.ndarray,
+    reps: np.ndarray,
+    weight: np.ndarray,
+    n_entries: int,
+) -> np.ndarray:
+    """
+    Default volume weighting: intensity-weighted repetitions per exercise entry.
+
+    Every set contributes its repetitions scaled by its weight relative to
+    the heaviest set of the same entry, so warm-up sets count less than work
+    sets. Sets without weight (e.g. body weight exercises) count fully. The
+    sum is normalized by REFERENCE_REPS, i.e. 3 × 10 work sets yield 1.0.
+
+    Args:
+        entry_idx (np.ndarray): Entry index of every logged set.
+        reps (np.ndarray): Repetitions of every set.
+        weight (np.ndarray): Weight of every set (NaN if not given).
+        n_entries (int): Number of exercise entries.
+
+    Returns:
+        np.ndarray: Volume factor per entry.
+    """
+    weight = np.nan_to_num(weight)
+    top_weight = np.zeros(n_entries)
+    np.maximum.at(top_weight, entry_idx, weight)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        relative = np.where(top_weight[entry_idx] > 0, weight / top_weight[entry_idx], 1.0)
+    return np.bincount(entry_idx, weights=reps * relative, minlength=n_entries) / REFERENCE_REPS
+
+
+def volume_factors(
+    entries: List[Dict[str, Any]],
+    weighting: VolumeWeighting = intensity_weighted_reps,
+) -> np.ndarray:
+    """
+    Compute the volume factor of many exercise entries at once.
+
+    All logged sets (Satz/Wdh/Gewicht rows of the ``input-grid``) are
+    flattened into arrays and passed to ``weighting`` in one call. Entries
+    without any valid set (e.g. planned but not yet logged exercises) get
+    their planned ``volume`` or the nominal factor 1.0.
+
+    Args:
+        entries (List[Dict[str, Any]]): Entries ``{"exercise": <id>, "sets": [...]}``
+            or planned entries ``{"exercise": <id>, "volume": <factor>}``.
+        weighting (VolumeWeighting): Weighting formula.
+
+    Returns:
+        np.ndarray: Volume factor per entry.
+    """
+    entry_idx, reps, weight = [], [], []
+    for i, entry in enumerate(entries):
+        for row in entry.get("sets") or []:
+            row_reps = _to_float(row.get("Wdh"))
+            if row_reps > 0:
+                entry_idx.append(i)
+                reps.append(row_reps)
+                weight.append(_to_float(row.get("Gewicht")))
+
+    factors = np.array([float(entry.get("volume", 1.0)) for entry in entries])
+    if entry_idx:
+        entry_idx = np.asarray(entry_idx, dtype=int)
+        weighted = weighting(entry_idx, np.asarray(reps), np.asarray(weight), len(entries))
+        logged = np.unique(entry_idx)
+        factors[logged] = weighted[logged]
+    return factors
+
+
+def session_loads(
+    entries: List[Dict[str, Any]],
+    weighting: VolumeWeighting = intensity_weighted_reps,
+    catalog: Optional[Catalog] = None,
+) -> np.ndarray:
+    """
+    Compute the load vector of one session.
+
+    The volume factors of all entries are accumulated per exercise and
+    multiplied with the catalog's muscle matrix in a single matrix product.
+
+    Args:
+        entries (List[Dict[str, Any]]): Entries of the session. Unknown exercises are ignored.
+        weighting (VolumeWeighting): Weighting formula.
+        catalog (Optional[Catalog]): Exercise catalog (defaults to the current one).
+
+    Returns:
+        np.ndarray: Load per muscle (in catalog muscle order).
+    """
+    catalog = catalog or current_catalog()
+    row_index = catalog.row_index
+    entries = [entry for entry in entries if entry.get("exercise") in row_index]
+    exercise_weights = np.zeros(len(row_index))
+    np.add.at(
+        exercise_weights,
+        np.asarray([row_index[entry["exercise"]] for entry in entries], dtype=int),
+        volume_factors(entries, weighting),
+    )
+    return exercise_weights @ catalog.matrix
+
+
+def daily_load_matrix(
+    training_log: Dict[str, List[Dict[str, Any]]],
+    start: date,
+    end: date,
+    weighting: VolumeWeighting = intensity_weighted_reps,
+    catalog: Optional[Catalog] = None,
+) -> np.ndarray:
+    """
+    Build the days × muscles load matrix for a training log.
+
+    The volume factors of the whole history are computed in one batch,
+    accumulated into a days × exercises weight matrix and multiplied with
+    the catalog's muscle matrix once.
+
+    Args:
+        training_log (Dict[str, List[Dict[str, Any]]]): Mapping of ISO dates to
+            logged entries (``{"exercise": <id>, "sets": [...]}``).
+        start (date): First day of the matrix.
+        end (date): Last day of the matrix (exclusive).
+        weighting (VolumeWeighting): Weighting formula.
+        catalog (Optional[Catalog]): Exercise catalog (defaults to the current one).
+
+    Returns:
+        np.ndarray: Daily loads with shape ((end - start).days, muscles).
+    """
+    catalog = catalog or current_catalog()
+    row_index = catalog.row_index
+    n_days = max((end - start).days, 0)
+
+    day_idx, entries = [], []
+    for day, day_entries in training_log.items():
+        offset = (date.fromisoformat(day) - start).days
+        if not 0 <= offset < n_days:
+            continue
+        for entry in day_entries:
+            if entry.get("exercise") in row_index:
+                day_idx.append(offset)
+                entries.append(entry)
+
+    exercise_weights = np.zeros((n_days, len(row_index)))
+    np.add.at(
+        exercise_weights,
+        (
+            np.asarray(day_idx, dtype=int),
+            np.asarray([row_index[entry["exercise"]] for entry in entries], dtype=int),
+        ),
+        volume_factors(entries, weighting),
+    )
+    return exercise_weights @ catalog.matrix
+
+
+def acute_chronic_ratio(acute: np.ndarray, chronic: np.ndarray, steps: np.ndarray) -> np.ndarray:
+    """
+    Bias-corrected acute:chronic workload ratio.
+
+    Both EWMAs start at zero, so they are bias-corrected by
+    ``1 - (1 - alpha) ** steps`` before dividing; otherwise the slower
+    chronic average would inflate the ratio during the first weeks.
+
+    Args:
+        acute (np.ndarray): Acute EWMA with shape (days, ...).
+        chronic (np.ndarray): Chronic EWMA with the same shape.
+        steps (np.ndarray): Number of days since the start of the history, per row (1-based).
+
+    Returns:
+        np.ndarray: Ratio with the shape of ``acute``; NaN where there is no chronic load.
+    """
+    steps = np.asarray(steps).reshape((-1,) + (1,) * (acute.ndim - 1))
+    acute = acute / (1 - (1 - ewma_alpha(ACUTE_SPAN_DAYS)) ** steps)
+    chronic = chronic / (1 - (1 - ewma_alpha(CHRONIC_SPAN_DAYS)) ** steps)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(chronic > 0, acute / chronic, np.nan)
+
+
+class MuscleLoadModel:
+    """
+    Exponentially weighted acute and chronic muscle load over a daily history.
+
+    Attributes:
+        start (date): Date of the first row.
+        daily (np.ndarray): Raw daily loads (days × muscles).
+        acute (np.ndarray): Acute EWMA (days × muscles).
+        chronic (np.ndarray): Chronic EWMA (days × muscles).
+    """
+
+    def __init__(self, daily_loads: np.ndarray, start: date):
+        self.start = start
+        self.daily = np.atleast_2d(np.asarray(daily_loads, dtype=float))
+        self.acute = ewma(self.daily, ACUTE_SPAN_DAYS)
+        self.chronic = ewma(self.daily, CHRONIC_SPAN_DAYS)
+
+    @classmethod
+    def from_training_log(
+        cls,
+        training_log: Dict[str, List[Dict[str, Any]]],
+        end: date,
+        weighting: VolumeWeighting = intensity_weighted_reps,
+        catalog: Optional[Catalog] = None,
+    ) -> "MuscleLoadModel":
+        """
+        Build the model for all logged days before ``end``.
+
+        Args:
+            training_log (Dict[str, List[Dict[str, Any]]]): Logged sessions per ISO date.
+            end (date): First day that is not part of the history.
+            weighting (VolumeWeighting): Volume weighting formula.
+            catalog (Optional[Catalog]): Exercise catalog (defaults to the current one).
+
+        Returns:
+            MuscleLoadModel: Model covering the logged history.
+        """
+        days = [date.fromisoformat(day) for day in training_log]
+        start = min([d for d in days if d < end], default=end)
+        return cls(daily_load_matrix(training_log, start, end, weighting, catalog), start)
+
+    @property
+    def n_days(self) -> int:
+        """Number of days covered by the model."""
+        return self.daily.shape[0]
+
+    @property
+    def end(self) -> date:
+        """Day after the last row of the model."""
+        return self.start + timedelta(days=self.n_days)
+
+    def copy(self) -> "MuscleLoadModel":
+        """Return an independent copy (e.g. before appending to a cached model)."""
+        model = MuscleLoadModel.__new__(MuscleLoadModel)
+        model.start = self.start
+        model.daily = self.daily.copy()
+        model.acute = self.acute.copy()
+        model.chronic = self.chronic.copy()
+        return model
+
+    def append_day(self, loads: np.ndarray) -> None:
+        """
+        Append one day and update both EWMAs incrementally from the last state.
+
+        Args:
+            loads (np.ndarray): Raw loads of the new day (in catalog muscle order).
+        """
+        loads = np.asarray(loads, dtype=float).reshape(1, -1)
+        new_rows = []
+        for ewma_rows, span in ((self.acute, ACUTE_SPAN_DAYS), (self.chronic, CHRONIC_SPAN_DAYS)):
+            alpha = ewma_alpha(span)
+            previous = ewma_rows[-1] if len(ewma_rows) else np.zeros(loads.shape[1])
+            new_rows.append(alpha * loads + (1 - alpha) * previous)
+
+        self.daily = np.vstack([self.daily, loads])
+        self.acute = np.vstack([self.acute, new_rows[0]])
+        self.chronic = np.vstack([self.chronic, new_rows[1]])
+
+    def acwr(self) -> np.ndarray:
+        """
+        Acute:chronic workload ratio for every day and muscle.
+
+        Returns:
+            np.ndarray: Ratio (days × muscles); NaN where there is no chronic load.
+        """
+        return acute_chronic_ratio(self.acute, self.chronic, np.arange(1, self.n_days + 1))
+
+    def effective_loads(self) -> np.ndarray:
+        """
+        Exponentially decayed cumulative load for every day and muscle.
+
+        This is the acute EWMA rescaled by ``1 / alpha``, so a single session
+        without prior history yields exactly its raw muscle matrix score.
+
+        Returns:
+            np.ndarray: Effective loads (days × muscles) in %.
+        """
+        return self.acute / ewma_alpha(ACUTE_SPAN_DAYS)
+
+
+@lru_cache(maxsize=64)
+def _history_model(training_log_json: str, end: str, weighting: VolumeWeighting, catalog: Catalog) -> MuscleLoadModel:
+    """Build (and cache) the history model for a serialized training log and catalog."""
+    return MuscleLoadModel.from_training_log(
+        json.loads(training_log_json), date.fromisoformat(end), weighting, catalog
+    )
+
+
+def history_model(
+    training_log: Dict[str, List[Dict[str, Any]]],
+    end: date,
+    weighting: VolumeWeighting = intensity_weighted_reps,
+    catalog: Optional[Catalog] = None,
+) -> MuscleLoadModel:
+    """
+    Return the (cached) load model of all logged days before ``end``.
+
+    The model is shared between requests and must not be modified; use
+    ``MuscleLoadModel.copy`` before appending days.
+
+    Args:
+        training_log (Dict[str, List[Dict[str, Any]]]): Logged sessions per ISO date.
+        end (date): First day that is not part of the history.
+        weighting (VolumeWeighting): Volume weighting formula.
+        catalog (Optional[Catalog]): Exercise catalog (defaults to the current one).
+
+    Returns:
+        MuscleLoadModel: Cached history model.
+    """
+    # Only days before ``end`` are part of the model, so logging today keeps the cache entry
+    history = {day: entries for day, entries in training_log.items() if day < end.isoformat()}
+    return _history_model(
+        json.dumps(history, sort_keys=True), end.isoformat(), weighting, catalog or current_catalog()
+    )
+
+
+# Cached models are keyed by catalog, so a reloaded catalog never sees stale
+# models; dropping them just frees the memory of the old version early
+on_catalog_change(lambda catalog: _history_model.cache_clear())
+
+
+def recompute_history(
+    training_logs: Dict[str, Dict[str, List[Dict[str, Any]]]],
+    weighting: VolumeWeighting = intensity_weighted_reps,
+    end: Optional[date] = None,
+) -> Dict[str, MuscleLoadModel]:
+    """
+    Batch-recompute the load history of one or more training logs.
+
+    Intended for when the weighting formula changes: each log is rebuilt
+    with one batched volume computation and one matrix product, and the
+    cached history models are dropped.
+
+    Args:
+        training_logs (Dict[str, Dict[str, List[Dict[str, Any]]]]): Training logs by user/key.
+        weighting (VolumeWeighting): Volume weighting formula.
+        end (Optional[date]): First day not included (defaults to tomorrow, i.e. all logged days).
+
+    Returns:
+        Dict[str, MuscleLoadModel]: Recomputed model per key.
+    """
+    _history_model.cache_clear()
+    end = end or date.today() + timedelta(days=1)
+    return {
+        key: MuscleLoadModel.from_training_log(training_log, end, weighting)
+        for key, training_log in training_logs.items()
+    }
+
+
+@traced("load_model.compute_muscle_loads")
+def compute_muscle_loads(
+    training_log: Optional[Dict[str, List[Dict[str, Any]]]],
+    exercise_ids: Optional[List[str]],
+    factor: float = 1.0,
+    today: Optional[date] = None,
+    weighting: VolumeWeighting = intensity_weighted_reps,
+    catalog: Optional[Catalog] = None,
+) -> pd.DataFrame:
+    """
+    Compute today's per-muscle load from the logged history and today's plan.
+
+    The history before ``today`` is cached; today's sessions (logged entries
+    plus selected exercises that are not logged yet) are appended incrementally.
+
+    Args:
+        training_log (Optional[Dict[str, List[Dict[str, Any]]]]): Logged sessions per ISO date.
+        exercise_ids (Optional[List[str]]): Exercises selected for today.
+        factor (float): Recovery factor applied to the effective load.
+        today (Optional[date]): Reference day (defaults to today).
+        weighting (VolumeWeighting): Volume weighting formula for logged sets.
+        catalog (Optional[Catalog]): Exercise catalog (defaults to the current one).
+
+    Returns:
+        pd.DataFrame: Indexed by muscle with the columns ``load`` (effective load
+        in %, scaled by ``factor``), ``acute``, ``chronic`` and ``acwr``.
+        The attribute ``history_days`` holds the number of days before today.
+    """
+    today = today or date.today()
+    training_log = training_log or {}
+    catalog = catalog or current_catalog()
+
+    history = history_model(training_log, today, weighting, catalog)
+    model = history.copy()
+
+    logged_today = training_log.get(today.isoformat(), [])
+    logged_ids = {entry["exercise"] for entry in logged_today}
+    planned = [{"exercise": ex_id} for ex_id in exercise_ids or [] if ex_id not in logged_ids]
+    model.append_day(session_loads(logged_today + planned, weighting, catalog))
+
+    loads = pd.DataFrame(
+        {
+            "load": model.effective_loads()[-1] * factor,
+            "acute": model.acute[-1],
+            "chronic": model.chronic[-1],
+            "acwr": model.acwr()[-1],
+        },
+        index=catalog.muscles,
+    )
+    loads.attrs["history_days"] = history.n_days
+    return loads
+
+
+def overloaded_muscles(loads: pd.DataFrame) -> pd.DataFrame:
+    """
+    Select muscles that are overloaded or whose load rises too quickly.
+
+    Args:
+        loads (pd.DataFrame): Result of ``compute_muscle_loads``.
+
+    Returns:
+        pd.DataFrame: Flagged rows, sorted by effective load (descending).
+    """
+    return loads[overload_flags(loads)].sort_values("load", ascending=False)
+
+
+def overload_flags(loads: pd.DataFrame) -> np.ndarray:
+    """
+    Flag every muscle that ``overloaded_muscles`` would select.
+
+    Args:
+        loads (pd.DataFrame): Result of ``compute_muscle_loads``.
+
+    Returns:
+        np.ndarray: Boolean flag per row of ``loads``.
+    """
+    flagged = loads["load"].to_numpy() > OVERLOAD_THRESHOLD
+    if loads.attrs.get("history_days", 0) >= ACWR_MIN_HISTORY_DAYS:
+        flagged |= loads["acwr"].to_numpy() > ACWR_THRESHOLD
+    return flagged
+
@@ -0,0 +1,198 @@
+import bisect
+import functools
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import dash
+import flask
+
+# Histogram bucket upper bounds
+LATENCY_BUCKETS: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PAYLOAD_BUCKETS: Tuple[float, ...] = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+METRICS_PREFIX = "bayhealth_callback"
+
+
+class Histogram:
+    """Cumulative Prometheus-style histogram with fixed buckets (not thread-safe on its own)."""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot: +Inf
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+
+    def render(self, name: str, labels: str) -> List[str]:
+        """Render the histogram in the Prometheus text format."""
+        lines, cumulative = [], 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            lines.append(f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+        lines.append(f"{name}_sum{{{labels}}} {self.total}")
+        lines.append(f"{name}_count{{{labels}}} {cumulative}")
+        return lines
+
+
+class CallbackMetrics:
+    """
+    Per-callback latency, payload size, exception and in-flight metrics.
+
+    Recording only updates a few counters under a lock; the text exposition
+    is built when ``/metrics`` is scraped, so the cost stays negligible when
+    nobody scrapes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latency: Dict[str, Histogram] = defaultdict(lambda: Histogram(LATENCY_BUCKETS))
+        self.request_bytes: Dict[str, Histogram] = defaultdict(lambda: Histogram(PAYLOAD_BUCKETS))
+        self.response_bytes: Dict[str, Histogram] = defaultdict(lambda: Histogram(PAYLOAD_BUCKETS))
+        self.exceptions: Dict[str, int] = defaultdict(int)
+        self.in_flight: Dict[str, int] = defaultdict(int)
+
+    def instrument(self, func: Callable[..., Any], name: str) -> Callable[..., Any]:
+        """
+        Wrap a callback function to record latency, exceptions and in-flight executions.
+
+        Args:
+            func (Callable): Callback function as stored in ``app.callback_map``.
+            name (str): Label value for the callback.
+
+        Returns:
+            Callable: Instrumented function.
+        """
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with self._lock:
+                self.in_flight[name] += 1
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except dash.exceptions.PreventUpdate:
+                raise
+            except Exception:
+                with self._lock:
+                    self.exceptions[name] += 1
+                raise
+            finally:
+                elapsed = time.perf_counter() - start
+                with self._lock:
+                    self.in_flight[name] -= 1
+                    self.latency[name].observe(elapsed)
+
+        wrapper.metrics_name = name
+        return wrapper
+
+    def observe_payload(self, name: str, request_bytes: int, response_bytes: int) -> None:
+        """Record the request and response body size of one callback request."""
+        with self._lock:
+            self.request_bytes[name].observe(request_bytes)
+            self.response_bytes[name].observe(response_bytes)
+
+    def render(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: Metrics text.
+        """
+        with self._lock:
+            lines = []
+            for suffix, help_text, histograms in (
+                ("latency_seconds", "Callback execution time in seconds.", self.latency),
+                ("request_bytes", "Callback request body size in bytes.", self.request_bytes),
+                ("response_bytes", "Callback response body size in bytes.", self.response_bytes),
+            ):
+                metric = f"{METRICS_PREFIX}_{suffix}"
+                lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} histogram"]
+                for name, histogram in sorted(histograms.items()):
+                    lines += histogram.render(metric, f'callback="{name}"')
+
+            for suffix, metric_type, help_text, values in (
+                ("exceptions_total", "counter", "Callback executions that raised an exception.", self.exceptions),
+                ("in_flight", "gauge", "Callback executions currently running.", self.in_flight),
+            ):
+                metric = f"{METRICS_PREFIX}_{suffix}"
+                lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} {metric_type}"]
+                for name, value in sorted(values.items()):
+                    lines.append(f'{metric}{{callback="{name}"}} {value}')
+
+        return "\n".join(lines) + "\n"
+
+
+def callback_name(app: dash.Dash, output: Optional[str]) -> str:
+    """Label of the callback registered for an output key (``unknown`` if not found)."""
+    entry = app.callback_map.get(output or "")
+    if entry is None:
+        return "unknown"
+    return callback_label(entry.get("callback"))
+
+
+def callback_label(func: Callable[..., Any]) -> str:
+    """Name of a (possibly already wrapped) callback function."""
+    return getattr(func, "metrics_name", None) or getattr(func, "__name__", "unknown")
+
+
+def wrap_callbacks(app: dash.Dash, instrument: Callable[[Callable[..., Any], str], Callable[..., Any]]) -> None:
+    """
+    Wrap every server-side callback of the app once, on the first request.
+
+    Dash copies the callbacks registered with ``dash.callback`` into
+    ``app.callback_map`` in a ``before_request`` hook, so the wrapping is
+    done in a hook registered after it. Wrappers created with
+    ``functools.wraps`` keep the callback label of the wrapped function.
+
+    Args:
+        app (dash.Dash): Dash application.
+        instrument (Callable): Called with the callback function and its label, returns the wrapper.
+    """
+    state = {"wrapped": False}
+
+    @app.server.before_request
+    def wrap_registered_callbacks() -> None:
+        if state["wrapped"]:
+            return
+        state["wrapped"] = True
+        for entry in app.callback_map.values():
+            func = entry.get("callback")
+            if func is not None:
+                entry["callback"] = instrument(func, callback_label(func))
+
+
+def install_metrics(app: dash.Dash) -> CallbackMetrics:
+    """
+    Instrument all server-side callbacks of the app and expose ``/metrics``.
+
+    Args:
+        app (dash.Dash): Dash application.
+
+    Returns:
+        CallbackMetrics: The metrics registry.
+    """
+    metrics = CallbackMetrics()
+    server = app.server
+    wrap_callbacks(app, metrics.instrument)
+
+    @server.after_request
+    def record_payload(response: flask.Response) -> flask.Response:
+        if flask.request.path.endswith("_dash-update-component") and flask.request.method == "POST":
+            body = flask.request.get_json(silent=True) or {}
+            metrics.observe_payload(
+                callback_name(app, body.get("output")),
+                flask.request.content_length or 0,
+                response.calculate_content_length() or 0,
+            )
+        return response
+
+    @server.route("/metrics")
+    def metrics_endpoint() -> flask.Response:
+        return flask.Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
+    return metrics
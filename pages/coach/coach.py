@@ -0,0 +1,140 @@
+import operator
+from typing import Any, Callable, Dict, List, Optional
+
+import dash
+from dash import Input, Output
+import numpy as np
+import pandas as pd
+
+from athletes import COACH_DASHBOARD_ENABLED, athlete_table
+from pages.coach.layout import create_layout
+from tracing import span
+
+if COACH_DASHBOARD_ENABLED:
+    dash.register_page(__name__)
+layout = create_layout()
+
+NUMBER_FILTERS: Dict[str, Callable[[pd.Series, Any], pd.Series]] = {
+    "equals": operator.eq,
+    "notEqual": operator.ne,
+    "lessThan": operator.lt,
+    "lessThanOrEqual": operator.le,
+    "greaterThan": operator.gt,
+    "greaterThanOrEqual": operator.ge,
+}
+
+TEXT_FILTERS: Dict[str, Callable[[pd.Series, str], pd.Series]] = {
+    "contains": lambda values, text: values.str.contains(text, regex=False),
+    "notContains": lambda values, text: ~values.str.contains(text, regex=False),
+    "equals": lambda values, text: values == text,
+    "notEqual": lambda values, text: values != text,
+    "startsWith": lambda values, text: values.str.startswith(text),
+    "endsWith": lambda values, text: values.str.endswith(text),
+}
+
+
+def condition_mask(column: pd.Series, condition: Dict[str, Any]) -> pd.Series:
+    """
+    Evaluate one AG Grid filter condition (text or number filter) on a column.
+
+    Args:
+        column (pd.Series): Column values.
+        condition (Dict[str, Any]): Condition, e.g. ``{"filterType": "number", "type": "greaterThan", "filter": 50}``.
+
+    Returns:
+        pd.Series: Boolean mask; unknown filter types match everything.
+    """
+    kind = condition.get("type")
+    if kind == "blank":
+        return column.isna() | (column.astype(str) == "")
+    if kind == "notBlank":
+        return column.notna() & (column.astype(str) != "")
+
+    if condition.get("filterType") == "number":
+        value = condition.get("filter")
+        if value is None:
+            return pd.Series(True, index=column.index)
+        if kind == "inRange":
+            return column.between(value, condition.get("filterTo", value))
+        if kind in NUMBER_FILTERS:
+            return NUMBER_FILTERS[kind](column, value).fillna(False)
+    elif kind in TEXT_FILTERS:
+        text = str(condition.get("filter") or "").lower()
+        return TEXT_FILTERS[kind](column.fillna("").astype(str).str.lower(), text)
+    return pd.Series(True, index=column.index)
+
+
+def filter_rows(frame: pd.DataFrame, filter_model: Optional[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Apply the AG Grid filter model (column filters, optionally combined with AND/OR).
+
+    Args:
+        frame (pd.DataFrame): Athlete table.
+        filter_model (Optional[Dict[str, Any]]): Filter model by column.
+
+    Returns:
+        pd.DataFrame: Matching rows.
+    """
+    mask = pd.Series(True, index=frame.index)
+    for column, model in (filter_model or {}).items():
+        if column not in frame:
+            continue
+        if "conditions" in model:
+            masks = [condition_mask(frame[column], condition) for condition in model["conditions"]]
+            combine = np.logical_or if model.get("operator") == "OR" else np.logical_and
+            mask &= combine.reduce(masks)
+        else:
+            mask &= condition_mask(frame[column], model)
+    return frame[mask]
+
+
+def sort_rows(frame: pd.DataFrame, sort_model: Optional[List[Dict[str, str]]]) -> pd.DataFrame:
+    """
+    Apply the AG Grid sort model (multi-column, in the given priority).
+
+    Args:
+        frame (pd.DataFrame): Athlete table.
+        sort_model (Optional[List[Dict[str, str]]]): ``[{"colId": ..., "sort": "asc"|"desc"}, ...]``.
+
+    Returns:
+        pd.DataFrame: Sorted rows (stable, so equal rows keep the table order).
+    """
+    sort_model = [item for item in sort_model or [] if item.get("colId") in frame]
+    if not sort_model:
+        return frame
+    return frame.sort_values(
+        [item["colId"] for item in sort_model],
+        ascending=[item.get("sort") != "desc" for item in sort_model],
+        kind="stable",
+        na_position="last",
+    )
+
+
+@dash.callback(
+    Output("coach-grid", "getRowsResponse"),
+    Input("coach-grid", "getRowsRequest"),
+)
+def load_athlete_rows(request: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Answer one block request of the infinite row model.
+
+    Sorting, filtering and slicing run on the precomputed athlete table,
+    so only the requested rows are sent to the browser.
+
+    Args:
+        request (Optional[Dict[str, Any]]): ``startRow``, ``endRow``, ``sortModel`` and ``filterModel``.
+
+    Returns:
+        Dict[str, Any]: ``rowData`` of the block and ``rowCount`` (number of matching rows).
+    """
+    if not request or not COACH_DASHBOARD_ENABLED:
+        raise dash.exceptions.PreventUpdate
+
+    with span("coach.rows", start=request.get("startRow"), end=request.get("endRow")) as current:
+        rows = sort_rows(filter_rows(athlete_table.frame(), request.get("filterModel")), request.get("sortModel"))
+        block = rows.iloc[request.get("startRow", 0):request.get("endRow", 0)]
+        current.set(matching=len(rows))
+        return {
+            "rowData": block.astype(object).where(block.notna(), None).to_dict("records"),
+            "rowCount": len(rows),
+        }
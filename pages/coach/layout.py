@@ -0,0 +1,73 @@
+import dash_ag_grid as dag
+import dash_bootstrap_components as dbc
+from dash import html
+
+from utils import create_footer, create_header
+
+# Rows per block requested from the server (one block = one page)
+PAGE_SIZE = 50
+
+COLUMN_DEFS = [
+    {"field": "athlete", "headerName": "Athlet", "filter": "agTextColumnFilter"},
+    {"field": "status", "headerName": "Status", "filter": "agTextColumnFilter", "maxWidth": 130},
+    {"field": "overloaded", "headerName": "Überlastete Muskeln", "filter": "agNumberColumnFilter", "maxWidth": 170},
+    {"field": "max_load", "headerName": "Max. Belastung %", "filter": "agNumberColumnFilter", "maxWidth": 160},
+    {"field": "top_muscles", "headerName": "Am stärksten belastet", "filter": "agTextColumnFilter", "minWidth": 280},
+    {"field": "readiness", "headerName": "Erholungsfaktor", "filter": "agNumberColumnFilter", "maxWidth": 150},
+    {"field": "last_training", "headerName": "Letztes Training", "filter": "agTextColumnFilter", "maxWidth": 160},
+    {"field": "sessions_7d", "headerName": "Einheiten (7 Tage)", "filter": "agNumberColumnFilter", "maxWidth": 160},
+]
+
+
+def create_layout() -> html.Div:
+    """
+    Create the coach dashboard layout.
+
+    The athlete table uses AG Grid's infinite row model: the grid requests
+    one block of rows at a time (including the current sort and filter
+    model) and the server answers with just these rows.
+
+    Returns:
+        html.Div: A Dash HTML Div containing the coach dashboard.
+    """
+    return html.Div(
+        dbc.Container(
+            [
+                create_header(label_link={"Bay Health": "/", "Coach-Übersicht": ""}),
+                dbc.Card(
+                    dbc.CardBody(
+                        [
+                            html.H2(
+                                "Coach-Übersicht",
+                                className="text-xl font-bold mb-6",
+                                style={"color": "rgb(69, 155, 112)"},
+                            ),
+                            html.P(
+                                "Belastungsstatus, am stärksten belastete Muskelgruppen und Erholung aller Athleten.",
+                                className="text-muted small",
+                            ),
+                            dag.AgGrid(
+                                id="coach-grid",
+                                columnDefs=COLUMN_DEFS,
+                                defaultColDef={"flex": 1, "minWidth": 110, "resizable": True, "sortable": True, "floatingFilter": True},
+                                rowModelType="infinite",
+                                dashGridOptions={
+                                    "cacheBlockSize": PAGE_SIZE,
+                                    "maxBlocksInCache": 4,
+                                    "pagination": True,
+                                    "paginationPageSize": PAGE_SIZE,
+                                    "paginationPageSizeSelector": False,
+                                    "rowBuffer": 0,
+                                },
+                                className="ag-theme-alpine",
+                                style={"height": "600px", "width": "100%"},
+                            ),
+                        ]
+                    ),
+                    className="bg-white p-6 rounded-2xl shadow max-w-[90rem] mx-auto mt-8",
+                ),
+                create_footer(),
+            ],
+            fluid=True,
+        )
+    )
@@ -1,86 +1,76 @@
 import os
+import threading
 import time
 import xml.etree.ElementTree as ET
-from typing import Dict, List, Any
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple
 
 import dash
-from dash import html, Input, Output, State, ctx, MATCH, ALL
+from dash import html, Input, Output, State, ClientsideFunction, MATCH, ALL
 import dash_bootstrap_components as dbc
-from dotenv import load_dotenv
-from mistralai import Mistral
 
 from pages.exercises.layout import create_layout
-from constants import MUSCLE_SVG_MAPPING, MUSCLE_MATRIX
+from catalog import current_catalog
+from classification import color_scale
+from constants import EXERCISES, MUSCLE_SVG_MAPPING
+from load_model import compute_muscle_loads
+from planner import optimize_plan
+from readiness import readiness_factor
+from session_store import session_store
+from store_codec import decode_exercises, decode_ratings, encode_exercises
+from substitution import find_sparing_substitutes
+from tracing import span
+
+if TYPE_CHECKING:
+    from mistralai import Mistral
 
 # Dash Page Registration
 dash.register_page(__name__)
 layout = create_layout()
 
-# Load environment variables and Mistral setup
-load_dotenv()
-api_key = os.environ.get("MISTRAL_API_KEY")
+# Mistral setup (the client is created on first use, see get_client)
 model = "mistral-small-latest"
-client = Mistral(api_key=api_key)
+_client: "Mistral | None" = None
+_client_lock = threading.Lock()
 
+EXERCISE_TITLES: Dict[str, str] = {ex["id"]: ex["title"] for ex in EXERCISES}
 
-def classify_score(score: float) -> str:
+
+def get_client() -> "Mistral":
     """
-    Classify a numeric muscle load score into a specific color code.
+    Return the shared Mistral client, creating it on first use.
 
-    Args:
-        score (float): Calculated load score for the muscle.
+    Importing ``mistralai`` and loading the ``.env`` file take a large part
+    of the app's import time, so both are deferred until the first LLM call
+    (or the LLM connection warm-up).
 
     Returns:
-        str: Corresponding hex color code for visualization.
+        Mistral: The client.
     """
-    if score < 10:
-        return "#5cf3aa"  # light green
-    elif score < 40:
-        return "#33b535ff"  # green
-    elif score < 70:
-        return "#f1f826"  # yellow
-    elif score < 100:
-        return "#dda304"  # orange
-    elif score < 130:
-        return "#f71c1c"  # red
-    else:
-        return "#7f0400"  # dark red
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                from dotenv import load_dotenv
+                from mistralai import Mistral
 
+                load_dotenv()
+                _client = Mistral(api_key=os.environ.get("MISTRAL_API_KEY"))
+    return _client
 
-@dash.callback(
-    Output({"type": "exercise-output", "index": MATCH}, "children"),
-    Input({"type": "exercise-img", "index": MATCH}, "n_clicks"),
-    State("health_state", "data"),
-    State({"type": "exercise-img", "index": MATCH}, "id"),
-)
-def analyze_exercise(
-    n_clicks: int,
-    health_data: Dict[str, Any],
-    img_id: Dict[str, str]
-):
-    """
-    Analyze whether a selected exercise is suitable based on the user's health state.
-    Uses Mistral AI for natural language assessment.
 
-    Returns:
-        - A recommendation card with a traffic light (🔴 🟡 🟢) and explanation.
-        - If no health data is provided, a warning alert is returned.
+def build_prompt(complaints_text: str, exercise: str) -> str:
     """
-    if not n_clicks:
-        return ""
-
-    if health_data is None:
-        return dbc.Alert("⚠️ Bitte zuerst deinen Gesundheitszustand eingeben.", color="warning")
+    Build the LLM prompt for assessing an exercise given the user's complaints.
 
-    complaints_text = (
-        (health_data.get("longterm_text") or "")
-        + " "
-        + (health_data.get("shortterm_text") or "")
-    ).strip()
-    exercise = img_id["index"]
+    Args:
+        complaints_text (str): Long-term and short-term complaints.
+        exercise (str): Exercise ID.
 
+    Returns:
+        str: Prompt text.
+    """
     # Prompt (left exactly as you provided)
-    prompt = (
+    return (
         f"Beschwerden: {complaints_text if complaints_text else 'keine'}\n"
         f"Übung: {exercise}\n\n"
         """Du bist ein erfahrener Sportwissenschaftler und Fitnesscoach. Eine Person fragt dich, ob sie eine bestimmte Übung durchführen kann. Sie beschreibt ihre Beschwerden – dabei können sowohl chronische (langfristige) als auch akute (heutige) Probleme vorkommen.
@@ -146,16 +136,79 @@ def analyze_exercise(
     """
     )
 
+
+def create_substitutes_list(exercise: str) -> html.Div:
+    """
+    List alternatives that spare the muscles the exercise loads most.
+
+    Args:
+        exercise (str): Exercise ID rated 🔴 or 🟡.
+
+    Returns:
+        html.Div: Alternatives section (empty if there are none).
+    """
+    spared, substitutes = find_sparing_substitutes(exercise, k=3)
+    if not substitutes:
+        return html.Div()
+    return html.Div([
+        html.Small(f"Alternativen, die {', '.join(spared)} schonen:", className="text-muted"),
+        html.Ul(
+            [html.Li(f"{sub['title']} ({sub['similarity']:.0%} ähnlich)") for sub in substitutes],
+            className="small mb-0",
+        ),
+    ])
+
+
+@dash.callback(
+    Output({"type": "exercise-output", "index": MATCH}, "children"),
+    Input({"type": "exercise-img", "index": MATCH}, "n_clicks"),
+    State("session", "data"),
+    State({"type": "exercise-img", "index": MATCH}, "id"),
+)
+def analyze_exercise(
+    n_clicks: int,
+    session: Dict[str, Any],
+    img_id: Dict[str, str]
+):
+    """
+    Analyze whether a selected exercise is suitable based on the user's health state.
+    Uses Mistral AI for natural language assessment.
+
+    Returns:
+        - A recommendation card with a traffic light (🔴 🟡 🟢) and explanation.
+        - If no health data is provided, a warning alert is returned.
+    """
+    if not n_clicks:
+        return ""
+
+    health_data = session_store.get(session, "health_state")["health_state"]
+    if health_data is None:
+        return dbc.Alert("⚠️ Bitte zuerst deinen Gesundheitszustand eingeben.", color="warning")
+
+    complaints_text = (
+        (health_data.get("longterm_text") or "")
+        + " "
+        + (health_data.get("shortterm_text") or "")
+    ).strip()
+    exercise = img_id["index"]
+
+    with span("prompt.build", exercise=exercise) as current:
+        prompt = build_prompt(complaints_text, exercise)
+        current.set(prompt_chars=len(prompt))
+
     try:
-        chat_response = client.chat.complete(
-            model=model,
-            messages=[{"role": "user", "content": prompt}]
-        )
-        response_text = chat_response.choices[0].message.content.strip()
+        with span("mistral.chat", model=model, prompt_chars=len(prompt)) as current:
+            chat_response = get_client().chat.complete(
+                model=model,
+                messages=[{"role": "user", "content": prompt}]
+            )
+            response_text = chat_response.choices[0].message.content.strip()
+            current.set(response_chars=len(response_text))
 
         return dbc.Card(
             dbc.CardBody([
                 html.P(response_text, className="mb-3"),
+                create_substitutes_list(exercise) if response_text.startswith(("🔴", "🟡")) else None,
                 html.Div(
                     id={"type": "exercise-feedback", "index": img_id["index"]},
                     className="mt-2"
@@ -180,97 +233,198 @@ def show_added_feedback(n_clicks: int):
     raise dash.exceptions.PreventUpdate
 
 
+# Relay add-button clicks in the browser: only the clicked button's id reaches the server
+dash.clientside_callback(
+    ClientsideFunction(namespace="events", function_name="relay"),
+    Output("add-exercise-event", "data"),
+    Input({"type": "add-exercise-btn", "index": ALL}, "n_clicks"),
+    prevent_initial_call=True,
+)
+
+
 @dash.callback(
     Output("added-exercises", "data"),
-    Input({"type": "add-exercise-btn", "index": ALL}, "n_clicks"),
-    State({"type": "add-exercise-btn", "index": ALL}, "id"),
+    Input("add-exercise-event", "data"),
     State("added-exercises", "data"),
     prevent_initial_call=True
 )
 def store_added_exercise(
-    n_clicks_list: List[int],
-    ids: List[Dict[str, str]],
-    current_data: List[str]
-) -> List[str]:
-    """Store selected exercises in session state."""
-    if not any(n_clicks_list):
+    event: Dict[str, Any],
+    current_data: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Store selected exercises in session state (compact index encoding)."""
+    if not event:
         raise dash.exceptions.PreventUpdate
 
-    triggered = ctx.triggered_id
-    if not isinstance(triggered, dict) or "index" not in triggered:
+    ex_id = event["id"]["index"]
+    exercise_ids = decode_exercises(current_data)
+    if ex_id in exercise_ids:
         raise dash.exceptions.PreventUpdate
 
-    ex_id = triggered["index"]
-    if current_data is None:
-        current_data = []
-    if ex_id not in current_data:
-        current_data.append(ex_id)
+    return encode_exercises(exercise_ids + [ex_id])
+
+
+@dash.callback(
+    Output("plan-targets", "options"),
+    Output("plan-excluded", "options"),
+    Input("plan-targets", "id"),
+)
+def load_plan_muscles(_: str) -> Tuple[List[str], List[str]]:
+    """
+    Fill the muscle dropdowns of the plan section from the current catalog.
+
+    Runs on every page load, so a hot-reloaded catalog is picked up although
+    the page layout itself is built (and cached) once.
 
-    return current_data
+    Returns:
+        tuple: Muscle options for the target and the spared muscles.
+    """
+    muscles = sorted(current_catalog().muscles)
+    return muscles, muscles
+
+
+@dash.callback(
+    Output("plan-result", "children"),
+    Output("plan-suggestion", "data"),
+    Output("plan-apply-btn", "disabled"),
+    Input("plan-optimize-btn", "n_clicks"),
+    State("plan-targets", "value"),
+    State("plan-equipment", "value"),
+    State("plan-excluded", "value"),
+    State("added-exercises", "data"),
+    State("star-results", "data"),
+    State("session", "data"),
+    prevent_initial_call=True,
+)
+def suggest_plan(
+    n_clicks: int,
+    targets: Optional[List[str]],
+    equipment: Optional[List[str]],
+    excluded: Optional[List[str]],
+    added_exercises: Dict[str, Any],
+    star_results: Dict[str, Any],
+    session: Dict[str, Any],
+) -> Tuple[html.Div, List[str], bool]:
+    """
+    Suggest exercises that train the target muscles without overloading any muscle.
+
+    The logged history and the already selected exercises form the baseline
+    load; the readiness factor tightens the overload limit (see ``planner.optimize_plan``).
+
+    Returns:
+        tuple: Result section, suggested exercise IDs and whether "Plan übernehmen" is disabled.
+    """
+    if not targets:
+        return dbc.Alert("Bitte mindestens einen Zielmuskel auswählen.", color="warning"), [], True
+
+    exercise_ids = decode_exercises(added_exercises)
+    state = session_store.get(session, "training_log", "readiness")
+    star_factor = readiness_factor(state["readiness"], decode_ratings(star_results))
+    baseline = compute_muscle_loads(state["training_log"], exercise_ids)["load"]
+
+    plan = optimize_plan(
+        targets,
+        equipment=equipment or None,
+        excluded_muscles=excluded or (),
+        factor=star_factor,
+        baseline=baseline,
+        exclude_exercises=exercise_ids,
+    )
+    if not plan.exercise_ids:
+        return dbc.Alert(
+            "Keine passende Übung gefunden, ohne eine Muskelgruppe zu überlasten.", color="warning"
+        ), [], True
+
+    return html.Div([
+        html.P(f"Abdeckung der Zielmuskeln: {plan.coverage:.0%}", className="mb-1 fw-bold"),
+        html.Ol([html.Li(EXERCISE_TITLES.get(ex_id, ex_id)) for ex_id in plan.exercise_ids], className="small mb-1"),
+        html.Small(f"Höchste Belastung danach: {plan.loads.max():.0f} %", className="text-muted"),
+    ]), plan.exercise_ids, False
+
+
+@dash.callback(
+    Output("added-exercises", "data", allow_duplicate=True),
+    Input("plan-apply-btn", "n_clicks"),
+    State("plan-suggestion", "data"),
+    State("added-exercises", "data"),
+    prevent_initial_call=True,
+)
+def apply_plan(
+    n_clicks: int,
+    suggestion: List[str],
+    current_data: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Add the suggested exercises to the selection."""
+    exercise_ids = decode_exercises(current_data)
+    new_ids = [ex_id for ex_id in suggestion or [] if ex_id not in exercise_ids]
+    if not n_clicks or not new_ids:
+        raise dash.exceptions.PreventUpdate
+    return encode_exercises(exercise_ids + new_ids)
 
 
 @dash.callback(
     Output("muscle-img", "src"),
     Input("added-exercises", "data"),
-    Input("star-results", "data")
+    Input("star-results", "data"),
+    Input("session", "data"),
 )
-def update_muscle_svg(exercise_ids: List[str], star_data: Dict[str, int]) -> str:
+def update_muscle_svg(
+    added_exercises: Dict[str, Any],
+    star_results: Dict[str, Any],
+    session: Dict[str, Any],
+) -> str:
     """
-    Update SVG muscle diagram colors based on exercise selection
-    and star rating factor.
+    Update SVG muscle diagram colors based on the time-decayed muscle load
+    (logged history plus current selection) and the readiness factor.
     """
+    exercise_ids = decode_exercises(added_exercises)
     if not exercise_ids:
         raise dash.exceptions.PreventUpdate
 
-    if star_data:
-        total_stars = sum(star_data.values())
-        star_factor = 1 / (total_stars / 25)
-    else:
-        star_factor = 1
-
-    muscle_scores = (MUSCLE_MATRIX.loc[exercise_ids] * star_factor).sum()
-
-    muscle_to_color = {
-        muscle: classify_score(score)
-        for muscle, score in muscle_scores.items()
-        if score >= 0.3
-    }
-
-    input_file = "assets/muscle_sections.svg"
-    output_filename = f"muscle_dynamic_{int(time.time())}.svg"
-    output_path = f"assets/{output_filename}"
-    ns = {"svg": "http://www.w3.org/2000/svg"}
-
-    tree = ET.parse(input_file)
-    root = tree.getroot()
-
-    for muscle, color in muscle_to_color.items():
-        if muscle not in MUSCLE_SVG_MAPPING:
-            continue
-
-        group_id = MUSCLE_SVG_MAPPING[muscle]["group"]
-        path_ids = MUSCLE_SVG_MAPPING[muscle]["paths"]
-
-        for g in root.findall(".//svg:g", ns):
-            if g.attrib.get("id") == group_id:
-                style = g.attrib.get("style", "")
-                g.attrib["style"] = style.replace("display:none", "display:inline")
-
-        for path in root.findall(".//svg:path", ns):
-            if path.attrib.get("id") in path_ids:
-                style = path.attrib.get("style", "")
-                parts = [s for s in style.split(";") if s.strip()]
-                updated = []
-                filled = False
-                for p in parts:
-                    if p.strip().startswith("fill:"):
+    state = session_store.get(session, "training_log", "readiness")
+    star_factor = readiness_factor(state["readiness"], decode_ratings(star_results))
+
+    muscle_scores = compute_muscle_loads(state["training_log"], exercise_ids, factor=star_factor)["load"]
+
+    colors = color_scale().color_of(muscle_scores.to_numpy())
+    muscle_to_color = {muscle: color for muscle, color in zip(muscle_scores.index, colors) if color}
+
+    with span("svg.render", muscles=len(muscle_to_color)):
+        input_file = "assets/muscle_sections.svg"
+        output_filename = f"muscle_dynamic_{int(time.time())}.svg"
+        output_path = f"assets/{output_filename}"
+        ns = {"svg": "http://www.w3.org/2000/svg"}
+
+        tree = ET.parse(input_file)
+        root = tree.getroot()
+
+        for muscle, color in muscle_to_color.items():
+            if muscle not in MUSCLE_SVG_MAPPING:
+                continue
+
+            group_id = MUSCLE_SVG_MAPPING[muscle]["group"]
+            path_ids = MUSCLE_SVG_MAPPING[muscle]["paths"]
+
+            for g in root.findall(".//svg:g", ns):
+                if g.attrib.get("id") == group_id:
+                    style = g.attrib.get("style", "")
+                    g.attrib["style"] = style.replace("display:none", "display:inline")
+
+            for path in root.findall(".//svg:path", ns):
+                if path.attrib.get("id") in path_ids:
+                    style = path.attrib.get("style", "")
+                    parts = [s for s in style.split(";") if s.strip()]
+                    updated = []
+                    filled = False
+                    for p in parts:
+                        if p.strip().startswith("fill:"):
+                            updated.append(f"fill:{color}")
+                            filled = True
+                        else:
+                            updated.append(p)
+                    if not filled:
                         updated.append(f"fill:{color}")
-                        filled = True
-                    else:
-                        updated.append(p)
-                if not filled:
-                    updated.append(f"fill:{color}")
-                path.attrib["style"] = ";".join(updated)
-
-    tree.write(output_path)
+                    path.attrib["style"] = ";".join(updated)
+
+        tree.write(output_path)
     return dash.get_asset_url(output_filename)
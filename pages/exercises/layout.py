@@ -1,15 +1,51 @@
 import dash_bootstrap_components as dbc
-from dash import html
+from dash import dcc, html
 
 from utils import create_footer, create_header
 from constants import EXERCISES
 
 
+def create_plan_section() -> dbc.Card:
+    """
+    Create the plan optimizer section.
+
+    Users choose target muscles, available equipment and muscles to spare;
+    the suggested plan can be added to the selection in one click. The
+    muscle options are filled from the current catalog by
+    ``load_plan_muscles`` (the layout is cached, the catalog can change).
+
+    Returns:
+        dbc.Card: Card with the optimizer inputs and result placeholder.
+    """
+    equipment = sorted({ex["equipment"] for ex in EXERCISES})
+    return dbc.Card(
+        dbc.CardBody(
+            [
+                html.H4("Trainingsplan vorschlagen", className="mb-3", style={"color": "rgb(69, 155, 112)"}),
+                dbc.Row(
+                    [
+                        dbc.Col(dcc.Dropdown([], multi=True, id="plan-targets", placeholder="Zielmuskeln"), md=4),
+                        dbc.Col(dcc.Dropdown(equipment, multi=True, id="plan-equipment", placeholder="Verfügbare Geräte (alle)"), md=4),
+                        dbc.Col(dcc.Dropdown([], multi=True, id="plan-excluded", placeholder="Zu schonende Muskeln"), md=4),
+                    ],
+                    className="g-2 mb-3",
+                ),
+                dbc.Button("Plan vorschlagen", id="plan-optimize-btn", color="success", size="sm", className="me-2", n_clicks=0),
+                dbc.Button("Plan übernehmen", id="plan-apply-btn", color="secondary", size="sm", disabled=True, n_clicks=0),
+                html.Div(id="plan-result", className="mt-3"),
+                # Exercise IDs of the last suggestion
+                dcc.Store(id="plan-suggestion", data=[]),
+            ]
+        ),
+        className="bg-white p-4 rounded-2xl shadow max-w-[90rem] mx-auto mt-8",
+    )
+
+
 def create_layout() -> html.Div:
     """
     Create the exercise selection page layout.
 
-    This layout displays a list of available exercises as cards.
+    This layout displays the plan optimizer and a list of available exercises as cards.
     Each card contains an image, title, optional output text,
     and a button to add the exercise to the training plan.
     It also includes a modal confirmation when an exercise is added.
@@ -23,6 +59,9 @@ def create_layout() -> html.Div:
                 # Page header with breadcrumb navigation
                 create_header(label_link={"Bay Health": "/", "Übungsauswahl": ""}),
 
+                # Load-balanced plan suggestion
+                create_plan_section(),
+
                 # Collapsible section for exercise selection (currently always open)
                 dbc.Collapse(
                     id="exercise-collapse",
@@ -120,6 +159,9 @@ def create_layout() -> html.Div:
                     is_open=False,
                 ),
 
+                # Last clicked "add exercise" button, relayed clientside
+                dcc.Store(id="add-exercise-event"),
+
                 # Page footer
                 create_footer(),
             ],
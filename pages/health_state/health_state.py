@@ -1,8 +1,12 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, Optional
 
 import dash
-from dash import html, Input, Output, State, ctx, MATCH, ALL
+from dash import Input, Output, State, ClientsideFunction, MATCH, ALL
+from athletes import normalize_athlete_id
 from pages.health_state.layout import create_layout
+from readiness import submit
+from session_store import session_store
+from store_codec import decode_ratings
 
 # Dash page registration
 dash.register_page(__name__, path="/health_state/health_state")
@@ -10,13 +14,15 @@ layout = create_layout()
 
 
 @dash.callback(
-    Output("health_state", "data"),
+    Output("session", "data", allow_duplicate=True),
     Input("start-training-btn", "n_clicks"),
     State("longterm-complaints-choice", "value"),
     State("longterm-complaints-text", "value"),
     State("shortterm-complaints-choice", "value"),
     State("shortterm-complaints-text", "value"),
+    State("athlete-id", "value"),
     State("star-results", "data"),
+    State("session", "data"),
     prevent_initial_call=True,
 )
 def save_health_state(
@@ -25,10 +31,13 @@ def save_health_state(
     longterm_text: str,
     shortterm_choice: str,
     shortterm_text: str,
-    star_results: Dict[str, Any],
+    athlete_id: Optional[str],
+    star_data: Dict[str, Any],
+    session: Dict[str, Any],
 ) -> Dict[str, Any]:
     """
-    Save the current health state data into a dcc.Store.
+    Save the current health state in the server-side session and add the
+    star ratings to the readiness history.
 
     Args:
         n_clicks (int): Click count for the "Start Training" button.
@@ -36,18 +45,34 @@ def save_health_state(
         longterm_text (str): Additional description of long-term complaints.
         shortterm_choice (str): Choice regarding short-term complaints ("yes"/"no").
         shortterm_text (str): Additional description of short-term complaints.
-        star_results (dict): Dictionary of star ratings for recovery questions.
+        athlete_id (Optional[str]): Athlete ID for the coach dashboard (kept if empty).
+        star_data (dict): Encoded star ratings for recovery questions.
+        session (dict): Reference to the server-side session.
 
     Returns:
-        dict: Stored health state data.
+        dict: Updated session reference.
     """
-    return {
+    if not session:
+        raise dash.exceptions.PreventUpdate
+
+    star_results = decode_ratings(star_data)
+    health_state = {
         "longterm_choice": longterm_choice,
         "longterm_text": longterm_text,
         "shortterm_choice": shortterm_choice,
         "shortterm_text": shortterm_text,
         "star_ratings": star_results,
     }
+    athlete = normalize_athlete_id(athlete_id)
+
+    def add_submission(stored: Dict[str, Any]) -> Dict[str, Any]:
+        readiness, history = submit(stored["readiness"], stored["readiness_history"], star_results)
+        fields = {"health_state": health_state, "readiness": readiness, "readiness_history": history}
+        if athlete:
+            fields["athlete"] = athlete
+        return fields
+
+    return session_store.modify(session, add_submission, "readiness", "readiness_history")
 
 
 @dash.callback(
@@ -84,34 +109,26 @@ def toggle_shortterm_input(value: str) -> bool:
     return value == "ja"
 
 
-@dash.callback(
-    Output({"type": "star", "question": MATCH, "index": ALL}, "children"),
+# Star ratings are handled in the browser (assets/star_rating.js): filling the
+# stars of a question and writing all ratings to "star-results" in one
+# debounced update need no server round trip.
+dash.clientside_callback(
+    ClientsideFunction(namespace="stars", function_name="fill"),
+    Output({"type": "star-icon", "question": MATCH, "index": ALL}, "className"),
     Input({"type": "star", "question": MATCH, "index": ALL}, "n_clicks"),
     State({"type": "star", "question": MATCH, "index": ALL}, "id"),
+    State("star-results", "data"),
+    State("star-questions", "data"),
 )
-def update_star_display(
-    n_clicks_list: List[int],
-    ids: List[Dict[str, Any]],
-) -> List[html.I]:
-    """
-    Update the star display for the star rating components.
-
-    Args:
-        n_clicks_list (list): Number of clicks for each star.
-        ids (list): List of star component IDs.
 
-    Returns:
-        list: Updated list of HTML star icons.
-    """
-    triggered = ctx.triggered_id
-    selected_index = triggered["index"] if triggered else 0
-
-    return [
-        html.I(
-            className="bi bi-star-fill" if i <= selected_index else "bi bi-star"
-        )
-        for i in range(1, 6)
-    ]
+dash.clientside_callback(
+    ClientsideFunction(namespace="stars", function_name="collect"),
+    Output("star-results", "data"),
+    Input({"type": "star", "question": ALL, "index": ALL}, "n_clicks"),
+    State("star-results", "data"),
+    State("star-questions", "data"),
+    prevent_initial_call=True,
+)
 
 
 @dash.callback(
@@ -136,38 +153,3 @@ def toggle_health_modal(
     if submit_clicks or close_clicks:
         return not is_open
     return is_open
-
-
-@dash.callback(
-    Output("star-results", "data"),
-    Input({"type": "star", "question": ALL, "index": ALL}, "n_clicks"),
-    State({"type": "star", "question": ALL, "index": ALL}, "id"),
-    State("star-results", "data"),
-    prevent_initial_call=True,
-)
-def update_star_results(
-    n_clicks_list: List[int],
-    id_list: List[Dict[str, Any]],
-    current_data: Dict[str, int],
-) -> Dict[str, int]:
-    """
-    Update the star rating results in dcc.Store.
-
-    Args:
-        n_clicks_list (list): List of click counts for all stars.
-        id_list (list): List of star component IDs.
-        current_data (dict): Current stored star rating data.
-
-    Returns:
-        dict: Updated star rating data.
-    """
-    ctx_trigger = ctx.triggered_id
-    if ctx_trigger is None:
-        return dash.no_update
-
-    question = ctx_trigger["question"]
-    rating = ctx_trigger["index"]
-
-    updated = current_data.copy()
-    updated[question] = rating
-    return updated
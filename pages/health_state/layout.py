@@ -1,7 +1,10 @@
-from dash import html
+from dash import dcc, html
 import dash_bootstrap_components as dbc
 
+from athletes import ATHLETE_ID_MAX_LENGTH
 from utils import create_footer, create_header, create_star_rating
+from constants import RECOVERY_QUESTIONS
+from store_codec import QUESTION_IDS
 
 
 def create_layout():
@@ -39,6 +42,20 @@ def create_layout():
                             ),
                         ], className="mb-4"),
 
+                        # Athleten-Kennung für die Coach-Übersicht
+                        html.Div([
+                            html.Label("Athleten-Kennung (optional)", className="text-sm fw-bold"),
+                            dbc.Input(
+                                id="athlete-id",
+                                placeholder="z. B. Name oder Kennung von deinem Coach",
+                                maxLength=ATHLETE_ID_MAX_LENGTH,
+                            ),
+                            html.Small(
+                                "Nur mit Kennung erscheinst du in der Coach-Übersicht.",
+                                className="text-muted",
+                            ),
+                        ], className="mb-4"),
+
                         # Kurzfristige Beschwerden
                         html.Div([
                             html.Label("Hast du heute körperliche Beschwerden?", className="text-sm fw-bold"),
@@ -65,12 +82,10 @@ def create_layout():
                             style={"marginTop": "2rem"},
                         ),
 
-                        create_star_rating("q1", "1. Körperliches Wohlbefinden:\nFühlst du dich körperlich beschwerdefrei? 👉 1 = sehr starke Beschwerden / 5 = keine Beschwerden"),
-                        create_star_rating("q2", "2. Schlafqualität:\nWie gut schläfst du aktuell? 👉 1 = sehr schlechter Schlaf / 5 = sehr erholsamer Schlaf"),
-                        create_star_rating("q3", "3. Energie und Appetit:\nFühlst du dich energiegeladen? 👉 1 = energielos / 5 = voller Energie"),
-                        create_star_rating("q4", "4. Mentale Klarheit:\nWie klar fühlst du dich mental? 👉 1 = unklar / 5 = sehr klar"),
-                        create_star_rating("q5", "5. Emotionale Ausgeglichenheit:\nWie ausgeglichen bist du? 👉 1 = gereizt / 5 = ruhig"),
-                        create_star_rating("q6", "6. Motivation und Lebensfreude:\nWie motiviert bist du aktuell? 👉 1 = unmotiviert / 5 = motiviert"),
+                        *[
+                            create_star_rating(question_id, question_text)
+                            for question_id, question_text in RECOVERY_QUESTIONS.items()
+                        ],
 
                         dbc.Button(
                             "Gesundheitsdaten speichern",
@@ -106,6 +121,8 @@ def create_layout():
                     ]),
                     className="bg-white p-6 rounded-2xl shadow max-w-[90rem] mx-auto mt-8",
                 ),
+                # Question order of the compact "star-results" encoding (used clientside)
+                dcc.Store(id="star-questions", data=QUESTION_IDS),
                 create_footer(),
             ],
             fluid=True
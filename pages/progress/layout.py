@@ -1,6 +1,92 @@
-from dash import html
+from dash import dcc, html
 import dash_bootstrap_components as dbc
 
+WEEKDAYS = ["Mo", "Di", "Mi", "Do", "Fr", "Sa", "So"]
+
+
+def create_forecast_section() -> html.Div:
+    """
+    Create the load forecast section.
+
+    Users schedule the current exercise selection on weekdays as a named
+    plan; all plans are simulated and shown side by side.
+
+    Returns:
+        html.Div: Forecast controls, plan store and result placeholder.
+    """
+    return html.Div(
+        [
+            html.H4("Belastungsprognose", className="mb-2", style={"color": "rgb(69, 155, 112)"}),
+            html.P(
+                "Plane die aktuelle Übungsauswahl an festen Wochentagen ein und vergleiche, "
+                "wie sich die Belastung in den nächsten zwei Wochen entwickelt.",
+                className="text-muted small",
+            ),
+            dbc.Row(
+                [
+                    dbc.Col(dbc.Input(id="forecast-plan-name", placeholder="Name des Plans", size="sm"), md=3),
+                    dbc.Col(
+                        dcc.Checklist(
+                            [{"label": f" {name}", "value": i} for i, name in enumerate(WEEKDAYS)],
+                            value=[0, 2, 4],
+                            id="forecast-weekdays",
+                            inline=True,
+                            inputClassName="ms-2",
+                        ),
+                        md=5,
+                    ),
+                    dbc.Col(
+                        [
+                            dbc.Button("Plan hinzufügen", id="forecast-add-btn", color="success", size="sm", className="me-2", n_clicks=0),
+                            dbc.Button("Alle entfernen", id="forecast-clear-btn", color="secondary", size="sm", n_clicks=0),
+                        ],
+                        md=4,
+                    ),
+                ],
+                className="g-2 mb-3 align-items-center",
+            ),
+            # Candidate plans: name -> {"exercises": [...], "weekdays": [...]}
+            dcc.Store(id="forecast-plans", data={}),
+            html.Div(id="progress-forecast"),
+        ],
+        className="mt-4",
+    )
+
+
+def create_timeline_section() -> html.Div:
+    """
+    Create the muscle map timeline.
+
+    The map is embedded as an SVG document so it can be recolored in the
+    browser; the slider only switches between precomputed daily frames.
+
+    Returns:
+        html.Div: Range selection, muscle map, slider and frame store.
+    """
+    return html.Div(
+        [
+            html.H4("Belastungsverlauf", className="mb-2", style={"color": "rgb(69, 155, 112)"}),
+            dbc.RadioItems(
+                id="timeline-range",
+                options=[{"label": "30 Tage", "value": "30"}, {"label": "90 Tage", "value": "90"}, {"label": "1 Jahr", "value": "365"}],
+                value="90",
+                inline=True,
+                className="small mb-2",
+            ),
+            html.ObjectEl(
+                id="timeline-svg",
+                data="/assets/muscle_sections.svg",
+                type="image/svg+xml",
+                style={"width": "100%", "maxWidth": "300px"},
+            ),
+            dcc.Slider(id="timeline-slider", min=0, max=0, step=1, value=0, marks=None, updatemode="drag"),
+            html.Div(id="timeline-date", className="text-muted small"),
+            # Precomputed color classes per day (see timeline.heatmap_frames)
+            dcc.Store(id="timeline-frames"),
+        ],
+        className="mt-4",
+    )
+
 
 def create_layout() -> dbc.Card:
     """
@@ -8,7 +94,9 @@ def create_layout() -> dbc.Card:
 
     This layout includes:
     - A title ("Trainingsfortschritt")
-    - A container div where training progress components will be dynamically inserted.
+    - A container div where training progress components will be dynamically inserted:
+      the summary section, the row of exercise cards, the muscle map timeline and the load forecast,
+      which are updated independently.
 
     Returns:
         dbc.Card: A Dash Bootstrap Card containing the training progress layout.
@@ -23,7 +111,19 @@ def create_layout() -> dbc.Card:
                     style={"color": "rgb(69, 155, 112)"},
                 ),
                 # Container for dynamic training progress elements
-                html.Div(id="training-progress-container"),
+                html.Div(
+                    [
+                        html.Div(id="progress-summary"),
+                        dbc.Row(id="progress-cards", children=[], className="g-4"),
+                        create_timeline_section(),
+                        create_forecast_section(),
+                        # Exercise IDs whose cards are currently rendered (for partial updates)
+                        dcc.Store(id="progress-rendered-exercises", data=[]),
+                        # Last clicked "Training loggen" button with its grid rows, relayed clientside
+                        dcc.Store(id="log-training-event"),
+                    ],
+                    id="training-progress-container",
+                ),
             ]
         ),
         className="mt-4 mb-4",
@@ -1,16 +1,24 @@
-from typing import List, Dict, Optional, Union
+from typing import Any, List, Dict, Optional, Tuple, Union
 import os
 import glob
 from datetime import date
 
 import dash
-from dash import Output, html, Input
+from dash import Output, html, dcc, Input, State, Patch, ctx, ALL, MATCH, ClientsideFunction
 import dash_bootstrap_components as dbc
 import pandas as pd
 import dash_ag_grid as dag
 
-from pages.progress.layout import create_layout
-from constants import MUSCLE_MATRIX, EXERCISES
+from pages.progress.layout import WEEKDAYS, create_layout
+from classification import color_scale
+from constants import EXERCISES
+from forecast import Forecast, simulate_plans, weekly_calendar
+from load_model import compute_muscle_loads, overloaded_muscles
+from readiness import readiness_factor
+from series import DEFAULT_WIDTH, series_cache
+from session_store import session_store
+from store_codec import decode_exercises, decode_ratings
+from timeline import TIMELINE_RANGES, heatmap_frames
 
 # Register page with Dash
 dash.register_page(__name__)
@@ -33,23 +41,24 @@ def get_latest_muscle_svg() -> str:
     return dash.get_asset_url(filename)
 
 
-def create_muscle_score_table(exercise_ids: List[str], factor: float = 1.0) -> html.Div:
+def create_muscle_score_table(muscle_loads: pd.DataFrame) -> html.Div:
     """
-    Create a muscle score table based on selected exercises and a scaling factor.
+    Create a muscle score table based on the current muscle load model.
 
     Args:
-        exercise_ids (List[str]): List of selected exercise IDs.
-        factor (float): Scaling factor applied to scores (e.g., recovery factor).
+        muscle_loads (pd.DataFrame): Result of ``load_model.compute_muscle_loads``.
 
     Returns:
         html.Div: A scrollable table displaying muscle group scores.
     """
-    selected_matrix = MUSCLE_MATRIX.loc[exercise_ids] * factor
-    muscle_scores = selected_matrix.sum().sort_values(ascending=False)
+    muscle_scores = muscle_loads["load"].sort_values(ascending=False)
+    levels = pd.Series(color_scale().label_of(muscle_loads["load"].to_numpy()), index=muscle_loads.index)
 
     df = pd.DataFrame({
         "Muskelgruppe": muscle_scores.index,
-        "Score in %": muscle_scores.values.round(2)
+        "Score in %": muscle_scores.values.round(2),
+        "Stufe": levels[muscle_scores.index].values,
+        "Akut:Chronisch": muscle_loads.loc[muscle_scores.index, "acwr"].round(2).fillna("–").values,
     })
 
     table = dbc.Table.from_dataframe(
@@ -74,20 +83,26 @@ def create_muscle_score_table(exercise_ids: List[str], factor: float = 1.0) -> h
     )
 
 
-def create_muscle_summary_text(exercise_ids: List[str], factor: float = 1.0) -> html.Div:
+def create_muscle_summary_text(muscle_loads: pd.DataFrame) -> html.Div:
     """
     Create a summary text highlighting muscle groups with high stress.
 
+    Muscles are flagged by the load model, either because their effective
+    (time-decayed) load exceeds the overload threshold or because their
+    acute:chronic ratio indicates a too steep increase. Muscles flagged for
+    their load are shown with the level of the muscle map's color scale.
+
     Args:
-        exercise_ids (List[str]): List of selected exercise IDs.
-        factor (float): Scaling factor applied to scores.
+        muscle_loads (pd.DataFrame): Result of ``load_model.compute_muscle_loads``.
 
     Returns:
         html.Div: Summary section with recommendations.
     """
-    selected_matrix = MUSCLE_MATRIX.loc[exercise_ids] * factor
-    muscle_scores = selected_matrix.sum()
-    high_stress = muscle_scores[muscle_scores > 75]
+    high_stress = overloaded_muscles(muscle_loads)
+    scale = color_scale()
+    loads = muscle_loads["load"].to_numpy()
+    levels = pd.Series(scale.label_of(loads), index=muscle_loads.index)
+    by_load = pd.Series(scale.overloaded(loads), index=muscle_loads.index)
 
     if high_stress.empty:
         return html.Div([
@@ -95,7 +110,13 @@ def create_muscle_summary_text(exercise_ids: List[str], factor: float = 1.0) ->
             html.P("Du kannst dein Training wie geplant fortsetzen.")
         ])
     else:
-        top_muscles = html.Ul([html.Li(m) for m in high_stress.sort_values(ascending=False).index])
+        top_muscles = html.Ul([
+            html.Li(
+                f"{muscle} (Belastung {levels[muscle]})"
+                if by_load[muscle] else f"{muscle} (Akut:Chronisch {row.acwr:.2f})"
+            )
+            for muscle, row in high_stress.iterrows()
+        ])
         return html.Div([
             html.H6("Stark beanspruchte Muskelgruppen", className="text-warning fw-bold"),
             html.P(
@@ -106,117 +127,485 @@ def create_muscle_summary_text(exercise_ids: List[str], factor: float = 1.0) ->
         ])
 
 
+def create_last_training_table(ex_id: str) -> html.Div:
+    """
+    Create a table showing the last training data for a given exercise.
+    (Currently static example data.)
+    """
+    last_training_date = date.today().strftime("%Y-%m-%d")
+    training_data = [
+        {"Satz": 1, "Wdh": 12, "Gewicht": 40},
+        {"Satz": 2, "Wdh": 10, "Gewicht": 42.5},
+        {"Satz": 3, "Wdh": 8,  "Gewicht": 45},
+    ]
+    df = pd.DataFrame(training_data)
+    return html.Div([
+        html.H6(f"Letztes Training\n({last_training_date})", className="text-muted"),
+        dbc.Table.from_dataframe(df, striped=True, bordered=True, hover=True, size="sm", className="mt-2"),
+    ])
+
+
+def create_input_table(ex_id: str) -> html.Div:
+    """
+    Create an input table for logging a new training session.
+    """
+    return html.Div([
+        html.H6("Neues Training eintragen", className="mt-4"),
+        dag.AgGrid(
+            id={"type": "input-grid", "index": ex_id},
+            columnDefs=[
+                {"field": "Satz", "editable": True, "type": "numericColumn"},
+                {"field": "Wdh", "editable": True, "type": "numericColumn"},
+                {"field": "Gewicht", "editable": True, "type": "numericColumn"},
+            ],
+            rowData=[
+                {"Satz": 1, "Wdh": "", "Gewicht": ""},
+                {"Satz": 2, "Wdh": "", "Gewicht": ""},
+                {"Satz": 3, "Wdh": "", "Gewicht": ""},
+            ],
+            defaultColDef={"flex": 1, "minWidth": 80, "resizable": True},
+            className="ag-theme-alpine",
+            style={"height": "180px", "width": "100%"},
+        ),
+        dbc.Button(
+            "Training loggen",
+            color="success",
+            className="mt-2",
+            id={"type": "log-training-btn", "index": ex_id}
+        ),
+    ])
+
+
+def create_progress_chart(ex_id: str) -> html.Div:
+    """
+    Create the progress chart of an exercise (tonnage or estimated 1RM over time).
+
+    The figure is filled by ``render_progress_chart`` with a series
+    downsampled to the chart's width.
+
+    Args:
+        ex_id (str): Exercise ID.
+
+    Returns:
+        html.Div: Metric and range selection, chart and width store.
+    """
+    return html.Div([
+        html.H6("Verlauf", className="mt-4"),
+        dbc.Row([
+            dbc.Col(dbc.RadioItems(
+                id={"type": "progress-chart-metric", "index": ex_id},
+                options=[{"label": "Tonnage", "value": "tonnage"}, {"label": "Geschätztes 1RM", "value": "e1rm"}],
+                value="tonnage",
+                inline=True,
+                className="small",
+            ), width="auto"),
+            dbc.Col(dbc.RadioItems(
+                id={"type": "progress-chart-range", "index": ex_id},
+                options=[{"label": "90 Tage", "value": "90"}, {"label": "1 Jahr", "value": "365"}, {"label": "Alles", "value": "all"}],
+                value="365",
+                inline=True,
+                className="small",
+            ), width="auto"),
+        ], className="g-2"),
+        dcc.Graph(
+            id={"type": "progress-chart", "index": ex_id},
+            config={"displayModeBar": False},
+            style={"height": "200px"},
+        ),
+        # Rendered width of the chart in px (measured in the browser)
+        dcc.Store(id={"type": "progress-chart-width", "index": ex_id}),
+    ])
+
+
+def create_exercise_card(ex_id: str) -> dbc.Col:
+    """
+    Create the card of a selected exercise with last training info, input table and progress chart.
+
+    Args:
+        ex_id (str): Exercise ID.
+
+    Returns:
+        dbc.Col: Column containing the exercise card.
+    """
+    title = next((ex["title"] for ex in EXERCISES if ex["id"] == ex_id), ex_id)
+    img_src = next((ex["src"] for ex in EXERCISES if ex["id"] == ex_id), "")
+
+    card = dbc.Card(
+        dbc.CardBody([
+            dbc.Row([
+                dbc.Col(html.Img(src=img_src, className="img-fluid rounded", style={"maxWidth": "100%"}), width=5),
+                dbc.Col(html.Div([
+                    html.H5(title, className="card-title"),
+                    create_last_training_table(ex_id),
+                ]), width=7),
+            ]),
+            dbc.Row(dbc.Col(create_input_table(ex_id), width=12), className="mt-4"),
+            dbc.Row(dbc.Col(create_progress_chart(ex_id), width=12)),
+        ]),
+        className="h-100"
+    )
+
+    return dbc.Col(card, md=4)
+
+
 @dash.callback(
-    Output("training-progress-container", "children"),
+    Output("progress-summary", "children"),
     Input("added-exercises", "data"),
     Input("star-results", "data"),
+    Input("session", "data"),
 )
-def render_training_progress(
-    exercise_ids: Optional[List[str]],
-    star_data: Optional[Dict[str, Union[int, float]]]
+def render_progress_summary(
+    added_exercises: Optional[Dict[str, Any]],
+    star_results: Optional[Dict[str, Any]],
+    session: Optional[Dict[str, Any]],
 ) -> html.Div:
     """
-    Render the training progress view, including:
-    - Summary section with muscle scores, SVG visualization, and warnings
-    - Cards for each selected exercise with last training info and input table
+    Render the summary section with muscle scores, SVG visualization, and warnings.
+
+    Only this section depends on the star ratings and the logged history,
+    so rating changes and logged trainings never touch the exercise cards.
 
     Args:
-        exercise_ids (Optional[List[str]]): List of selected exercise IDs.
-        star_data (Optional[Dict[str, Union[int, float]]]): Star ratings for recovery.
+        added_exercises (Optional[Dict[str, Any]]): Encoded selected exercises.
+        star_results (Optional[Dict[str, Any]]): Encoded star ratings for recovery.
+        session (Optional[Dict[str, Any]]): Reference to the server-side session
+            (training log and readiness).
 
     Returns:
-        html.Div: Complete training progress section.
+        html.Div: Summary section.
     """
+    exercise_ids = decode_exercises(added_exercises)
     if not exercise_ids:
         return html.P("Noch keine Übungen hinzugefügt.", className="text-muted")
 
-    # Recovery adjustment factor based on star ratings
-    if star_data:
-        total_stars = sum(star_data.values())
-        star_factor = 1 / (total_stars / 25)
-    else:
-        star_factor = 1
-
-    def create_last_training_table(ex_id: str) -> html.Div:
-        """
-        Create a table showing the last training data for a given exercise.
-        (Currently static example data.)
-        """
-        last_training_date = date.today().strftime("%Y-%m-%d")
-        training_data = [
-            {"Satz": 1, "Wdh": 12, "Gewicht": 40},
-            {"Satz": 2, "Wdh": 10, "Gewicht": 42.5},
-            {"Satz": 3, "Wdh": 8,  "Gewicht": 45},
-        ]
-        df = pd.DataFrame(training_data)
-        return html.Div([
-            html.H6(f"Letztes Training\n({last_training_date})", className="text-muted"),
-            dbc.Table.from_dataframe(df, striped=True, bordered=True, hover=True, size="sm", className="mt-2"),
-        ])
+    state = session_store.get(session, "training_log", "readiness")
 
-    def create_input_table(ex_id: str) -> html.Div:
-        """
-        Create an input table for logging a new training session.
-        """
-        return html.Div([
-            html.H6("Neues Training eintragen", className="mt-4"),
-            dag.AgGrid(
-                id={"type": "input-grid", "index": ex_id},
-                columnDefs=[
-                    {"field": "Satz", "editable": True, "type": "numericColumn"},
-                    {"field": "Wdh", "editable": True, "type": "numericColumn"},
-                    {"field": "Gewicht", "editable": True, "type": "numericColumn"},
-                ],
-                rowData=[
-                    {"Satz": 1, "Wdh": "", "Gewicht": ""},
-                    {"Satz": 2, "Wdh": "", "Gewicht": ""},
-                    {"Satz": 3, "Wdh": "", "Gewicht": ""},
-                ],
-                defaultColDef={"flex": 1, "minWidth": 80, "resizable": True},
-                className="ag-theme-alpine",
-                style={"height": "180px", "width": "100%"},
-            ),
-            dbc.Button(
-                "Training loggen",
-                color="success",
-                className="mt-2",
-                id={"type": "log-training-btn", "index": ex_id}
-            ),
-        ])
-
-    # Create exercise cards
-    cards = []
-    for ex_id in exercise_ids:
-        title = next((ex["title"] for ex in EXERCISES if ex["id"] == ex_id), ex_id)
-        img_src = next((ex["src"] for ex in EXERCISES if ex["id"] == ex_id), "")
-
-        card = dbc.Card(
-            dbc.CardBody([
-                dbc.Row([
-                    dbc.Col(html.Img(src=img_src, className="img-fluid rounded", style={"maxWidth": "100%"}), width=5),
-                    dbc.Col(html.Div([
-                        html.H5(title, className="card-title"),
-                        create_last_training_table(ex_id),
-                    ]), width=7),
-                ]),
-                dbc.Row(dbc.Col(create_input_table(ex_id), width=12), className="mt-4")
-            ]),
-            className="h-100"
-        )
-
-        cards.append(dbc.Col(card, md=4))
+    # Recovery adjustment factor based on the rolling readiness
+    star_factor = readiness_factor(state["readiness"], decode_ratings(star_results))
+    muscle_loads = compute_muscle_loads(state["training_log"], exercise_ids, factor=star_factor)
 
     # Create summary section with score table, SVG, and recommendations
-    summary_section = dbc.Card(
+    return dbc.Card(
         dbc.Row([
-            dbc.Col(create_muscle_score_table(exercise_ids, factor=star_factor), width=4),
+            dbc.Col(create_muscle_score_table(muscle_loads), width=4),
             dbc.Col(html.Img(src=get_latest_muscle_svg(), id="muscle-img", style={"width": "100%", "maxWidth": "300px"}), width=4),
-            dbc.Col(create_muscle_summary_text(exercise_ids, factor=star_factor), width=4),
+            dbc.Col(create_muscle_summary_text(muscle_loads), width=4),
         ], className="mb-4 align-items-start"),
-        className="p-4 shadow-sm"
+        className="p-4 shadow-sm mb-4"
     )
 
-    return html.Div([
-        summary_section,
-        dbc.Row(cards, className="g-4")
-    ])
+
+@dash.callback(
+    Output("progress-cards", "children"),
+    Output("progress-rendered-exercises", "data"),
+    Input("added-exercises", "data"),
+    State("progress-rendered-exercises", "data"),
+)
+def render_training_progress(
+    added_exercises: Optional[Dict[str, Any]],
+    rendered_ids: Optional[List[str]],
+) -> Tuple[Union[List[dbc.Col], Patch], List[str]]:
+    """
+    Render the cards for each selected exercise with last training info and input table.
+
+    Cards that are already on the page are kept: when exercises are added,
+    only their cards are appended with a ``Patch`` (so the response grows
+    with the number of new cards and entered grid values survive). The
+    full list is only rendered when the page is built or the selection
+    changes in any other way.
+
+    Args:
+        added_exercises (Optional[Dict[str, Any]]): Encoded selected exercises.
+        rendered_ids (Optional[List[str]]): Exercise IDs whose cards are currently rendered.
+
+    Returns:
+        tuple: Card list (or a Patch appending the new cards) and the rendered exercise IDs.
+    """
+    exercise_ids = decode_exercises(added_exercises)
+    rendered_ids = rendered_ids or []
+
+    if exercise_ids == rendered_ids:
+        raise dash.exceptions.PreventUpdate
+
+    if rendered_ids and exercise_ids[:len(rendered_ids)] == rendered_ids:
+        cards = Patch()
+        for ex_id in exercise_ids[len(rendered_ids):]:
+            cards.append(create_exercise_card(ex_id))
+        return cards, exercise_ids
+
+    return [create_exercise_card(ex_id) for ex_id in exercise_ids], exercise_ids
+
+
+# Relay log-button clicks in the browser: only the clicked exercise's grid rows reach the server
+dash.clientside_callback(
+    ClientsideFunction(namespace="events", function_name="relayState"),
+    Output("log-training-event", "data"),
+    Input({"type": "log-training-btn", "index": ALL}, "n_clicks"),
+    State({"type": "input-grid", "index": ALL}, "rowData"),
+    State({"type": "input-grid", "index": ALL}, "id"),
+    prevent_initial_call=True,
+)
+
+
+@dash.callback(
+    Output("session", "data", allow_duplicate=True),
+    Input("log-training-event", "data"),
+    State("session", "data"),
+    prevent_initial_call=True,
+)
+def log_training(
+    event: Optional[Dict[str, Any]],
+    session: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Log the training of an exercise for today, including the sets entered
+    in its input grid (Satz/Wdh/Gewicht), which determine its volume factor.
+
+    Each exercise is logged at most once per day; logging it again
+    replaces the earlier entry.
+
+    Args:
+        event (Optional[Dict[str, Any]]): Relayed click (``id`` of the button, ``value``: rows of its grid).
+        session (Optional[Dict[str, Any]]): Reference to the server-side session.
+
+    Returns:
+        Dict[str, Any]: Updated session reference.
+    """
+    if not event or not session:
+        raise dash.exceptions.PreventUpdate
+
+    ex_id = event["id"]["index"]
+    rows = event.get("value")
+    sets = [row for row in rows or [] if row.get("Wdh") not in (None, "")]
+
+    today = date.today().isoformat()
+
+    def add_entry(fields: Dict[str, Any]) -> Dict[str, Any]:
+        training_log = dict(fields["training_log"] or {})
+        entries = [entry for entry in training_log.get(today, []) if entry["exercise"] != ex_id]
+        training_log[today] = entries + [{"exercise": ex_id, "sets": sets}]
+        return {"training_log": training_log}
+
+    return session_store.modify(session, add_entry, "training_log")
+
+
+@dash.callback(
+    Output("forecast-plans", "data"),
+    Input("forecast-add-btn", "n_clicks"),
+    Input("forecast-clear-btn", "n_clicks"),
+    State("forecast-plan-name", "value"),
+    State("forecast-weekdays", "value"),
+    State("added-exercises", "data"),
+    State("forecast-plans", "data"),
+    prevent_initial_call=True,
+)
+def update_forecast_plans(
+    add_clicks: int,
+    clear_clicks: int,
+    name: Optional[str],
+    weekdays: Optional[List[int]],
+    added_exercises: Optional[Dict[str, Any]],
+    plans: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Add the current exercise selection as a named candidate plan, or remove all plans.
+
+    Args:
+        add_clicks (int): Clicks on "Plan hinzufügen".
+        clear_clicks (int): Clicks on "Alle entfernen".
+        name (Optional[str]): Plan name (defaults to "Plan <n>").
+        weekdays (Optional[List[int]]): Training days (0 = Monday).
+        added_exercises (Optional[Dict[str, Any]]): Encoded selected exercises.
+        plans (Optional[Dict[str, Any]]): Current candidate plans.
+
+    Returns:
+        Dict[str, Any]: Updated candidate plans.
+    """
+    if ctx.triggered_id == "forecast-clear-btn":
+        return {}
+
+    exercise_ids = decode_exercises(added_exercises)
+    if not exercise_ids or not weekdays:
+        raise dash.exceptions.PreventUpdate
+
+    plans = dict(plans or {})
+    name = (name or "").strip() or f"Plan {len(plans) + 1}"
+    plans[name] = {"exercises": exercise_ids, "weekdays": sorted(weekdays)}
+    return plans
+
+
+def create_forecast_table(forecast: Forecast, scenario: str) -> dbc.Table:
+    """
+    Create the day-by-day table of one simulated plan.
+
+    Args:
+        forecast (Forecast): Simulation result.
+        scenario (str): Plan name.
+
+    Returns:
+        dbc.Table: Maximum load and flagged muscle groups per day.
+    """
+    s = forecast.scenarios.index(scenario)
+    df = pd.DataFrame({
+        "Tag": [f"{WEEKDAYS[day.weekday()]} {day:%d.%m.}" for day in forecast.dates],
+        "Max. %": forecast.load[s].max(axis=1).round(0).astype(int),
+        "Überlastet": [", ".join(forecast.overloaded_on(scenario, i)) or "–" for i in range(len(forecast.dates))],
+    })
+    return dbc.Table.from_dataframe(
+        df, striped=True, bordered=True, hover=True, size="sm", className="small mb-0", style={"fontSize": "0.65rem"}
+    )
+
+
+@dash.callback(
+    Output("progress-forecast", "children"),
+    Input("forecast-plans", "data"),
+    Input("star-results", "data"),
+    Input("session", "data"),
+)
+def render_forecast(
+    plans: Optional[Dict[str, Any]],
+    star_results: Optional[Dict[str, Any]],
+    session: Optional[Dict[str, Any]],
+) -> Union[html.P, dbc.Row]:
+    """
+    Simulate all candidate plans and show them side by side.
+
+    Args:
+        plans (Optional[Dict[str, Any]]): Candidate plans (exercises and weekdays).
+        star_results (Optional[Dict[str, Any]]): Encoded star ratings for recovery.
+        session (Optional[Dict[str, Any]]): Reference to the server-side session.
+
+    Returns:
+        Union[html.P, dbc.Row]: One column per plan.
+    """
+    if not plans:
+        return html.P("Noch keine Pläne für die Prognose angelegt.", className="text-muted small")
+
+    state = session_store.get(session, "training_log", "readiness")
+    star_factor = readiness_factor(state["readiness"], decode_ratings(star_results))
+    today = date.today()
+    calendars = {
+        name: weekly_calendar(plan["exercises"], plan["weekdays"], today)
+        for name, plan in plans.items()
+    }
+    forecast = simulate_plans(state["training_log"], calendars, start=today, factor=star_factor)
+
+    columns = []
+    for name, plan in plans.items():
+        s = forecast.scenarios.index(name)
+        overloaded_days = int(forecast.overloaded[s].any(axis=1).sum())
+        columns.append(dbc.Col(
+            dbc.Card(
+                dbc.CardBody([
+                    html.H6(name, className="fw-bold mb-1"),
+                    html.Small(
+                        f"{', '.join(WEEKDAYS[i] for i in plan['weekdays'])} · {len(plan['exercises'])} Übungen · "
+                        f"{overloaded_days} Tage mit Überlastung",
+                        className="text-muted d-block mb-2",
+                    ),
+                    html.Div(create_forecast_table(forecast, name), style={"maxHeight": "320px", "overflowY": "auto"}),
+                ]),
+                className="shadow-sm",
+            ),
+            md=max(12 // len(plans), 4),
+        ))
+    return dbc.Row(columns, className="g-3")
+
+
+@dash.callback(
+    Output("timeline-frames", "data"),
+    Output("timeline-slider", "max"),
+    Output("timeline-slider", "value"),
+    Output("timeline-slider", "marks"),
+    Input("timeline-range", "value"),
+    Input("session", "data"),
+)
+def render_timeline_frames(
+    range_key: str,
+    session: Optional[Dict[str, Any]],
+) -> Tuple[Dict[str, Any], int, int, Dict[int, str]]:
+    """
+    Compute the muscle map frames of the selected range and reset the slider to today.
+
+    Scrubbing is handled in the browser (``timeline.scrub``), so this only
+    runs when the range or the logged history changes.
+
+    Args:
+        range_key (str): "30", "90" or "365".
+        session (Optional[Dict[str, Any]]): Reference to the server-side session.
+
+    Returns:
+        tuple: Frames, slider maximum, slider value and slider marks.
+    """
+    training_log = session_store.get(session, "training_log")["training_log"]
+    today = date.today()
+    days = TIMELINE_RANGES.get(range_key, TIMELINE_RANGES["90"])
+    frames = heatmap_frames(training_log, today, days)
+    first = date.fromisoformat(frames["start"])
+    return frames, days - 1, days - 1, {0: f"{first:%d.%m.%Y}", days - 1: "Heute"}
+
+
+# Recolor the muscle map in the browser when the slider moves (no server round trip per frame)
+dash.clientside_callback(
+    ClientsideFunction(namespace="timeline", function_name="scrub"),
+    Output("timeline-date", "children"),
+    Input("timeline-slider", "value"),
+    Input("timeline-frames", "data"),
+)
+
+
+# Measure the chart width in the browser, so the series is downsampled to one point per pixel
+dash.clientside_callback(
+    ClientsideFunction(namespace="charts", function_name="width"),
+    Output({"type": "progress-chart-width", "index": MATCH}, "data"),
+    Input({"type": "progress-chart-metric", "index": MATCH}, "id"),
+)
+
+
+@dash.callback(
+    Output({"type": "progress-chart", "index": MATCH}, "figure"),
+    Input({"type": "progress-chart-metric", "index": MATCH}, "value"),
+    Input({"type": "progress-chart-range", "index": MATCH}, "value"),
+    Input({"type": "progress-chart-width", "index": MATCH}, "data"),
+    Input("session", "data"),
+    State({"type": "progress-chart", "index": MATCH}, "id"),
+)
+def render_progress_chart(
+    metric: str,
+    range_key: str,
+    width: Optional[int],
+    session: Optional[Dict[str, Any]],
+    chart_id: Dict[str, str],
+) -> Dict[str, Any]:
+    """
+    Render the progress chart of one exercise from the cached, downsampled series.
+
+    Logging a set bumps the session version; only the series of the logged
+    exercise is recomputed (see ``series.SeriesCache``).
+
+    Args:
+        metric (str): "tonnage" or "e1rm".
+        range_key (str): "90", "365" or "all".
+        width (Optional[int]): Chart width in px.
+        session (Optional[Dict[str, Any]]): Reference to the server-side session.
+        chart_id (Dict[str, str]): ID of the chart (exercise in ``index``).
+
+    Returns:
+        Dict[str, Any]: Plotly figure.
+    """
+    layout = {
+        "margin": {"l": 40, "r": 10, "t": 10, "b": 30},
+        "height": 200,
+        "yaxis": {"title": {"text": "kg" if metric == "e1rm" else "kg × Wdh"}},
+    }
+    if not session or "sid" not in session:
+        view = {"x": [], "y": []}
+    else:
+        view = series_cache.get(session, chart_id["index"], metric, range_key, width or DEFAULT_WIDTH)
+    if not view["x"]:
+        layout["annotations"] = [{"text": "Noch keine Daten", "showarrow": False, "xref": "paper", "yref": "paper", "x": 0.5, "y": 0.5}]
+        layout["xaxis"] = layout["yaxis"] = {"visible": False}
+    return {
+        "data": [{"x": view["x"], "y": view["y"], "type": "scatter", "mode": "lines", "line": {"color": "rgb(69, 155, 112)"}}],
+        "layout": layout,
+    }
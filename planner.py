@@ -0,0 +1,177 @@
+import time
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from load_model import OVERLOAD_THRESHOLD
+from substitution import SubstitutionIndex, substitution_index
+from tracing import traced
+
+# Effective load (in %) at which a target muscle counts as fully trained
+TARGET_LOAD = 50.0
+
+# Penalty per % of load on muscles that are not targeted, relative to 1 % of target coverage.
+# Keeps the plan balanced: an exercise is only worth adding if it trains the targets
+# considerably more than the rest of the body.
+BALANCE_WEIGHT = 0.1
+
+MAX_EXERCISES = 6
+BEAM_WIDTH = 8
+# Search time per request; the best plan found so far is returned when it runs out
+TIME_BUDGET_MS = 50.0
+
+# State of the beam search: (chosen candidate positions, plan load per muscle, score)
+_State = Tuple[Tuple[int, ...], np.ndarray, float]
+
+
+class Plan:
+    """
+    Result of the plan optimizer.
+
+    Attributes:
+        exercise_ids (List[str]): Suggested exercises in the order they were chosen.
+        loads (pd.Series): Effective load per muscle (in %, incl. readiness factor)
+            after baseline and plan.
+        coverage (float): Share of the target load reached on the target muscles (0–1).
+        timed_out (bool): True if the time budget ended the search early.
+        elapsed_ms (float): Search time in ms.
+    """
+
+    def __init__(self, exercise_ids: List[str], loads: pd.Series, coverage: float, timed_out: bool, elapsed_ms: float):
+        self.exercise_ids = exercise_ids
+        self.loads = loads
+        self.coverage = coverage
+        self.timed_out = timed_out
+        self.elapsed_ms = elapsed_ms
+
+
+@traced("planner.optimize_plan")
+def optimize_plan(
+    target_muscles: Iterable[str],
+    equipment: Optional[Iterable[str]] = None,
+    excluded_muscles: Iterable[str] = (),
+    factor: float = 1.0,
+    baseline: Optional[pd.Series] = None,
+    exclude_exercises: Iterable[str] = (),
+    max_exercises: int = MAX_EXERCISES,
+    beam_width: int = BEAM_WIDTH,
+    time_budget_ms: float = TIME_BUDGET_MS,
+    threshold: float = OVERLOAD_THRESHOLD,
+    index: Optional[SubstitutionIndex] = None,
+) -> Plan:
+    """
+    Search the catalog for a session that trains the target muscles without overloading any muscle.
+
+    Beam search over exercise sets: in every step, each plan in the beam is
+    extended by every remaining exercise at once (one comparison of the
+    candidate matrix with the plan's headroom for feasibility, one
+    ``minimum``/``sum`` for the coverage), and the best ``beam_width``
+    extensions are kept. The score is the target load reached (capped at
+    TARGET_LOAD per muscle) minus BALANCE_WEIGHT times the load put on all
+    other muscles. No muscle may exceed ``threshold`` after applying the
+    readiness ``factor``, exactly as in ``load_model.overloaded_muscles``;
+    muscles the baseline already overloads only exclude the exercises that
+    load them.
+
+    Args:
+        target_muscles (Iterable[str]): Muscles to train.
+        equipment (Optional[Iterable[str]]): Available equipment (None = any).
+        excluded_muscles (Iterable[str]): Muscles that must not be used at all.
+        factor (float): Readiness factor (see ``readiness.readiness_factor``).
+        baseline (Optional[pd.Series]): Effective load per muscle before the plan
+            (``compute_muscle_loads(..., factor=1.0)["load"]``); None = no load.
+        exclude_exercises (Iterable[str]): Exercises that must not be suggested
+            (e.g. already selected ones, which belong in ``baseline``).
+        max_exercises (int): Maximum number of exercises.
+        beam_width (int): Number of plans kept per step (1 = greedy).
+        time_budget_ms (float): Time budget of the search.
+        threshold (float): Overload threshold in %.
+        index (Optional[SubstitutionIndex]): Catalog and filter metadata
+            (defaults to the index of the current catalog).
+
+    Returns:
+        Plan: The best plan found.
+    """
+    start = time.perf_counter()
+    deadline = start + time_budget_ms / 1000
+    index = index or substitution_index()
+    catalog = index.catalog
+    n_muscles = len(catalog.muscles)
+
+    base = np.zeros(n_muscles)
+    if baseline is not None:
+        base = baseline.reindex(catalog.muscles).fillna(0).to_numpy(dtype=float)
+    targets = np.array(sorted({index.muscle_index[m] for m in target_muscles if m in index.muscle_index}), dtype=int)
+    off_target = np.ones(n_muscles, dtype=bool)
+    off_target[targets] = False
+
+    # Constraint and cap in unscaled load: factor * load <= threshold  <=>  load <= threshold / factor
+    limit = threshold / factor - base
+    cap = TARGET_LOAD / factor
+
+    mask = index.candidate_mask(avoid_muscles=excluded_muscles, equipment=equipment)
+    for ex_id in exclude_exercises:
+        row = catalog.row_index.get(ex_id)
+        if row is not None:
+            mask[row] = False
+    candidates = np.flatnonzero(mask)
+    matrix = np.asarray(catalog.matrix[candidates], dtype=float)
+    # Exercises that overload a muscle on their own can never be part of a plan. Only muscles
+    # an exercise loads are constrained, so a muscle the baseline already overloads
+    # (negative limit) rules out the exercises using it, not all of them.
+    alone = ((matrix == 0) | (matrix <= limit)).all(axis=1) & (matrix[:, targets].sum(axis=1) > 0)
+    candidates, matrix = candidates[alone], matrix[alone]
+    target_matrix = matrix[:, targets]
+    off_target_load = matrix[:, off_target].sum(axis=1)
+
+    def score(plan_load: np.ndarray) -> float:
+        reached = np.minimum(base[targets] + plan_load[targets], cap).sum()
+        return float(reached - BALANCE_WEIGHT * plan_load[off_target].sum())
+
+    empty: _State = ((), np.zeros(n_muscles), score(np.zeros(n_muscles)))
+    beam, best = [empty], empty
+    timed_out = False
+
+    for _ in range(max_exercises if len(targets) else 0):
+        if timed_out:
+            break
+        extensions: List[Tuple[float, Tuple[int, ...]]] = []
+        for chosen, plan_load, plan_score in beam:
+            feasible = ((matrix == 0) | (matrix <= limit - plan_load)).all(axis=1)
+            feasible[list(chosen)] = False
+            reached = np.minimum(base[targets] + plan_load[targets] + target_matrix, cap).sum(axis=1)
+            scores = reached - BALANCE_WEIGHT * (plan_load[off_target].sum() + off_target_load)
+            improving = np.flatnonzero(feasible & (scores > plan_score + 1e-9))
+            if len(improving) > beam_width:
+                improving = improving[np.argpartition(-scores[improving], beam_width - 1)[:beam_width]]
+            extensions.extend((float(scores[i]), chosen + (int(i),)) for i in improving)
+            if time.perf_counter() > deadline:
+                timed_out = True
+                break
+        if not extensions:
+            break
+
+        extensions.sort(key=lambda extension: -extension[0])
+        beam, seen = [], set()
+        for ext_score, chosen in extensions:
+            key = frozenset(chosen)
+            if key in seen:
+                continue
+            seen.add(key)
+            beam.append((chosen, matrix[list(chosen)].sum(axis=0), ext_score))
+            if len(beam) == beam_width:
+                break
+        if beam[0][2] > best[2]:
+            best = beam[0]
+
+    chosen, plan_load, _ = best
+    total = base + plan_load
+    coverage = float(np.minimum(total[targets], cap).sum() / (cap * len(targets))) if len(targets) else 0.0
+    return Plan(
+        exercise_ids=[catalog.exercise_ids[candidates[i]] for i in chosen],
+        loads=pd.Series(total * factor, index=catalog.muscles),
+        coverage=coverage,
+        timed_out=timed_out,
+        elapsed_ms=(time.perf_counter() - start) * 1000,
+    )
@@ -0,0 +1,264 @@
+import cProfile
+import functools
+import io
+import itertools
+import marshal
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, deque
+from typing import Any, Callable, Deque, Dict, Optional
+
+import dash
+import flask
+
+from metrics import wrap_callbacks
+
+# Profiling hooks are only installed if BAYHEALTH_PROFILING=1 (never expose them publicly)
+PROFILING_ENABLED = os.environ.get("BAYHEALTH_PROFILING", "0") == "1"
+PROFILE_HEADER = "X-Bayhealth-Profile"
+PROFILE_MODES = ("cprofile", "sample")
+SAMPLE_INTERVAL = float(os.environ.get("BAYHEALTH_PROFILE_SAMPLE_INTERVAL", "0.001"))
+MAX_RESULTS = 20
+TRACEMALLOC_FRAMES = 25
+TRACEMALLOC_TOP = 30
+
+
+class StackSampler:
+    """
+    Statistical profiler sampling the stack of one thread at a fixed interval.
+
+    The samples are aggregated into collapsed stacks (``root;...;leaf count``),
+    the input format of flamegraph.pl and speedscope.
+    """
+
+    def __init__(self, thread_id: int, interval: float = SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def collapsed(self) -> str:
+        """Return the samples as collapsed stacks."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+class CallbackProfiler:
+    """
+    Opt-in profiling of single callback executions.
+
+    A profile is taken either for the callbacks of one request carrying the
+    ``X-Bayhealth-Profile: cprofile|sample[,memory]`` header, or for the next N
+    callback executions armed via ``POST /_profile``. Only one execution is
+    profiled at a time (``cProfile`` cannot run in two threads at once);
+    concurrent executions run unprofiled. Results are kept in memory.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._active = threading.Lock()
+        self._ids = itertools.count(1)
+        self.armed: Dict[str, Any] = {"remaining": 0, "mode": "cprofile", "memory": False}
+        self.results: Deque[Dict[str, Any]] = deque(maxlen=MAX_RESULTS)
+
+    def arm(self, count: int, mode: str, memory: bool) -> None:
+        """Profile the next ``count`` callback executions."""
+        with self._lock:
+            self.armed = {"remaining": count, "mode": mode, "memory": memory}
+
+    def _take(self) -> Optional[Dict[str, Any]]:
+        """Return the requested profile settings for this execution, if any."""
+        requested = flask.g.get("bayhealth_profile") if flask.has_request_context() else None
+        if requested:
+            return requested
+        if not self.armed["remaining"]:
+            return None
+        with self._lock:
+            if not self.armed["remaining"]:
+                return None
+            self.armed["remaining"] -= 1
+            return dict(self.armed)
+
+    def instrument(self, func: Callable[..., Any], name: str) -> Callable[..., Any]:
+        """
+        Wrap a callback function so that it can be profiled on demand.
+
+        Args:
+            func (Callable): Callback function as stored in ``app.callback_map``.
+            name (str): Callback name used in the results.
+
+        Returns:
+            Callable: Wrapped function.
+        """
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            settings = self._take()
+            if settings is None or not self._active.acquire(blocking=False):
+                return func(*args, **kwargs)
+            try:
+                return self._profile(func, name, settings, args, kwargs)
+            finally:
+                self._active.release()
+
+        return wrapper
+
+    def _profile(self, func: Callable[..., Any], name: str, settings: Dict[str, Any], args: tuple, kwargs: dict) -> Any:
+        """Run one callback execution under the requested profiler and store the result."""
+        files: Dict[str, bytes] = {}
+        started_tracing = settings["memory"] and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        before = tracemalloc.take_snapshot() if settings["memory"] else None
+
+        profile = sampler = None
+        if settings["mode"] == "sample":
+            sampler = StackSampler(threading.get_ident())
+            sampler.start()
+        else:
+            profile = cProfile.Profile()
+            profile.enable()
+
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            duration = time.perf_counter() - start
+            if sampler is not None:
+                sampler.stop()
+                files["collapsed"] = sampler.collapsed().encode("utf-8")
+            else:
+                profile.disable()
+                profile.create_stats()
+                files["pstats"] = marshal.dumps(profile.stats)  # same format as Profile.dump_stats
+
+            if before is not None:
+                after = tracemalloc.take_snapshot()
+                if started_tracing:
+                    tracemalloc.stop()
+                # Leave out the allocations of the profiling machinery itself
+                ignore = [tracemalloc.Filter(False, path) for path in (tracemalloc.__file__, cProfile.__file__, __file__)]
+                diff = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "lineno")
+                report = io.StringIO()
+                for stat in diff[:TRACEMALLOC_TOP]:
+                    report.write(f"{stat}\n")
+                files["memory"] = report.getvalue().encode("utf-8")
+
+            with self._lock:
+                self.results.appendleft({
+                    "id": next(self._ids),
+                    "callback": name,
+                    "mode": settings["mode"],
+                    "duration_ms": round(duration * 1000, 3),
+                    "created": time.time(),
+                    "files": files,
+                })
+
+    def get(self, result_id: int) -> Optional[Dict[str, Any]]:
+        """Return a stored result by ID."""
+        with self._lock:
+            return next((result for result in self.results if result["id"] == result_id), None)
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the armed settings and an overview of the stored results."""
+        with self._lock:
+            return {
+                "armed": dict(self.armed),
+                "results": [
+                    {**{k: v for k, v in result.items() if k != "files"},
+                     "files": [f"/_profile/{result['id']}.{kind}" for kind in result["files"]]}
+                    for result in self.results
+                ],
+            }
+
+
+# Download formats of the stored results
+_FILE_TYPES = {
+    "pstats": ("application/octet-stream", "pstats"),
+    "collapsed": ("text/plain", "collapsed.txt"),
+    "memory": ("text/plain", "memory.txt"),
+}
+
+
+def install_profiler(app: dash.Dash) -> Optional[CallbackProfiler]:
+    """
+    Install the opt-in callback profiler (only if ``BAYHEALTH_PROFILING=1``).
+
+    Routes:
+        - ``GET /_profile``: armed settings and stored results (JSON).
+        - ``POST /_profile?count=N&mode=cprofile|sample&memory=1``: profile the next N executions.
+        - ``GET /_profile/<id>.<pstats|collapsed|memory>``: download a result.
+
+    When disabled, no hook or wrapper is installed at all.
+
+    Args:
+        app (dash.Dash): Dash application.
+
+    Returns:
+        Optional[CallbackProfiler]: The profiler (None if disabled).
+    """
+    if not PROFILING_ENABLED:
+        return None
+
+    profiler = CallbackProfiler()
+    server = app.server
+    wrap_callbacks(app, profiler.instrument)
+
+    @server.before_request
+    def request_profile() -> None:
+        # e.g. "X-Bayhealth-Profile: sample,memory"
+        options = {option.strip() for option in flask.request.headers.get(PROFILE_HEADER, "").lower().split(",")}
+        mode = next((mode for mode in PROFILE_MODES if mode in options), None)
+        if mode is not None:
+            flask.g.bayhealth_profile = {"mode": mode, "memory": "memory" in options}
+
+    @server.route("/_profile", methods=["GET", "POST"])
+    def profile_control() -> flask.Response:
+        if flask.request.method == "POST":
+            mode = flask.request.args.get("mode", "cprofile")
+            if mode not in PROFILE_MODES:
+                return flask.jsonify(error=f"mode must be one of {PROFILE_MODES}"), 400
+            # type=int falls back to the default on invalid values, so they are checked separately
+            count = flask.request.args.get("count", 1, type=int)
+            if not flask.request.args.get("count", "1").isdigit():
+                return flask.jsonify(error="count must be a non-negative integer"), 400
+            profiler.arm(
+                count=count,
+                mode=mode,
+                memory=flask.request.args.get("memory") == "1",
+            )
+        return flask.jsonify(profiler.summary())
+
+    @server.route("/_profile/<int:result_id>.<kind>")
+    def profile_download(result_id: int, kind: str) -> flask.Response:
+        result = profiler.get(result_id)
+        if result is None or kind not in result["files"]:
+            flask.abort(404)
+        mimetype, extension = _FILE_TYPES[kind]
+        return flask.Response(
+            result["files"][kind],
+            mimetype=mimetype,
+            headers={"Content-Disposition": f"attachment; filename={result['callback']}-{result_id}.{extension}"},
+        )
+
+    return profiler
@@ -0,0 +1,160 @@
+from datetime import date
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from constants import RECOVERY_QUESTIONS
+from tracing import traced
+
+# Fixed question order of all rating vectors
+QUESTION_IDS: List[str] = list(RECOVERY_QUESTIONS)
+
+# Span (in submissions) of the per-question weighted moving average
+READINESS_SPAN = 5
+
+# Submissions kept in the session's ``readiness_history`` field (oldest are dropped)
+READINESS_HISTORY_SIZE = 365
+
+# Mean rating that yields a load factor of 1.0.
+# Equivalent to the former ``star_factor = 1 / (total_stars / 25)`` with six questions,
+# i.e. all ratings at 5 give 0.83 and lower ratings increase the factor.
+REFERENCE_RATING = 25 / 6
+
+
+def empty_state() -> Dict[str, Any]:
+    """
+    Create the readiness state of a session without any submission.
+
+    Returns:
+        dict: State with per-question averages and weights, submission count and cached factor.
+    """
+    return {
+        "averages": [None] * len(QUESTION_IDS),
+        "weights": [0.0] * len(QUESTION_IDS),
+        "count": 0,
+        "factor": 1.0,
+    }
+
+
+def _ratings_vector(star_results: Optional[Dict[str, Any]]) -> List[Optional[float]]:
+    """Order star results by QUESTION_IDS; unanswered or invalid ratings become None."""
+    star_results = star_results or {}
+    vector = []
+    for question_id in QUESTION_IDS:
+        rating = star_results.get(question_id)
+        vector.append(float(rating) if isinstance(rating, (int, float)) and 1 <= rating <= 5 else None)
+    return vector
+
+
+def _factor(averages: List[Optional[float]]) -> float:
+    """Load factor from the per-question averages; 1.0 if nothing has been rated."""
+    rated = [value for value in averages if value is not None]
+    if not rated:
+        return 1.0
+    return REFERENCE_RATING / (sum(rated) / len(rated))
+
+
+def update_state(state: Optional[Dict[str, Any]], star_results: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Fold one submission into the readiness state.
+
+    Each answered question updates its exponentially weighted moving average
+    in O(1); unanswered questions keep their previous average. The bias of
+    the first submissions is removed by normalizing with the accumulated
+    weight, so the first rating is taken as-is.
+
+    Args:
+        state (Optional[dict]): Previous state (None for a new session).
+        star_results (Optional[dict]): Ratings per question ID (1–5), possibly partial.
+
+    Returns:
+        dict: New state including the cached load factor.
+    """
+    state = state or empty_state()
+    alpha = 2 / (READINESS_SPAN + 1)
+
+    averages, weights = list(state["averages"]), list(state["weights"])
+    for i, rating in enumerate(_ratings_vector(star_results)):
+        if rating is None:
+            continue
+        previous_sum = (averages[i] or 0.0) * weights[i]
+        weights[i] = (1 - alpha) * weights[i] + alpha
+        averages[i] = ((1 - alpha) * previous_sum + alpha * rating) / weights[i]
+
+    return {
+        "averages": averages,
+        "weights": weights,
+        "count": state["count"] + 1,
+        "factor": _factor(averages),
+    }
+
+
+def submit(
+    readiness: Optional[Dict[str, Any]],
+    history: Optional[List[Dict[str, Any]]],
+    star_results: Optional[Dict[str, Any]],
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Persist a health state submission and update the rolling readiness.
+
+    The readiness data only holds what ``readiness_factor`` needs (state and
+    last ratings), so every load callback fetches a small field; the
+    submissions go to the separate ``readiness_history`` field, capped at
+    READINESS_HISTORY_SIZE entries. Readiness data of the former layout
+    (with the history inside) is migrated.
+
+    Args:
+        readiness (Optional[dict]): Stored readiness data (``state`` and ``last``).
+        history (Optional[List[dict]]): Stored submissions (``readiness_history``).
+        star_results (Optional[dict]): Submitted ratings per question ID.
+
+    Returns:
+        Tuple[dict, List[dict]]: Updated readiness data and history.
+    """
+    readiness = readiness or {"state": empty_state(), "last": None}
+    if history is None:
+        history = readiness.get("history", [])
+    ratings = _ratings_vector(star_results)
+    history = (history + [{"date": date.today().isoformat(), "ratings": ratings}])[-READINESS_HISTORY_SIZE:]
+    return {"state": update_state(readiness["state"], star_results), "last": ratings}, history
+
+
+@lru_cache(maxsize=256)
+def _preview_factor(state_key: Tuple, ratings_key: Tuple) -> float:
+    """Factor after a provisional update with not yet submitted ratings (cached)."""
+    averages, weights, count = state_key
+    state = {"averages": list(averages), "weights": list(weights), "count": count, "factor": 1.0}
+    return update_state(state, dict(ratings_key))["factor"]
+
+
+@traced("readiness.readiness_factor")
+def readiness_factor(
+    readiness: Optional[Dict[str, Any]],
+    star_results: Optional[Dict[str, Any]] = None,
+) -> float:
+    """
+    Single entry point for the recovery factor applied to muscle loads.
+
+    Returns the factor cached in the session's readiness state. If the
+    questionnaire currently holds ratings that differ from the last
+    submission, they are folded in provisionally (without persisting).
+
+    Args:
+        readiness (Optional[dict]): Stored readiness data (``state`` and ``last``).
+        star_results (Optional[dict]): Current (possibly unsaved) ratings.
+
+    Returns:
+        float: Factor applied to the effective muscle load.
+    """
+    readiness = readiness or {"state": empty_state(), "last": None}
+    state = readiness["state"]
+
+    ratings = _ratings_vector(star_results)
+    if "last" in readiness:
+        last = readiness["last"]
+    else:
+        last = readiness["history"][-1]["ratings"] if readiness.get("history") else None
+    if not any(rating is not None for rating in ratings) or ratings == last:
+        return state["factor"]
+
+    state_key = (tuple(state["averages"]), tuple(state["weights"]), state["count"])
+    return _preview_factor(state_key, tuple(sorted((star_results or {}).items())))
@@ -0,0 +1,226 @@
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+import dash
+import flask
+import numpy as np
+
+from session_store import session_store
+
+# Number of (session, exercise) series kept per process
+SERIES_CACHE_SIZE = 256
+# Downsampled views (metric × range × width × day) kept per series
+SERIES_VIEWS_PER_ENTRY = 16
+# Chart width (in px, = points) used when the client does not send one, and the upper limit
+DEFAULT_WIDTH = 400
+MAX_WIDTH = 4000
+
+METRICS = ("tonnage", "e1rm")
+# Selectable ranges in days (None = whole history)
+RANGES: Dict[str, Optional[int]] = {"90": 90, "365": 365, "all": None}
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Downsample a series with Largest-Triangle-Three-Buckets.
+
+    The first and last point are kept; the points in between are split into
+    ``threshold - 2`` buckets, and from every bucket the point forming the
+    largest triangle with the previously selected point and the average of
+    the next bucket is kept. This preserves peaks and the visual shape far
+    better than taking every n-th point.
+
+    Args:
+        x (np.ndarray): Strictly increasing x values.
+        y (np.ndarray): y values.
+        threshold (int): Number of points to keep.
+
+    Returns:
+        np.ndarray: Indices of the selected points (ascending).
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    edges = np.floor(np.linspace(1, n - 1, threshold - 1)).astype(int)
+    selected = np.empty(threshold, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_start, next_end = edges[i + 1], edges[i + 2] if i + 2 < len(edges) else n
+        avg_x, avg_y = x[next_start:next_end].mean(), y[next_start:next_end].mean()
+        # Twice the triangle area, vectorized over the bucket
+        area = np.abs(
+            (x[previous] - avg_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (avg_y - y[previous])
+        )
+        previous = start + int(np.argmax(area))
+        selected[i + 1] = previous
+    return selected
+
+
+def _day_metrics(entry: Dict[str, Any]) -> Tuple[float, float]:
+    """Tonnage (Σ reps × weight) and best estimated 1RM (Epley) of one logged entry."""
+    tonnage, e1rm = 0.0, 0.0
+    for row in entry.get("sets") or []:
+        try:
+            reps, weight = float(row.get("Wdh")), float(row.get("Gewicht"))
+        except (TypeError, ValueError):
+            continue
+        if reps > 0 and weight > 0:
+            tonnage += reps * weight
+            e1rm = max(e1rm, weight * (1 + reps / 30))
+    return tonnage, e1rm
+
+
+def build_series(training_log: Dict[str, List[Dict[str, Any]]], exercise_id: str, since: Optional[str] = None) -> Dict[str, np.ndarray]:
+    """
+    Compute the daily progress series of one exercise.
+
+    Args:
+        training_log (Dict[str, List[Dict[str, Any]]]): Logged sessions per ISO date.
+        exercise_id (str): Exercise.
+        since (Optional[str]): Only include days on or after this ISO date.
+
+    Returns:
+        Dict[str, np.ndarray]: ``days`` (date ordinals) and one array per metric in METRICS.
+    """
+    points = []
+    for day, entries in training_log.items():
+        if since is not None and day < since:
+            continue
+        for entry in entries:
+            if entry.get("exercise") == exercise_id:
+                points.append((date.fromisoformat(day).toordinal(), *_day_metrics(entry)))
+    points.sort()
+    values = np.array(points, dtype=float).reshape(-1, 3)
+    return {"days": values[:, 0].astype(int), "tonnage": values[:, 1], "e1rm": values[:, 2]}
+
+
+class SeriesCache:
+    """
+    Per-process LRU cache of progress series and their downsampled views.
+
+    Entries are keyed by (session, exercise) and remember the session
+    version they were built for. When the session changed (e.g. a set was
+    logged in any worker), only the tail of the series is recomputed –
+    logging only ever changes today's entry. Downsampled views are dropped
+    only if the tail of this exercise actually changed, so logging one
+    exercise keeps the cached charts of all others. Each series keeps at
+    most SERIES_VIEWS_PER_ENTRY views (least recently used are dropped).
+    """
+
+    def __init__(self, capacity: int = SERIES_CACHE_SIZE):
+        self.capacity = capacity
+        self._entries: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _series(self, session: Dict[str, Any], exercise_id: str) -> Dict[str, Any]:
+        """Return the up-to-date cache entry of a session's exercise series."""
+        key, version = (session["sid"], exercise_id), session.get("version", 0)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._entries[key] = entry
+        if entry is not None and entry["version"] >= version:
+            return entry
+
+        training_log = session_store.get(session, "training_log")["training_log"] or {}
+        if entry is None:
+            entry = {"series": build_series(training_log, exercise_id), "views": OrderedDict()}
+        else:
+            series = entry["series"]
+            since = date.fromordinal(int(series["days"][-1])).isoformat() if len(series["days"]) else None
+            tail = build_series(training_log, exercise_id, since)
+            head = series["days"] < (series["days"][-1] if len(series["days"]) else 0)
+            if any(not np.array_equal(series[name][~head], tail[name]) for name in series):
+                entry = {"series": {name: np.concatenate([series[name][head], tail[name]]) for name in series}, "views": OrderedDict()}
+        entry["version"] = version
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+        return entry
+
+    def get(
+        self,
+        session: Dict[str, Any],
+        exercise_id: str,
+        metric: str = "tonnage",
+        range_key: str = "365",
+        width: int = DEFAULT_WIDTH,
+        today: Optional[date] = None,
+    ) -> Dict[str, Any]:
+        """
+        Return a series downsampled to (at most) one point per pixel.
+
+        Args:
+            session (Dict[str, Any]): Session reference (``sid`` and ``version``).
+            exercise_id (str): Exercise.
+            metric (str): One of METRICS.
+            range_key (str): Key of RANGES.
+            width (int): Chart width in px.
+            today (Optional[date]): End of the range (defaults to today).
+
+        Returns:
+            Dict[str, Any]: ``x`` (ISO dates), ``y`` and ``points`` (points before downsampling).
+        """
+        width = int(min(max(width, 3), MAX_WIDTH))
+        entry = self._series(session, exercise_id)
+        view_key = (metric, range_key, width, (today or date.today()).toordinal())
+        with self._lock:
+            view = entry["views"].get(view_key)
+            if view is not None:
+                entry["views"].move_to_end(view_key)
+        if view is None:
+            series = entry["series"]
+            days, values = series["days"], series[metric]
+            # Days without weighted sets have no tonnage/1RM and are left out
+            shown = values > 0
+            if RANGES[range_key] is not None:
+                shown &= days > view_key[3] - RANGES[range_key]
+            days, values = days[shown], values[shown]
+            selected = lttb(days.astype(float), values, width)
+            view = {
+                "x": [date.fromordinal(int(day)).isoformat() for day in days[selected]],
+                "y": values[selected].round(1).tolist(),
+                "points": len(days),
+            }
+            with self._lock:
+                entry["views"][view_key] = view
+                while len(entry["views"]) > SERIES_VIEWS_PER_ENTRY:
+                    entry["views"].popitem(last=False)
+        return view
+
+
+series_cache = SeriesCache()
+
+
+def install_series_endpoint(app: dash.Dash) -> None:
+    """
+    Expose the downsampled progress series as JSON.
+
+    ``GET /_series/<exercise_id>?sid=&version=&metric=tonnage|e1rm&range=90|365|all&width=<px>``
+
+    ``version`` is the session version the client knows; it is required,
+    since any cached series would satisfy a missing (zero) version.
+
+    Args:
+        app (dash.Dash): Dash application.
+    """
+    @app.server.route("/_series/<exercise_id>")
+    def series_endpoint(exercise_id: str) -> flask.Response:
+        args = flask.request.args
+        metric, range_key = args.get("metric", "tonnage"), args.get("range", "365")
+        if metric not in METRICS or range_key not in RANGES or "sid" not in args or not args.get("version", "").isdigit():
+            return flask.jsonify(error="sid, version, metric (tonnage|e1rm) and range (90|365|all) required"), 400
+        session = {"sid": args["sid"], "version": int(args["version"])}
+        if not session_store.exists(session):
+            return flask.jsonify(error="unknown session"), 404
+        view = series_cache.get(session, exercise_id, metric, range_key, args.get("width", DEFAULT_WIDTH, type=int))
+        return flask.jsonify(view)
@@ -0,0 +1,213 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from tracing import child_span
+
+# Location of the SQLite backend and size of the in-memory LRU cache
+SESSION_DB_PATH = os.environ.get("BAYHEALTH_SESSION_DB", "data/sessions.sqlite3")
+SESSION_CACHE_SIZE = int(os.environ.get("BAYHEALTH_SESSION_CACHE_SIZE", "512"))
+
+
+class SessionStore:
+    """
+    Server-side session state: in-memory LRU cache in front of a SQLite file.
+
+    The client only keeps a session reference ``{"sid": ..., "version": ...}``
+    in a ``dcc.Store``. Every write bumps the version, so a cached entry that
+    is older than the version sent by the client (e.g. written by another
+    worker process) is reloaded from SQLite. Fields are loaded individually,
+    so callbacks only fetch what they need. Read-modify-write updates go
+    through ``modify``, which runs them atomically.
+    """
+
+    def __init__(self, path: str = SESSION_DB_PATH, capacity: int = SESSION_CACHE_SIZE):
+        self.path = path
+        self.capacity = capacity
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection for one transaction and create the schema on first use."""
+        if not self._initialized:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=10)
+        try:
+            with connection:
+                if not self._initialized:
+                    self._create_schema(connection)
+                yield connection
+        finally:
+            connection.close()
+
+    def _create_schema(self, connection: sqlite3.Connection) -> None:
+        """Create the tables of the backend (idempotent)."""
+        if not self._initialized:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS sessions "
+                "(sid TEXT PRIMARY KEY, version INTEGER NOT NULL, updated REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS fields "
+                "(sid TEXT NOT NULL, name TEXT NOT NULL, value TEXT NOT NULL, PRIMARY KEY (sid, name))"
+            )
+            self._initialized = True
+
+    def _cached(self, sid: str) -> Dict[str, Any]:
+        """Return the cache entry of a session (most recently used), evicting the oldest."""
+        entry = self._cache.pop(sid, None) or {"version": -1, "fields": {}}
+        self._cache[sid] = entry
+        while len(self._cache) > self.capacity:
+            self._cache.popitem(last=False)
+        return entry
+
+    def create(self) -> Dict[str, Any]:
+        """
+        Create a new, empty session.
+
+        Returns:
+            dict: Session reference for the client store.
+        """
+        sid = uuid.uuid4().hex
+        with self._lock, self._connect() as connection:
+            connection.execute(
+                "INSERT INTO sessions (sid, version, updated) VALUES (?, 0, ?)", (sid, time.time())
+            )
+            self._cached(sid).update(version=0)
+        return {"sid": sid, "version": 0}
+
+    def exists(self, session: Optional[Dict[str, Any]]) -> bool:
+        """
+        Check whether a client session reference points to a known session.
+
+        Args:
+            session (Optional[dict]): Session reference from the client store.
+
+        Returns:
+            bool: True if the session exists.
+        """
+        if not session or "sid" not in session:
+            return False
+        if session["sid"] in self._cache:
+            return True
+        with self._lock, self._connect() as connection:
+            row = connection.execute("SELECT 1 FROM sessions WHERE sid = ?", (session["sid"],)).fetchone()
+        return row is not None
+
+    def get(self, session: Optional[Dict[str, Any]], *names: str) -> Dict[str, Any]:
+        """
+        Fetch selected fields of a session.
+
+        Args:
+            session (Optional[dict]): Session reference from the client store.
+            *names (str): Field names to load.
+
+        Returns:
+            dict: Field values by name (None for fields that were never written).
+        """
+        if not session or "sid" not in session:
+            return {name: None for name in names}
+
+        sid, version = session["sid"], session.get("version", 0)
+        with self._lock, child_span("session_store.get", fields=list(names)) as current:
+            entry = self._cached(sid)
+            if entry["version"] < version:
+                entry.update(version=version, fields={})
+
+            missing = [name for name in names if name not in entry["fields"]]
+            if missing:
+                with self._connect() as connection:
+                    rows = connection.execute(
+                        f"SELECT name, value FROM fields WHERE sid = ? AND name IN ({','.join('?' * len(missing))})",
+                        (sid, *missing),
+                    ).fetchall()
+                loaded = {name: json.loads(value) for name, value in rows}
+                current.set(loaded_from_db=missing)
+                for name in missing:
+                    entry["fields"][name] = loaded.get(name)
+
+            return {name: entry["fields"][name] for name in names}
+
+    def update(self, session: Dict[str, Any], **fields: Any) -> Dict[str, Any]:
+        """
+        Write fields of a session and bump its version.
+
+        Args:
+            session (dict): Session reference from the client store.
+            **fields (Any): JSON-serializable field values.
+
+        Returns:
+            dict: New session reference for the client store.
+        """
+        sid = session["sid"]
+        with self._lock, child_span("session_store.update", fields=list(fields)), self._connect() as connection:
+            version = self._write(connection, sid, fields)
+        return {"sid": sid, "version": version}
+
+    def modify(
+        self,
+        session: Dict[str, Any],
+        change: Callable[[Dict[str, Any]], Dict[str, Any]],
+        *names: str,
+    ) -> Dict[str, Any]:
+        """
+        Atomically read fields of a session, derive new values and write them.
+
+        The fields are read from SQLite inside a write transaction
+        (``BEGIN IMMEDIATE``) while the in-process lock is held, so concurrent
+        updates of the same session, from this or another worker process,
+        are applied one after the other and none is lost. ``change`` runs
+        inside the transaction and should be quick.
+
+        Args:
+            session (dict): Session reference from the client store.
+            change (Callable[[dict], dict]): Receives the current values of
+                ``names`` (None if never written) and returns the fields to write.
+            *names (str): Field names to read.
+
+        Returns:
+            dict: New session reference for the client store.
+        """
+        sid = session["sid"]
+        with self._lock, child_span("session_store.modify", fields=list(names)), self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            rows = connection.execute(
+                f"SELECT name, value FROM fields WHERE sid = ? AND name IN ({','.join('?' * len(names))})",
+                (sid, *names),
+            ).fetchall()
+            loaded = {name: json.loads(value) for name, value in rows}
+            version = self._write(connection, sid, change({name: loaded.get(name) for name in names}))
+        return {"sid": sid, "version": version}
+
+    def _write(self, connection: sqlite3.Connection, sid: str, fields: Dict[str, Any]) -> int:
+        """Write fields in the open transaction, bump the version and update the cache entry."""
+        connection.executemany(
+            "INSERT OR REPLACE INTO fields (sid, name, value) VALUES (?, ?, ?)",
+            [(sid, name, json.dumps(value)) for name, value in fields.items()],
+        )
+        connection.execute(
+            "INSERT INTO sessions (sid, version, updated) VALUES (?, 1, ?) "
+            "ON CONFLICT(sid) DO UPDATE SET version = version + 1, updated = excluded.updated",
+            (sid, time.time()),
+        )
+        version = connection.execute("SELECT version FROM sessions WHERE sid = ?", (sid,)).fetchone()[0]
+
+        entry = self._cached(sid)
+        if entry["version"] < version - 1:
+            entry["fields"] = {}
+        entry["version"] = version
+        entry["fields"].update(fields)
+        return version
+
+
+# Shared store instance used by all callbacks
+session_store = SessionStore()
@@ -0,0 +1,97 @@
+from typing import Any, Dict, List, Optional
+
+from constants import EXERCISES, RECOVERY_QUESTIONS
+
+# Schema version of the compact client store encoding.
+# Version 0 is the legacy format (exercise-id strings / question-name dict).
+STORE_SCHEMA_VERSION = 1
+
+# Fixed orders that the integer encodings refer to
+EXERCISE_IDS: List[str] = [ex["id"] for ex in EXERCISES]
+QUESTION_IDS: List[str] = list(RECOVERY_QUESTIONS)
+_EXERCISE_INDEX: Dict[str, int] = {ex_id: i for i, ex_id in enumerate(EXERCISE_IDS)}
+
+
+def encode_exercises(exercise_ids: Optional[List[str]]) -> Dict[str, Any]:
+    """
+    Encode selected exercises as an index array over the catalog order.
+
+    The selection order is kept (it determines the order of the progress
+    cards); IDs that are not part of the catalog are dropped.
+
+    Args:
+        exercise_ids (Optional[List[str]]): Selected exercise IDs.
+
+    Returns:
+        dict: Compact store data ``{"v": 1, "x": [<catalog index>, ...]}``.
+    """
+    return {
+        "v": STORE_SCHEMA_VERSION,
+        "x": [_EXERCISE_INDEX[ex_id] for ex_id in exercise_ids or [] if ex_id in _EXERCISE_INDEX],
+    }
+
+
+def decode_exercises(data: Any) -> List[str]:
+    """
+    Decode the ``added-exercises`` store into exercise IDs.
+
+    Accepts the current schema as well as the legacy list of ID strings,
+    so stores written by an older version are migrated transparently. Data
+    of an unknown schema version is treated as an empty selection.
+
+    Args:
+        data (Any): Store data (compact dict, legacy list or None).
+
+    Returns:
+        List[str]: Selected exercise IDs.
+    """
+    if not data:
+        return []
+    if isinstance(data, list):
+        return [ex_id for ex_id in data if ex_id in _EXERCISE_INDEX]
+    if not isinstance(data, dict) or data.get("v") != STORE_SCHEMA_VERSION:
+        return []
+    return [EXERCISE_IDS[i] for i in data.get("x", []) if 0 <= i < len(EXERCISE_IDS)]
+
+
+def encode_ratings(ratings: Optional[Dict[str, int]]) -> Dict[str, Any]:
+    """
+    Encode star ratings as a fixed-order small-int array (0 = not rated).
+
+    Args:
+        ratings (Optional[Dict[str, int]]): Ratings (1–5) per question ID.
+
+    Returns:
+        dict: Compact store data ``{"v": 1, "r": [<rating>, ...]}``.
+    """
+    ratings = ratings or {}
+    return {
+        "v": STORE_SCHEMA_VERSION,
+        "r": [int(ratings.get(question_id) or 0) for question_id in QUESTION_IDS],
+    }
+
+
+def decode_ratings(data: Any) -> Dict[str, int]:
+    """
+    Decode the ``star-results`` store into ratings per question ID.
+
+    Accepts the current schema as well as the legacy question-name dict.
+    Data of an unknown schema version is treated as unrated.
+
+    Args:
+        data (Any): Store data (compact dict, legacy dict or None).
+
+    Returns:
+        Dict[str, int]: Ratings of the answered questions.
+    """
+    if not data or not isinstance(data, dict):
+        return {}
+    if "v" not in data:
+        return {question_id: rating for question_id, rating in data.items() if question_id in RECOVERY_QUESTIONS}
+    if data["v"] != STORE_SCHEMA_VERSION:
+        return {}
+    return {
+        question_id: rating
+        for question_id, rating in zip(QUESTION_IDS, data.get("r", []))
+        if rating
+    }
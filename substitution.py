@@ -0,0 +1,212 @@
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from catalog import Catalog, current_catalog, on_catalog_change
+from constants import EXERCISES
+
+# Usage (in %) up to which an exercise still counts as sparing a contraindicated muscle
+DEFAULT_TOLERANCE = 0.0
+# Muscles an exercise uses with at least this share of its highest usage are its
+# dominant muscles, which substitutes for a critically rated exercise must spare
+DOMINANT_SHARE = 0.5
+
+_METADATA: Dict[str, Dict[str, Any]] = {ex["id"]: ex for ex in EXERCISES}
+
+
+class SubstitutionIndex:
+    """
+    Similarity index over the muscle profiles of one catalog version.
+
+    Cosine similarities are computed as a single matrix-vector product with
+    the catalog's L2-normalized profiles (shared, memory-mapped). Category
+    and equipment are encoded as integer codes, so all filters are boolean
+    masks over the exercise axis.
+
+    Attributes:
+        catalog (Catalog): Catalog the index was built for.
+        categories (List[str]): Category names (code = list index).
+        equipment (List[str]): Equipment names (code = list index).
+    """
+
+    def __init__(self, catalog: Catalog):
+        self.catalog = catalog
+        metadata = [_METADATA.get(ex_id, {}) for ex_id in catalog.exercise_ids]
+        self.categories = sorted({m["category"] for m in metadata if "category" in m})
+        self.equipment = sorted({m["equipment"] for m in metadata if "equipment" in m})
+        category_code = {name: i for i, name in enumerate(self.categories)}
+        equipment_code = {name: i for i, name in enumerate(self.equipment)}
+        self.category_codes = np.array([category_code.get(m.get("category"), -1) for m in metadata], dtype=np.int32)
+        self.equipment_codes = np.array([equipment_code.get(m.get("equipment"), -1) for m in metadata], dtype=np.int32)
+        self.listed = np.array([bool(m) for m in metadata])
+        self.muscle_index = {muscle: i for i, muscle in enumerate(catalog.muscles)}
+
+    def _codes(self, names: Optional[Iterable[str]], vocabulary: List[str]) -> Optional[np.ndarray]:
+        if names is None:
+            return None
+        return np.array([vocabulary.index(name) for name in names if name in vocabulary], dtype=np.int32)
+
+    def candidate_mask(
+        self,
+        avoid_muscles: Iterable[str] = (),
+        equipment: Optional[Iterable[str]] = None,
+        categories: Optional[Iterable[str]] = None,
+        tolerance: float = DEFAULT_TOLERANCE,
+        listed_only: bool = True,
+    ) -> np.ndarray:
+        """
+        Select the exercises that pass the filters (see ``query``).
+
+        Returns:
+            np.ndarray: Boolean mask over the catalog's exercise axis.
+        """
+        mask = self.listed.copy() if listed_only else np.ones(len(self.listed), dtype=bool)
+        avoid = [self.muscle_index[muscle] for muscle in avoid_muscles if muscle in self.muscle_index]
+        if avoid:
+            mask &= self.catalog.matrix[:, avoid].max(axis=1) <= tolerance
+        equipment_codes = self._codes(equipment, self.equipment)
+        if equipment_codes is not None:
+            mask &= np.isin(self.equipment_codes, equipment_codes)
+        category_codes = self._codes(categories, self.categories)
+        if category_codes is not None:
+            mask &= np.isin(self.category_codes, category_codes)
+        return mask
+
+    def dominant_muscles(self, exercise_id: str, share: float = DOMINANT_SHARE) -> List[str]:
+        """
+        Muscles an exercise loads most.
+
+        Args:
+            exercise_id (str): Exercise.
+            share (float): Minimum usage relative to the exercise's highest usage.
+
+        Returns:
+            List[str]: Dominant muscles (empty for unknown exercises).
+        """
+        row = self.catalog.row_index.get(exercise_id)
+        if row is None:
+            return []
+        usage = self.catalog.matrix[row]
+        if not usage.max() > 0:
+            return []
+        return [self.catalog.muscles[i] for i in np.flatnonzero(usage >= share * usage.max())]
+
+    def query(
+        self,
+        exercise_id: str,
+        k: int = 5,
+        avoid_muscles: Iterable[str] = (),
+        equipment: Optional[Iterable[str]] = None,
+        categories: Optional[Iterable[str]] = None,
+        tolerance: float = DEFAULT_TOLERANCE,
+        listed_only: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Find the exercises with the most similar muscle profile.
+
+        Args:
+            exercise_id (str): Exercise to replace.
+            k (int): Maximum number of results.
+            avoid_muscles (Iterable[str]): Contraindicated muscles; results use each
+                of them at most ``tolerance`` %.
+            equipment (Optional[Iterable[str]]): Allowed equipment (None = any).
+            categories (Optional[Iterable[str]]): Allowed categories (None = any).
+            tolerance (float): Maximum usage (in %) of an avoided muscle.
+            listed_only (bool): Only return exercises listed in ``constants.EXERCISES``.
+
+        Returns:
+            List[Dict[str, Any]]: Results (``id``, ``title``, ``similarity``), most similar first.
+        """
+        row = self.catalog.row_index.get(exercise_id)
+        if row is None:
+            return []
+
+        profiles = self.catalog.profiles
+        similarity = profiles @ profiles[row]
+
+        mask = self.candidate_mask(avoid_muscles, equipment, categories, tolerance, listed_only)
+        mask[row] = False
+
+        candidates = np.flatnonzero(mask)
+        if not len(candidates) or k <= 0:
+            return []
+        scores = similarity[candidates]
+        if len(candidates) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(len(candidates))
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        results = []
+        for i in top:
+            ex_id = self.catalog.exercise_ids[candidates[i]]
+            title = _METADATA.get(ex_id, {}).get("title", ex_id)
+            results.append({"id": ex_id, "title": title, "similarity": float(scores[i])})
+        return results
+
+
+_index: Optional[SubstitutionIndex] = None
+_lock = threading.Lock()
+
+
+def _rebuild(catalog: Catalog) -> None:
+    global _index
+    _index = SubstitutionIndex(catalog)
+
+
+on_catalog_change(_rebuild)
+
+
+def substitution_index() -> SubstitutionIndex:
+    """
+    Return the index of the current catalog (rebuilt only when the catalog changes).
+
+    Returns:
+        SubstitutionIndex: The index.
+    """
+    catalog = current_catalog()
+    index = _index
+    if index is None or index.catalog is not catalog:
+        with _lock:
+            if _index is None or _index.catalog is not catalog:
+                _rebuild(catalog)
+            index = _index
+    return index
+
+
+def find_substitutes(exercise_id: str, k: int = 5, **filters: Any) -> List[Dict[str, Any]]:
+    """
+    Find alternatives for an exercise (see ``SubstitutionIndex.query`` for the filters).
+
+    Args:
+        exercise_id (str): Exercise to replace.
+        k (int): Maximum number of results.
+        **filters (Any): ``avoid_muscles``, ``equipment``, ``categories``, ``tolerance``, ``listed_only``.
+
+    Returns:
+        List[Dict[str, Any]]: Results, most similar first.
+    """
+    return substitution_index().query(exercise_id, k, **filters)
+
+
+def find_sparing_substitutes(exercise_id: str, k: int = 5, **filters: Any) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """
+    Find alternatives that spare the dominant muscles of an exercise.
+
+    Used for exercises rated as risky: the most similar exercises mostly
+    load the same muscles, so these are avoided (see ``dominant_muscles``)
+    and only exercises with some profile overlap are returned.
+
+    Args:
+        exercise_id (str): Exercise to replace.
+        k (int): Maximum number of results.
+        **filters (Any): ``equipment``, ``categories``, ``tolerance``, ``listed_only``.
+
+    Returns:
+        Tuple[List[str], List[Dict[str, Any]]]: Spared muscles and results, most similar first.
+    """
+    index = substitution_index()
+    spared = index.dominant_muscles(exercise_id)
+    results = index.query(exercise_id, k, avoid_muscles=spared, **filters)
+    return spared, [result for result in results if result["similarity"] > 0]
@@ -0,0 +1,74 @@
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from catalog import Catalog, current_catalog
+from classification import ColorScale, color_scale
+from constants import MUSCLE_SVG_MAPPING
+from load_model import VolumeWeighting, history_model, intensity_weighted_reps
+from tracing import traced
+
+# Selectable timeline lengths in days
+TIMELINE_RANGES: Dict[str, int] = {"30": 30, "90": 90, "365": 365}
+TIMELINE_DAYS = 90
+
+
+@traced("timeline.heatmap_frames")
+def heatmap_frames(
+    training_log: Optional[Dict[str, List[Dict[str, Any]]]],
+    end: Optional[date] = None,
+    days: int = TIMELINE_DAYS,
+    weighting: VolumeWeighting = intensity_weighted_reps,
+    catalog: Optional[Catalog] = None,
+    scale: Optional[ColorScale] = None,
+) -> Dict[str, Any]:
+    """
+    Precompute the muscle map colors of every day of a time range.
+
+    The effective loads of all days come from the cached history model and
+    are classified in one pass (days × mapped muscles) with the color scale
+    of the muscle map. The classes are shipped as a single string, so the
+    browser can recolor the map for any day without a server round trip.
+    Past days are shown without the readiness factor, which is only known
+    for today.
+
+    Args:
+        training_log (Optional[Dict[str, List[Dict[str, Any]]]]): Logged sessions per ISO date.
+        end (Optional[date]): Last day of the range (defaults to today).
+        days (int): Number of days.
+        weighting (VolumeWeighting): Volume weighting formula for logged sets.
+        catalog (Optional[Catalog]): Exercise catalog (defaults to the current one).
+        scale (Optional[ColorScale]): Color scale (defaults to the configured one).
+
+    Returns:
+        Dict[str, Any]: ``start`` (ISO date of the first day), ``days``,
+        ``paths`` (SVG path IDs per mapped muscle), ``colors`` and ``classes``
+        (row-major string with one character ``"0" + class`` per cell, one row of
+        mapped muscles per day).
+    """
+    end = end or date.today()
+    catalog = catalog or current_catalog()
+    scale = scale or color_scale()
+    start = end - timedelta(days=days - 1)
+
+    columns = {muscle: i for i, muscle in enumerate(catalog.muscles)}
+    muscles = [muscle for muscle in MUSCLE_SVG_MAPPING if muscle in columns]
+
+    # Days before the first logged session have no load and stay uncolored
+    history = history_model(training_log or {}, end + timedelta(days=1), weighting, catalog)
+    loads = np.zeros((days, len(muscles)))
+    offset = (history.start - start).days
+    first = max(offset, 0)
+    rows = history.effective_loads()[first - offset:, [columns[muscle] for muscle in muscles]]
+    loads[first:] = rows
+
+    # One character per cell: "0" + class
+    classes = scale.classify(loads) + ord("0")
+    return {
+        "start": start.isoformat(),
+        "days": days,
+        "paths": [MUSCLE_SVG_MAPPING[muscle]["paths"] for muscle in muscles],
+        "colors": scale.colors,
+        "classes": classes.tobytes().decode("ascii"),
+    }
@@ -0,0 +1,278 @@
+import functools
+import html
+import itertools
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+import dash
+import flask
+
+from metrics import wrap_callbacks
+
+# Fraction of callback executions that are traced (0, the default, disables tracing)
+TRACE_SAMPLE_RATE = float(os.environ.get("BAYHEALTH_TRACE_SAMPLE_RATE", "0"))
+# Set BAYHEALTH_TRACE_VIEWER=1 to serve the collected traces on /_traces (they contain
+# exercise names, session field names and timings; do not enable it on public instances)
+TRACE_VIEWER_ENABLED = os.environ.get("BAYHEALTH_TRACE_VIEWER", "0") == "1"
+# Optional JSON-lines export of finished spans (in addition to the in-memory ring buffer)
+TRACE_FILE = os.environ.get("BAYHEALTH_TRACE_FILE", "")
+TRACE_BUFFER_SIZE = int(os.environ.get("BAYHEALTH_TRACE_BUFFER_SIZE", "2000"))
+
+
+class Span:
+    """
+    A timed operation within a trace.
+
+    Attributes:
+        name (str): Operation name, e.g. ``mistral.chat``.
+        trace_id (str): ID shared by all spans of one callback execution.
+        span_id (int): ID of this span.
+        parent_id (Optional[int]): ID of the enclosing span.
+        attributes (Dict[str, Any]): Additional JSON-serializable values.
+    """
+
+    _ids = itertools.count(1)
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[int], attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = next(self._ids)
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.start = time.time()
+        self._start = time.perf_counter()
+        self.duration_ms = 0.0
+        self.error: Optional[str] = None
+
+    def set(self, **attributes: Any) -> None:
+        """Add attributes to the span."""
+        self.attributes.update(attributes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": self.start,
+            "duration_ms": self.duration_ms,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+class _Unsampled:
+    """Stand-in for spans of traces that were not sampled."""
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+
+_UNSAMPLED = _Unsampled()
+_current_span: ContextVar[Any] = ContextVar("bayhealth_current_span", default=None)
+
+
+class SpanExporter:
+    """In-memory ring buffer of finished spans with optional JSON-lines file export."""
+
+    def __init__(self, path: str = TRACE_FILE, capacity: int = TRACE_BUFFER_SIZE):
+        self.path = path
+        self.spans: Deque[Dict[str, Any]] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        record = span.to_dict()
+        with self._lock:
+            self.spans.append(record)
+            if self.path:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(record, default=str) + "\n")
+
+    def traces(self, limit: int = 50) -> List[List[Dict[str, Any]]]:
+        """
+        Group the buffered spans by trace, newest trace first.
+
+        Args:
+            limit (int): Maximum number of traces.
+
+        Returns:
+            List[List[Dict[str, Any]]]: Spans of each trace, ordered by start time.
+        """
+        with self._lock:
+            spans = list(self.spans)
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for record in reversed(spans):
+            if record["trace_id"] not in grouped and len(grouped) >= limit:
+                continue
+            grouped.setdefault(record["trace_id"], []).append(record)
+        return [sorted(trace, key=lambda record: record["start"]) for trace in grouped.values()]
+
+
+exporter = SpanExporter()
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Any]:
+    """
+    Trace the enclosed block as a child of the current span.
+
+    A span without an enclosing span starts a new trace, which is sampled
+    with ``TRACE_SAMPLE_RATE``; all spans of an unsampled trace are no-ops.
+    The current span is propagated via ``contextvars``.
+
+    Args:
+        name (str): Operation name.
+        **attributes (Any): Initial span attributes.
+
+    Yields:
+        Span: The span (call ``.set(...)`` to add attributes).
+    """
+    parent = _current_span.get()
+    if parent is _UNSAMPLED or (parent is None and random.random() >= TRACE_SAMPLE_RATE):
+        token = _current_span.set(_UNSAMPLED)
+        try:
+            yield _UNSAMPLED
+        finally:
+            _current_span.reset(token)
+        return
+
+    current = Span(
+        name,
+        trace_id=parent.trace_id if parent else uuid.uuid4().hex[:16],
+        parent_id=parent.span_id if parent else None,
+        attributes=attributes,
+    )
+    token = _current_span.set(current)
+    try:
+        yield current
+    except dash.exceptions.PreventUpdate:
+        current.set(prevented=True)
+        raise
+    except Exception as e:
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        current.duration_ms = round((time.perf_counter() - current._start) * 1000, 3)
+        _current_span.reset(token)
+        exporter.export(current)
+
+
+@contextmanager
+def child_span(name: str, **attributes: Any) -> Iterator[Any]:
+    """
+    Like ``span``, but only traced within a sampled trace; never starts a new trace.
+
+    Used for library code that also runs outside of callbacks (e.g. in the
+    batch report job), where every call would otherwise become a root trace.
+
+    Args:
+        name (str): Operation name.
+        **attributes (Any): Initial span attributes.
+
+    Yields:
+        Span: The span, or a no-op stand-in without a sampled parent span.
+    """
+    if not isinstance(_current_span.get(), Span):
+        token = _current_span.set(_UNSAMPLED)
+        try:
+            yield _UNSAMPLED
+        finally:
+            _current_span.reset(token)
+        return
+    with span(name, **attributes) as current:
+        yield current
+
+
+def traced(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorator tracing every call of a function as a child span of the current trace.
+
+    Calls outside a sampled trace are not traced (see ``child_span``).
+
+    Args:
+        name (str): Operation name.
+
+    Returns:
+        Callable: Decorator.
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not isinstance(_current_span.get(), Span):
+                return func(*args, **kwargs)
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _render_viewer(traces: List[List[Dict[str, Any]]]) -> str:
+    """Render traces as a minimal HTML waterfall view."""
+    rows = []
+    for trace in traces:
+        root_start = trace[0]["start"]
+        total = max(record["start"] - root_start + record["duration_ms"] / 1000 for record in trace) or 1e-9
+        depth: Dict[int, int] = {}
+        for record in trace:
+            depth[record["span_id"]] = depth.get(record["parent_id"], -1) + 1
+            offset = (record["start"] - root_start) / total * 100
+            width = max(record["duration_ms"] / 1000 / total * 100, 0.5)
+            color = "#dc3545" if record["error"] else "#459b70"
+            attributes = html.escape(json.dumps(record["attributes"], default=str))
+            rows.append(
+                f"<tr><td style='padding-left:{depth[record['span_id']] * 16 + 4}px'>{html.escape(record['name'])}</td>"
+                f"<td>{record['duration_ms']:.2f} ms</td>"
+                f"<td style='width:50%'><div style='margin-left:{offset:.1f}%;width:{width:.1f}%;"
+                f"height:12px;background:{color}'></div></td>"
+                f"<td><small>{attributes} {html.escape(record['error'] or '')}</small></td></tr>"
+            )
+        rows.append("<tr><td colspan='4'><hr></td></tr>")
+    return (
+        "<html><head><title>Traces</title></head><body style='font-family:sans-serif;font-size:13px'>"
+        f"<h3>Traces (sample rate {TRACE_SAMPLE_RATE})</h3>"
+        f"<table style='width:100%;border-collapse:collapse'>{''.join(rows)}</table></body></html>"
+    )
+
+
+def install_tracing(app: dash.Dash) -> None:
+    """
+    Trace every callback execution as a root span and expose the traces.
+
+    Routes (only with ``BAYHEALTH_TRACE_VIEWER=1``):
+        - ``GET /_traces``: waterfall view of the latest traces.
+        - ``GET /_traces.json``: the latest traces as JSON.
+
+    Nothing is installed if ``TRACE_SAMPLE_RATE`` is 0.
+
+    Args:
+        app (dash.Dash): Dash application.
+    """
+    if TRACE_SAMPLE_RATE <= 0:
+        return
+
+    def instrument(func: Callable[..., Any], name: str) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(f"callback.{name}"):
+                return func(*args, **kwargs)
+        return wrapper
+
+    wrap_callbacks(app, instrument)
+    if not TRACE_VIEWER_ENABLED:
+        return
+
+    @app.server.route("/_traces")
+    def trace_viewer() -> str:
+        return _render_viewer(exporter.traces(int(flask.request.args.get("limit", 50))))
+
+    @app.server.route("/_traces.json")
+    def trace_export() -> flask.Response:
+        return flask.jsonify(exporter.traces(int(flask.request.args.get("limit", 50))))
@@ -124,6 +124,9 @@ def create_star_rating(question_id: str, question_text: str) -> html.Div:
     """
     Create a star rating component (1–5 stars).
 
+    The fill state of the stars and the resulting ratings are handled
+    clientside (see ``assets/star_rating.js``).
+
     Args:
         question_id (str): Unique question identifier.
         question_text (str): Text for the question; if it contains a newline,
@@ -153,7 +156,10 @@ def create_star_rating(question_id: str, question_text: str) -> html.Div:
             html.Div(
                 [
                     dbc.Button(
-                        html.I(className="bi bi-star"),  # Empty star icon
+                        html.I(
+                            className="bi bi-star",  # Empty star icon
+                            id={"type": "star-icon", "question": question_id, "index": i},
+                        ),
                         id={"type": "star", "question": question_id, "index": i},
                         color="link",
                         className="p-0 m-0 fs-4",
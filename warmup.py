@@ -0,0 +1,187 @@
+import logging
+import os
+import threading
+import time
+import xml.etree.ElementTree as ET
+from typing import Any, Callable, Dict, Optional
+
+import dash
+import flask
+import numpy as np
+
+from catalog import current_catalog
+from constants import EXERCISES
+from load_model import compute_muscle_loads
+from readiness import readiness_factor
+
+logger = logging.getLogger(__name__)
+
+# "1": warm up before the app is returned, "background": warm up in a thread
+# while /readyz reports 503, "0": skip the warm-up
+WARMUP_MODE = os.environ.get("BAYHEALTH_WARMUP", "1")
+# Set by gunicorn.conf.py: with ``preload_app`` the app is built in the master, but
+# threads do not survive the fork, so a background warm-up is started in every
+# worker instead (``start_worker_warm_up`` from ``post_fork``)
+WARMUP_PER_WORKER = os.environ.get("BAYHEALTH_WARMUP_PER_WORKER", "0") == "1"
+# Pre-open a connection to the LLM API in every worker process
+WARMUP_LLM = os.environ.get("BAYHEALTH_WARMUP_LLM", "0") == "1"
+SVG_TEMPLATE = "assets/muscle_sections.svg"
+
+
+class WarmupState:
+    """
+    Readiness of the current process.
+
+    Attributes:
+        ready (bool): True once the warm-up has finished.
+        steps (Dict[str, float]): Duration of each warm-up step in ms.
+        errors (Dict[str, str]): Steps that failed (they do not block readiness).
+    """
+
+    def __init__(self):
+        self.ready = False
+        self.steps: Dict[str, float] = {}
+        self.errors: Dict[str, str] = {}
+
+    def run_step(self, name: str, step: Callable[[], Any]) -> None:
+        """Run one warm-up step, recording its duration or error."""
+        start = time.perf_counter()
+        try:
+            step()
+        except Exception as e:
+            logger.warning("Warm-up step %s failed: %s", name, e)
+            self.errors[name] = f"{type(e).__name__}: {e}"
+        self.steps[name] = round((time.perf_counter() - start) * 1000, 2)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"ready": self.ready, "steps": self.steps, "errors": self.errors}
+
+
+warmup_state = WarmupState()
+# Background warm-up waiting for the worker processes (see WARMUP_PER_WORKER)
+_pending_warm_up: Optional[Callable[[], None]] = None
+_worker_process = False
+
+
+def _touch_catalog() -> None:
+    """Attach the shared catalog and fault in its pages."""
+    for array in current_catalog().arrays.values():
+        float(np.sum(array))
+
+
+def _touch_score_engine() -> None:
+    """Run the load model and readiness factor once (imports, NumPy/pandas code paths)."""
+    factor = readiness_factor(None, {})
+    exercise_ids = [exercise["id"] for exercise in EXERCISES[:3]]
+    compute_muscle_loads({}, exercise_ids, factor=factor)
+
+
+def _touch_svg_template() -> None:
+    """Parse the SVG template once (ElementTree import, file in the page cache)."""
+    ET.parse(SVG_TEMPLATE)
+
+
+def _touch_dash(app: dash.Dash) -> None:
+    """
+    Send the first requests through Dash.
+
+    The first request runs Dash's server setup (callback map, page routing
+    callback) and the callback instrumentation hooks; the layout requests
+    serialize (or serve from the layout cache) the app shell and page list.
+    """
+    client = app.server.test_client()
+    for path in ("/", "/_dash-layout", "/_dash-dependencies"):
+        client.get(path)
+
+
+def warm_llm_connection() -> None:
+    """
+    Open a pooled connection to the LLM API in the background.
+
+    Only active with ``BAYHEALTH_WARMUP_LLM=1``. Must run in each worker
+    process (after the fork), because connections cannot be shared between
+    processes. Failures are only logged.
+    """
+    if not WARMUP_LLM:
+        return
+
+    def connect() -> None:
+        from pages.exercises.exercises import get_client
+
+        try:
+            get_client().models.list()
+        except Exception as e:
+            logger.warning("LLM connection warm-up failed: %s", e)
+
+    threading.Thread(target=connect, name="llm-warmup", daemon=True).start()
+
+
+def warm_up(app: dash.Dash, serve_requests: bool = True) -> WarmupState:
+    """
+    Pre-touch the lazily initialized parts of the app before it accepts traffic.
+
+    Covers the exercise catalog, the score engine, the SVG template and
+    Dash's first request/layout serialization. With gunicorn's
+    ``preload_app`` this runs once in the master, so every worker starts warm;
+    a background warm-up is deferred to the workers instead.
+
+    Args:
+        app (dash.Dash): Fully configured Dash application.
+        serve_requests (bool): Whether to send the first requests through
+            Dash (not possible if Flask hooks are registered afterwards).
+
+    Returns:
+        WarmupState: The readiness state of this process.
+    """
+    def run() -> None:
+        warmup_state.run_step("catalog", _touch_catalog)
+        warmup_state.run_step("score_engine", _touch_score_engine)
+        warmup_state.run_step("svg_template", _touch_svg_template)
+        if serve_requests:
+            warmup_state.run_step("dash", lambda: _touch_dash(app))
+        logger.info("Warm-up finished: %s", warmup_state.steps)
+        warmup_state.ready = True
+
+    global _pending_warm_up
+    if WARMUP_MODE == "background" and WARMUP_PER_WORKER and not _worker_process:
+        _pending_warm_up = run
+    elif WARMUP_MODE == "background":
+        threading.Thread(target=run, name="warmup", daemon=True).start()
+    elif WARMUP_MODE != "0":
+        run()
+    else:
+        warmup_state.ready = True
+    return warmup_state
+
+
+def start_worker_warm_up() -> None:
+    """
+    Start the deferred background warm-up in a forked worker process.
+
+    Called from gunicorn's ``post_fork`` hook. Without ``preload_app`` the
+    app is only built after this hook, and ``warm_up`` starts the thread
+    itself.
+    """
+    global _worker_process
+    _worker_process = True
+    if _pending_warm_up is not None:
+        threading.Thread(target=_pending_warm_up, name="warmup", daemon=True).start()
+
+
+def install_health_checks(app: dash.Dash) -> None:
+    """
+    Expose liveness and readiness endpoints for the load balancer.
+
+    - ``GET /healthz``: 200 as long as the process serves requests.
+    - ``GET /readyz``: 200 once the warm-up has finished, 503 before.
+
+    Args:
+        app (dash.Dash): Dash application.
+    """
+    @app.server.route("/healthz")
+    def healthz() -> flask.Response:
+        return flask.jsonify(status="ok")
+
+    @app.server.route("/readyz")
+    def readyz() -> flask.Response:
+        return flask.jsonify(warmup_state.to_dict()), 200 if warmup_state.ready else 503
@@ -0,0 +1,8 @@
+# WSGI entry point for production serving, e.g.:
+#   gunicorn -c gunicorn.conf.py wsgi:server
+# The app (catalog, page layouts, layout cache) is built at import time, so
+# with ``preload_app`` it is created once in the master and shared
+# copy-on-write by all workers.
+from app import server
+
+application = server